@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.core.database import Base
-from app.models.models import Paper, GitHubRepo, JobPosting, SkillTrend, DailyInsight
+from app.models.models import Paper, GitHubRepo, PaperSkill, RepoSkill, SkillTrendDaily, JobPosting, SkillTrend, DailyInsight
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
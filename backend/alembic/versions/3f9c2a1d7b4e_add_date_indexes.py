@@ -0,0 +1,28 @@
+"""Add date indexes for recent paper and repo lookups
+
+Revision ID: 3f9c2a1d7b4e
+Revises: 107acb4b027c
+Create Date: 2026-10-14 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a1d7b4e'
+down_revision: Union[str, None] = '107acb4b027c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_papers_published_date'), 'papers', ['published_date'], unique=False)
+    op.create_index(op.f('ix_github_repos_created_at'), 'github_repos', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_github_repos_created_at'), table_name='github_repos')
+    op.drop_index(op.f('ix_papers_published_date'), table_name='papers')
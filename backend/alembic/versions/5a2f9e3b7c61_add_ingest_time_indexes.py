@@ -0,0 +1,28 @@
+"""Add ingest time indexes for daily summary lookups
+
+Revision ID: 5a2f9e3b7c61
+Revises: c4d7e2f1a853
+Create Date: 2026-10-14 16:20:51.804337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a2f9e3b7c61'
+down_revision: Union[str, None] = 'c4d7e2f1a853'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_papers_created_at'), 'papers', ['created_at'], unique=False)
+    op.create_index(op.f('ix_github_repos_added_at'), 'github_repos', ['added_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_github_repos_added_at'), table_name='github_repos')
+    op.drop_index(op.f('ix_papers_created_at'), table_name='papers')
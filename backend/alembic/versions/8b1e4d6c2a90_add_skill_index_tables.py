@@ -0,0 +1,83 @@
+"""Add normalized paper and repo skill tables
+
+Revision ID: 8b1e4d6c2a90
+Revises: 3f9c2a1d7b4e
+Create Date: 2026-10-14 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.skill_index import skill_rows
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e4d6c2a90'
+down_revision: Union[str, None] = '3f9c2a1d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Owners read per round trip while backfilling
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def upgrade() -> None:
+    paper_skills = op.create_table(
+        'paper_skills',
+        sa.Column('paper_id', sa.String(length=50), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('skill', sa.Text(), nullable=False),
+        sa.Column('published_date', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['paper_id'], ['papers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('paper_id', 'category', 'skill')
+    )
+    op.create_index('ix_paper_skills_category_date_skill', 'paper_skills', ['category', 'published_date', 'skill'], unique=False)
+    
+    repo_skills = op.create_table(
+        'repo_skills',
+        sa.Column('repo_id', sa.String(length=50), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('skill', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['repo_id'], ['github_repos.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('repo_id', 'category', 'skill')
+    )
+    op.create_index('ix_repo_skills_category_date_skill', 'repo_skills', ['category', 'created_at', 'skill'], unique=False)
+    
+    # Backfill from the existing JSON skill columns
+    bind = op.get_bind()
+    papers = sa.table(
+        'papers',
+        sa.column('id'), sa.column('published_date', sa.DateTime),
+        sa.column('extracted_skills', sa.JSON), sa.column('detailed_skills', sa.JSON)
+    )
+    repos = sa.table(
+        'github_repos',
+        sa.column('id'), sa.column('created_at', sa.DateTime),
+        sa.column('extracted_skills', sa.JSON), sa.column('detailed_skills', sa.JSON)
+    )
+    
+    _backfill(bind, papers, paper_skills, 'paper_id', 'published_date')
+    _backfill(bind, repos, repo_skills, 'repo_id', 'created_at')
+
+
+def _backfill(bind, source, target, owner_key: str, date_key: str) -> None:
+    """Stream owners in chunks and insert their skill rows chunk by chunk"""
+    result = bind.execute(sa.select(source).execution_options(yield_per=BACKFILL_CHUNK_SIZE))
+    for owners in result.partitions():
+        rows = [
+            {**row, owner_key: owner.id, date_key: owner._mapping[date_key]}
+            for owner in owners
+            for row in skill_rows(owner.extracted_skills, owner.detailed_skills)
+        ]
+        if rows:
+            op.bulk_insert(target, rows)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_repo_skills_category_date_skill', table_name='repo_skills')
+    op.drop_table('repo_skills')
+    op.drop_index('ix_paper_skills_category_date_skill', table_name='paper_skills')
+    op.drop_table('paper_skills')
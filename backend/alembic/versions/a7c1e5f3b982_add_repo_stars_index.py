@@ -0,0 +1,26 @@
+"""Add stars index for trending repo lookups
+
+Revision ID: a7c1e5f3b982
+Revises: f2b8d4a6c319
+Create Date: 2026-10-14 20:11:37.290418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e5f3b982'
+down_revision: Union[str, None] = 'f2b8d4a6c319'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_github_repos_stars'), 'github_repos', ['stars'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_github_repos_stars'), table_name='github_repos')
@@ -0,0 +1,65 @@
+"""Use short ArXiv ids instead of md5 hashes as paper keys
+
+Revision ID: b3e6f9a2c714
+Revises: a7c1e5f3b982
+Create Date: 2026-10-14 21:26:49.503816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e6f9a2c714'
+down_revision: Union[str, None] = 'a7c1e5f3b982'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Papers re-keyed per round trip
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    papers = sa.table('papers', sa.column('id'), sa.column('url'), sa.column('source'))
+    paper_skills = sa.table(
+        'paper_skills',
+        sa.column('paper_id'), sa.column('category'), sa.column('skill'),
+        sa.column('published_date', sa.DateTime)
+    )
+    
+    # The short id is the last path segment of the stored PDF url (.../pdf/2403.12345v1)
+    existing = set(bind.execute(sa.select(papers.c.id)).scalars())
+    renames = {}
+    for paper in bind.execute(sa.select(papers.c.id, papers.c.url).where(papers.c.source == 'arxiv')):
+        if not paper.url:
+            continue
+        short_id = paper.url.rstrip('/').rsplit('/', 1)[-1]
+        if short_id and short_id != paper.id and short_id not in existing:
+            renames[paper.id] = short_id
+            existing.add(short_id)
+    
+    pairs = list(renames.items())
+    for start in range(0, len(pairs), BACKFILL_CHUNK_SIZE):
+        chunk = dict(pairs[start:start + BACKFILL_CHUNK_SIZE])
+        
+        # Move skill rows off the old keys so the foreign key holds throughout
+        skill_rows = bind.execute(
+            sa.select(paper_skills).where(paper_skills.c.paper_id.in_(list(chunk)))
+        ).mappings().all()
+        bind.execute(sa.delete(paper_skills).where(paper_skills.c.paper_id.in_(list(chunk))))
+        
+        bind.execute(
+            sa.update(papers).where(papers.c.id == sa.bindparam('old_id')),
+            [{'old_id': old_id, 'id': new_id} for old_id, new_id in chunk.items()]
+        )
+        
+        if skill_rows:
+            op.bulk_insert(paper_skills, [{**row, 'paper_id': chunk[row['paper_id']]} for row in skill_rows])
+
+
+def downgrade() -> None:
+    # md5 keys are derived from the full entry id, which is not stored
+    pass
@@ -0,0 +1,48 @@
+"""Add daily skill trend rollup table
+
+Revision ID: c4d7e2f1a853
+Revises: 8b1e4d6c2a90
+Create Date: 2026-10-14 14:46:09.372215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7e2f1a853'
+down_revision: Union[str, None] = '8b1e4d6c2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'skill_trend_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('source', sa.String(length=20), nullable=False),
+        sa.Column('category', sa.String(length=50), nullable=False),
+        sa.Column('skill', sa.Text(), nullable=False),
+        sa.Column('mentions', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'source', 'category', 'skill')
+    )
+    op.create_index('ix_skill_trend_daily_category_day_skill', 'skill_trend_daily', ['category', 'day', 'skill'], unique=False)
+    
+    # Backfill from the normalized skill tables
+    op.execute(
+        "INSERT INTO skill_trend_daily (day, source, category, skill, mentions) "
+        "SELECT date(published_date), 'papers', category, skill, count(*) FROM paper_skills "
+        "GROUP BY date(published_date), category, skill"
+    )
+    op.execute(
+        "INSERT INTO skill_trend_daily (day, source, category, skill, mentions) "
+        "SELECT date(created_at), 'github', category, skill, count(*) FROM repo_skills "
+        "GROUP BY date(created_at), category, skill"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_skill_trend_daily_category_day_skill', table_name='skill_trend_daily')
+    op.drop_table('skill_trend_daily')
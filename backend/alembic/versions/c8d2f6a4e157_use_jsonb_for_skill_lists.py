@@ -0,0 +1,55 @@
+"""Store skill lists as JSONB with GIN indexes on PostgreSQL
+
+Revision ID: c8d2f6a4e157
+Revises: d5f8a1c3e926
+Create Date: 2026-10-14 22:41:17.309846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2f6a4e157'
+down_revision: Union[str, None] = 'd5f8a1c3e926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, GIN index name)
+JSONB_COLUMNS = (
+    ('papers', 'extracted_skills', 'ix_papers_extracted_skills_gin'),
+    ('github_repos', 'topics', 'ix_github_repos_topics_gin'),
+)
+
+
+def upgrade() -> None:
+    # JSONB and GIN only exist on PostgreSQL; SQLite keeps plain JSON
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table_name, column, index_name in JSONB_COLUMNS:
+        op.alter_column(
+            table_name, column,
+            type_=postgresql.JSONB(), existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb'
+        )
+        op.create_index(
+            index_name, table_name, [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'jsonb_path_ops'}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    
+    for table_name, column, index_name in JSONB_COLUMNS:
+        op.drop_index(index_name, table_name=table_name)
+        op.alter_column(
+            table_name, column,
+            type_=sa.JSON(), existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::json'
+        )
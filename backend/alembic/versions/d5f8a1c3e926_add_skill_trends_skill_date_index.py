@@ -0,0 +1,28 @@
+"""Replace the skill_trends skill index with a (skill, date) index
+
+Revision ID: d5f8a1c3e926
+Revises: b3e6f9a2c714
+Create Date: 2026-10-14 22:03:55.184237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5f8a1c3e926'
+down_revision: Union[str, None] = 'b3e6f9a2c714'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_skill_trends_skill_date', 'skill_trends', ['skill', 'date'], unique=False)
+    op.drop_index(op.f('ix_skill_trends_skill'), table_name='skill_trends')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_skill_trends_skill'), 'skill_trends', ['skill'], unique=False)
+    op.drop_index('ix_skill_trends_skill_date', table_name='skill_trends')
@@ -0,0 +1,29 @@
+"""Drop the unused job_postings source index
+
+Revision ID: e4a9b7d2c605
+Revises: c8d2f6a4e157
+Create Date: 2026-10-14 23:08:42.561093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9b7d2c605'
+down_revision: Union[str, None] = 'c8d2f6a4e157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only present on databases whose table was created from the model
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('job_postings')}
+    if op.f('ix_job_postings_source') in indexes:
+        op.drop_index(op.f('ix_job_postings_source'), table_name='job_postings')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_job_postings_source'), 'job_postings', ['source'], unique=False)
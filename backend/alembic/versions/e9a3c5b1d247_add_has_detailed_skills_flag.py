@@ -0,0 +1,56 @@
+"""Add has_detailed_skills flag to papers and repos
+
+Revision ID: e9a3c5b1d247
+Revises: 5a2f9e3b7c61
+Create Date: 2026-10-14 18:05:13.472960
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.skill_index import has_detailed_skills
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3c5b1d247'
+down_revision: Union[str, None] = '5a2f9e3b7c61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows read per round trip while backfilling
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def upgrade() -> None:
+    for table_name in ('papers', 'github_repos'):
+        op.add_column(
+            table_name,
+            sa.Column('has_detailed_skills', sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+        op.create_index(op.f(f'ix_{table_name}_has_detailed_skills'), table_name, ['has_detailed_skills'], unique=False)
+        
+        # Backfill from the existing JSON column
+        table = sa.table(
+            table_name,
+            sa.column('id'), sa.column('detailed_skills', sa.JSON), sa.column('has_detailed_skills', sa.Boolean)
+        )
+        _backfill(op.get_bind(), table)
+
+
+def _backfill(bind, table) -> None:
+    """Stream rows in chunks and flag those with detailed skills"""
+    result = bind.execute(
+        sa.select(table.c.id, table.c.detailed_skills).execution_options(yield_per=BACKFILL_CHUNK_SIZE)
+    )
+    for rows in result.partitions():
+        ids = [row.id for row in rows if has_detailed_skills(row.detailed_skills)]
+        if ids:
+            bind.execute(sa.update(table).where(table.c.id.in_(ids)).values(has_detailed_skills=True))
+
+
+def downgrade() -> None:
+    for table_name in ('github_repos', 'papers'):
+        op.drop_index(op.f(f'ix_{table_name}_has_detailed_skills'), table_name=table_name)
+        op.drop_column(table_name, 'has_detailed_skills')
@@ -0,0 +1,137 @@
+"""Normalize stored paper skill names
+
+Revision ID: f2b8d4a6c319
+Revises: e9a3c5b1d247
+Create Date: 2026-10-14 19:42:08.615327
+
+"""
+import re
+from typing import Any, Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4a6c319'
+down_revision: Union[str, None] = 'e9a3c5b1d247'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Papers read per round trip while backfilling
+BACKFILL_CHUNK_SIZE = 1000
+
+# The normalization below is frozen as of this revision rather than imported
+# from app code, so replaying it gives the same result after the app changes
+
+# Skill name variations (lowercase) mapped to canonical names
+SKILL_STANDARDIZATION = {
+    "natural language processing": "NLP",
+    "natural language processing (nlp)": "NLP",
+    "nlp": "NLP",
+    "large language models": "Large Language Models",
+    "large language models (llms)": "Large Language Models",
+    "llms": "Large Language Models",
+    "computer vision": "Computer Vision",
+    "cv": "Computer Vision",
+    "reinforcement learning": "Reinforcement Learning",
+    "rl": "Reinforcement Learning",
+    "machine learning": "Machine Learning",
+    "ml": "Machine Learning",
+    "deep learning": "Deep Learning",
+    "dl": "Deep Learning",
+    "transformer architecture": "Transformer Architecture",
+    "transformers": "Transformer Architecture",
+}
+
+# Generic suffixes removed from skill names that have no direct match
+SKILL_SUFFIX_RE = re.compile(
+    r" (?:" + "|".join(re.escape(suffix) for suffix in ("models", "(nlp)", "(llms)", "(cv)", "(rl)", "(ml)")) + r")$",
+    re.IGNORECASE
+)
+
+# Category used for keyword-matched extracted_skills
+BASIC_CATEGORY = "basic"
+
+
+def normalize_skill_name(skill: str) -> str:
+    """Canonical form of a skill name"""
+    skill = skill.strip()
+    if skill.lower() in SKILL_STANDARDIZATION:
+        return SKILL_STANDARDIZATION[skill.lower()]
+    
+    match = SKILL_SUFFIX_RE.search(skill)
+    if match:
+        return skill[:match.start()].strip()
+    return skill.title()
+
+
+def normalize_skill_list(skills: List[Any]) -> List[str]:
+    """Normalized names in their original order, dropping blanks and merged duplicates"""
+    normalized = (normalize_skill_name(str(skill)) for skill in skills if skill)
+    return list(dict.fromkeys(skill for skill in normalized if skill))
+
+
+def skill_rows(extracted_skills: List[str], detailed_skills: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Unique (category, skill) index rows for a paper's basic and detailed skills"""
+    pairs = {(BASIC_CATEGORY, skill) for skill in extracted_skills or [] if skill}
+    for category, values in (detailed_skills or {}).items():
+        if isinstance(values, list):
+            pairs.update((category, str(value).strip()) for value in values if value and str(value).strip())
+    return [{"category": category, "skill": skill} for category, skill in pairs]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    papers = sa.table(
+        'papers',
+        sa.column('id'), sa.column('published_date', sa.DateTime),
+        sa.column('extracted_skills', sa.JSON), sa.column('detailed_skills', sa.JSON)
+    )
+    paper_skills = sa.table(
+        'paper_skills',
+        sa.column('paper_id'), sa.column('category'), sa.column('skill'),
+        sa.column('published_date', sa.DateTime)
+    )
+    
+    # Rewrite detailed_skills and the skill index for papers whose names change
+    result = bind.execute(sa.select(papers).execution_options(yield_per=BACKFILL_CHUNK_SIZE))
+    for chunk in result.partitions():
+        changed = []
+        for paper in chunk:
+            detailed = paper.detailed_skills or {}
+            normalized = {
+                key: normalize_skill_list(values) if isinstance(values, list) else values
+                for key, values in detailed.items()
+            }
+            if normalized != detailed:
+                changed.append((paper, normalized))
+        
+        if not changed:
+            continue
+        
+        bind.execute(
+            sa.update(papers).where(papers.c.id == sa.bindparam('paper_id')),
+            [{'paper_id': paper.id, 'detailed_skills': normalized} for paper, normalized in changed]
+        )
+        bind.execute(sa.delete(paper_skills).where(paper_skills.c.paper_id.in_([paper.id for paper, _ in changed])))
+        rows = [
+            {**row, 'paper_id': paper.id, 'published_date': paper.published_date}
+            for paper, normalized in changed
+            for row in skill_rows(paper.extracted_skills, normalized)
+        ]
+        if rows:
+            op.bulk_insert(paper_skills, rows)
+    
+    # Rebuild the paper rollup from the rewritten index
+    op.execute("DELETE FROM skill_trend_daily WHERE source = 'papers'")
+    op.execute(
+        "INSERT INTO skill_trend_daily (day, source, category, skill, mentions) "
+        "SELECT date(published_date), 'papers', category, skill, count(*) FROM paper_skills "
+        "GROUP BY date(published_date), category, skill"
+    )
+
+
+def downgrade() -> None:
+    # Original spellings are not kept, so normalization cannot be undone
+    pass
@@ -2,31 +2,105 @@
 Data collection endpoints with LLM-powered skill extraction
 """
 
-from fastapi import APIRouter, BackgroundTasks, Query, Depends
-from sqlalchemy.orm import Session
-from typing import Optional
-from datetime import datetime
-import hashlib
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, Request
+from sqlalchemy import select, update, func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import asyncio
+import uuid
 
-from app.core.database import get_db
+from app.core.database import get_async_db, AsyncSessionLocal, bulk_copy, bulk_insert, supports_copy, COPY_THRESHOLD
 from app.core.logging import log
 from app.models.models import Paper, GitHubRepo
 from app.scrapers.arxiv_scraper import ArxivScraper
-from app.scrapers.github_scraper import GitHubScraper
-from app.scrapers.reddit_scraper import RedditScraper
+from app.services.skill_extractor import SkillExtractor
+from app.services.skill_index import as_datetime, has_detailed_skills, replace_paper_skills, replace_repo_skills
+from app.services.skill_trends import refresh_skill_trends
 
 router = APIRouter()
 
+# In-memory registry of background collection jobs (most recent last)
+collection_jobs: Dict[str, Dict[str, Any]] = {}
+MAX_TRACKED_JOBS = 100
+
+# ArXiv streaming pipeline: queue depth between scraper and writer, and papers per write
+STREAM_QUEUE_SIZE = 32
+STREAM_BATCH_SIZE = 16
+
+
+def _create_job(source: str) -> Dict[str, Any]:
+    """
+    Register a new queued collection job
+    
+    Args:
+        source: Data source the job collects from
+    
+    Returns:
+        The job record
+    """
+    job_id = uuid.uuid4().hex
+    job = {
+        "job_id": job_id,
+        "source": source,
+        "status": "queued",
+        "created_at": datetime.now(timezone.utc),
+        "finished_at": None,
+        "result": None
+    }
+    collection_jobs[job_id] = job
+    
+    # Forget the oldest jobs once the registry is full
+    while len(collection_jobs) > MAX_TRACKED_JOBS:
+        collection_jobs.pop(next(iter(collection_jobs)))
+    
+    return job
+
+
+async def _run_with_session(collector, *args):
+    """
+    Run a collector with its own database session
+    
+    AsyncSession is not safe for concurrent use, so every collector that
+    runs in the background or under asyncio.gather gets a dedicated session.
+    """
+    async with AsyncSessionLocal() as db:
+        return await collector(*args, db=db)
+
+
+async def _run_job(job_id: str, collector, *args):
+    """
+    Execute a queued collection job and record its outcome
+    """
+    job = collection_jobs.get(job_id, {})
+    job["status"] = "running"
+    
+    try:
+        result = await _run_with_session(collector, *args)
+        job["status"] = "completed" if result.get("status") == "success" else "failed"
+        job["result"] = result
+    except Exception as e:
+        log.error(f"Collection job {job_id} failed: {str(e)}")
+        job["status"] = "failed"
+        job["result"] = {"status": "error", "error": str(e)}
+    
+    job["finished_at"] = datetime.now(timezone.utc)
+
 
 @router.post("/arxiv")
 async def collect_arxiv_papers(
+    request: Request,
     background_tasks: BackgroundTasks,
     max_results: int = Query(50, description="Maximum papers to fetch", ge=1, le=100),
-    days_back: int = Query(7, description="Days to look back", ge=1, le=30),
-    db: Session = Depends(get_db)
+    days_back: int = Query(7, description="Days to look back", ge=1, le=30)
 ):
     """
-    Collect papers from ArXiv with LLM-powered detailed skill extraction
+    Queue collection of ArXiv papers with LLM-powered detailed skill extraction
+    
+    Collection runs in the background and the request returns immediately.
+    Poll /collect/jobs/{job_id} for progress and the final result.
     
     Note: LLM extraction respects rate limits (~15 requests/minute).
     For 50 papers, expect ~3-4 minutes processing time.
@@ -35,110 +109,245 @@ async def collect_arxiv_papers(
         max_results: Maximum number of papers to collect (1-100)
         days_back: Number of days to look back (1-30)
     
+    Returns:
+        Job id and status URL for the queued collection
+    """
+    job = _create_job("arxiv")
+    background_tasks.add_task(
+        _run_job, job["job_id"], _collect_arxiv,
+        request.app.state.arxiv_scraper, max_results, days_back
+    )
+    log.info(f"Queued ArXiv collection job {job['job_id']}: max_results={max_results}, days_back={days_back}")
+    
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "status_url": f"/api/v1/collect/jobs/{job['job_id']}",
+        "timestamp": job["created_at"]
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_collection_job(job_id: str):
+    """
+    Get status of a background collection job
+    
+    Args:
+        job_id: Id returned when the job was queued
+    
+    Returns:
+        Job status, plus the collection result once finished
+    """
+    job = collection_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Unknown collection job: {job_id}")
+    return job
+
+
+async def _collect_arxiv(
+    scraper: ArxivScraper,
+    max_results: int,
+    days_back: int,
+    db: AsyncSession
+) -> Dict[str, Any]:
+    """
+    Collect papers from ArXiv and store them
+    
+    Scraping and storage are pipelined: papers are queued as soon as the
+    LLM has processed them and written in small batches, so database
+    writes overlap with extraction instead of waiting for the full scrape.
+    
+    Args:
+        scraper: Shared ArXiv scraper instance
+        max_results: Maximum number of papers to collect
+        days_back: Number of days to look back
+        db: Database session owned by the caller
+    
     Returns:
         Collection status with counts, timing info, and success rate
     """
+    start_time = datetime.now(timezone.utc)
+    timestamp = start_time
+    
     try:
-        start_time = datetime.now()
         log.info(f"ArXiv collection request: max_results={max_results}, days_back={days_back}")
         
-        # Initialize and run scraper
-        scraper = ArxivScraper()
-        result = await scraper.run(max_results=max_results, days_back=days_back)
-        
-        # Check for errors
-        if result.get('error'):
-            log.error(f"Scraper returned error: {result['error']}")
-            return {
-                "status": "error",
-                "error": result['error'],
-                "timestamp": datetime.now().isoformat()
-            }
-        
-        papers_data = result['data']
-        log.info(f"Processing {len(papers_data)} papers for database storage")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        producer = asyncio.create_task(
+            _feed_queue(scraper.stream(max_results=max_results, days_back=days_back), queue)
+        )
         
+        total_fetched = 0
         papers_added = 0
         papers_updated = 0
-        
-        for paper_data in papers_data:
-            paper_id = paper_data['id']
-            
-            # Check if paper already exists
-            existing = db.query(Paper).filter_by(id=paper_id).first()
-            
-            if not existing:
-                # Create new paper
-                paper = Paper(
-                    id=paper_id,
-                    title=paper_data['title'],
-                    abstract=paper_data['abstract'],
-                    authors=paper_data['authors'],
-                    published_date=datetime.fromisoformat(paper_data['published_date']),
-                    source=paper_data['source'],
-                    url=paper_data['url'],
-                    categories=paper_data['categories'],
-                    extracted_skills=paper_data['extracted_skills'],
-                    detailed_skills=paper_data['detailed_skills']
-                )
-                db.add(paper)
-                papers_added += 1
-                log.debug(f"Added new paper: {paper_data['title'][:50]}")
-            else:
-                # Update existing paper with new skills
-                new_basic = set(paper_data['extracted_skills'])
-                existing_basic = set(existing.extracted_skills)
-                combined_basic = list(existing_basic.union(new_basic))
+        successful_extractions = 0
+        
+        try:
+            finished = False
+            while not finished:
+                batch, finished = await _next_batch(queue, STREAM_BATCH_SIZE)
+                if not batch:
+                    continue
                 
-                if len(combined_basic) > len(existing_basic):
-                    existing.extracted_skills = combined_basic
-                    existing.detailed_skills = paper_data['detailed_skills']
-                    papers_updated += 1
-                    log.debug(f"Updated skills for paper: {paper_data['title'][:50]}")
-        
-        db.commit()
-        
-        # Calculate success rate for LLM extraction
-        successful_extractions = sum(
-            1 for p in papers_data 
-            if p.get('detailed_skills') and any(v for v in p['detailed_skills'].values() if v)
-        )
-        success_rate = (successful_extractions / len(papers_data) * 100) if papers_data else 0
+                added, updated = await store_papers(db, batch)
+                papers_added += added
+                papers_updated += updated
+                total_fetched += len(batch)
+                successful_extractions += sum(1 for p in batch if has_detailed_skills(p.get('detailed_skills')))
+                log.info(f"Stored batch of {len(batch)} papers ({total_fetched} so far)")
+            
+            # Surface scraper failures once everything it produced is stored
+            await producer
+        finally:
+            producer.cancel()
         
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        success_rate = (successful_extractions / total_fetched * 100) if total_fetched else 0
+        
+        processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
         
         log.info(f"ArXiv collection complete: {papers_added} added, {papers_updated} updated in {processing_time:.1f}s")
-        log.info(f"LLM extraction success rate: {success_rate:.1f}% ({successful_extractions}/{len(papers_data)})")
+        log.info(f"LLM extraction success rate: {success_rate:.1f}% ({successful_extractions}/{total_fetched})")
         
         return {
             "status": "success",
             "papers_added": papers_added,
             "papers_updated": papers_updated,
-            "total_fetched": len(papers_data),
+            "total_fetched": total_fetched,
             "llm_success_rate": f"{success_rate:.1f}%",
             "successful_extractions": successful_extractions,
             "processing_time_seconds": round(processing_time, 1),
             "message": f"Added {papers_added} new papers, updated {papers_updated} existing papers",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
-        log.error(f"Error collecting ArXiv papers: {str(e)}")
-        import traceback
-        log.error(traceback.format_exc())
+        log.exception(f"Error collecting ArXiv papers: {str(e)}")
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
 
+async def _feed_queue(stream: AsyncIterator[Dict[str, Any]], queue: asyncio.Queue) -> None:
+    """
+    Push items from a scraper stream onto a queue, ending with a None sentinel
+    """
+    try:
+        async for item in stream:
+            await queue.put(item)
+    except Exception:
+        await queue.put(None)
+        raise
+    await queue.put(None)
+
+
+async def _next_batch(queue: asyncio.Queue, size: int) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Take up to `size` items from a queue fed by _feed_queue
+    
+    Returns:
+        The batch, and whether the end-of-stream sentinel was reached
+    """
+    batch = []
+    while len(batch) < size:
+        item = await queue.get()
+        if item is None:
+            return batch, True
+        batch.append(item)
+    return batch, False
+
+
+async def store_papers(db: AsyncSession, papers_data: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    Insert new papers and merge skills into existing ones, then commit
+    
+    Args:
+        db: Database session
+        papers_data: Processed papers from the ArXiv scraper
+    
+    Returns:
+        Number of papers added and updated
+    """
+    # Load skills of already-stored papers in a single query
+    paper_ids = [p['id'] for p in papers_data]
+    existing_papers = {
+        row.id: row.extracted_skills
+        for row in await db.execute(
+            select(Paper.id, Paper.extracted_skills).where(Paper.id.in_(paper_ids))
+        )
+    }
+    
+    new_papers = {}
+    updated_papers = {}
+    
+    for paper_data in papers_data:
+        paper_id = paper_data['id']
+        existing_skills = existing_papers.get(paper_id)
+        
+        if existing_skills is None:
+            # Queue new paper for the bulk insert
+            new_papers[paper_id] = {
+                'id': paper_id,
+                'title': paper_data['title'],
+                'abstract': paper_data['abstract'],
+                'authors': paper_data['authors'],
+                'published_date': as_datetime(paper_data['published_date']),
+                'source': paper_data['source'],
+                'url': paper_data['url'],
+                'categories': paper_data['categories'],
+                'extracted_skills': paper_data['extracted_skills'],
+                'detailed_skills': paper_data['detailed_skills'],
+                'has_detailed_skills': has_detailed_skills(paper_data['detailed_skills'])
+            }
+            log.debug(f"Added new paper: {paper_data['title'][:50]}")
+        else:
+            # Queue an update only when the paper gained new skills
+            new_basic = set(paper_data['extracted_skills'])
+            existing_basic = set(existing_skills)
+            
+            if new_basic - existing_basic:
+                combined = list(existing_basic | new_basic)
+                existing_papers[paper_id] = combined
+                updated_papers[paper_id] = {
+                    'id': paper_id,
+                    'extracted_skills': combined,
+                    'detailed_skills': paper_data['detailed_skills'],
+                    'has_detailed_skills': has_detailed_skills(paper_data['detailed_skills'])
+                }
+                log.debug(f"Updated skills for paper: {paper_data['title'][:50]}")
+    
+    # Insert all new papers in batched INSERTs; the streaming writer's batches
+    # stay well below COPY_THRESHOLD, so COPY is only used for repos
+    if new_papers:
+        await bulk_insert(db, Paper.__table__, list(new_papers.values()))
+    
+    # Write changed papers with a single bulk UPDATE by primary key
+    if updated_papers:
+        await db.execute(update(Paper), list(updated_papers.values()))
+    
+    # Keep the normalized skill index in sync with the rows just written
+    published = {p['id']: p['published_date'] for p in papers_data}
+    reindexed = [
+        *new_papers.values(),
+        *({**row, 'published_date': published[row['id']]} for row in updated_papers.values())
+    ]
+    await replace_paper_skills(db, reindexed)
+    
+    # Rebuild the daily rollup for the days those papers fall on
+    await refresh_skill_trends(db, {as_datetime(p['published_date']).date() for p in reindexed}, source="papers")
+    
+    await db.commit()
+    
+    return len(new_papers), len(updated_papers)
+
+
 @router.post("/github")
 async def collect_github_repos(
+    request: Request,
     query: str = Query("machine learning", description="Search query"),
     stars_min: int = Query(100, description="Minimum stars", ge=10),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Collect trending GitHub repositories with LLM-powered skill extraction
@@ -152,12 +361,14 @@ async def collect_github_repos(
     Returns:
         Collection status with counts and success rate
     """
+    start_time = datetime.now(timezone.utc)
+    timestamp = start_time
+    
     try:
-        start_time = datetime.now()
         log.info(f"GitHub collection request: query='{query}', stars_min={stars_min}")
         
-        # Initialize and run scraper
-        scraper = GitHubScraper()
+        # Run the shared scraper
+        scraper = request.app.state.github_scraper
         result = await scraper.run(query=query, stars_min=stars_min)
         
         # Check for errors
@@ -166,68 +377,103 @@ async def collect_github_repos(
             return {
                 "status": "error",
                 "error": result['error'],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
         
         repos_data = result['data']
         log.info(f"Processing {len(repos_data)} repos for database storage")
         
-        repos_added = 0
-        repos_updated = 0
+        # Load counters and skills of already-stored repos in a single query
+        repo_ids = [r['id'] for r in repos_data]
+        existing_repos = {
+            row.id: row
+            for row in await db.execute(
+                select(
+                    GitHubRepo.id, GitHubRepo.stars, GitHubRepo.forks, GitHubRepo.extracted_skills
+                ).where(GitHubRepo.id.in_(repo_ids))
+            )
+        }
+        
+        new_repos = {}
+        updated_repos = {}
         
         for repo_data in repos_data:
             repo_id = repo_data['id']
-            
-            # Check if repo already exists
-            existing = db.query(GitHubRepo).filter_by(id=repo_id).first()
+            existing = existing_repos.get(repo_id)
             
             if not existing:
-                # Create new repo
-                repo = GitHubRepo(
-                    id=repo_id,
-                    name=repo_data['name'],
-                    full_name=repo_data['full_name'],
-                    description=repo_data['description'],
-                    stars=repo_data['stars'],
-                    forks=repo_data['forks'],
-                    language=repo_data['language'],
-                    topics=repo_data['topics'],
-                    url=repo_data['url'],
-                    created_at=datetime.fromisoformat(repo_data['created_at'].replace('Z', '+00:00')),
-                    updated_at=datetime.fromisoformat(repo_data['updated_at'].replace('Z', '+00:00')),
-                    extracted_skills=repo_data['extracted_skills'],
-                    detailed_skills=repo_data['detailed_skills']
-                )
-                db.add(repo)
-                repos_added += 1
+                # Queue new repo for the bulk insert
+                new_repos[repo_id] = {
+                    'id': repo_id,
+                    'name': repo_data['name'],
+                    'full_name': repo_data['full_name'],
+                    'description': repo_data['description'],
+                    'stars': repo_data['stars'],
+                    'forks': repo_data['forks'],
+                    'language': repo_data['language'],
+                    'topics': repo_data['topics'],
+                    'url': repo_data['url'],
+                    'created_at': as_datetime(repo_data['created_at']),
+                    'updated_at': as_datetime(repo_data['updated_at']),
+                    'extracted_skills': repo_data['extracted_skills'],
+                    'detailed_skills': repo_data['detailed_skills'],
+                    'has_detailed_skills': has_detailed_skills(repo_data['detailed_skills'])
+                }
                 log.debug(f"Added new repo: {repo_data['full_name']}")
             else:
-                # Update stars, forks, and skills
-                existing.stars = repo_data['stars']
-                existing.forks = repo_data['forks']
+                # Update stars, forks, and skills, writing only what changed
+                changes = {}
+                if (existing.stars, existing.forks) != (repo_data['stars'], repo_data['forks']):
+                    changes['stars'] = repo_data['stars']
+                    changes['forks'] = repo_data['forks']
                 
                 new_skills = set(repo_data['extracted_skills'])
                 existing_skills = set(existing.extracted_skills)
-                combined = list(existing_skills.union(new_skills))
                 
-                if len(combined) > len(existing_skills):
-                    existing.extracted_skills = combined
-                    existing.detailed_skills = repo_data['detailed_skills']
+                if new_skills - existing_skills:
+                    changes['extracted_skills'] = list(existing_skills | new_skills)
+                    changes['detailed_skills'] = repo_data['detailed_skills']
+                    changes['has_detailed_skills'] = has_detailed_skills(repo_data['detailed_skills'])
                 
-                repos_updated += 1
-                log.debug(f"Updated repo: {repo_data['full_name']}")
+                if changes:
+                    updated_repos.setdefault(repo_id, {'id': repo_id}).update(changes)
+                    log.debug(f"Updated repo: {repo_data['full_name']}")
+        
+        # Insert all new repos in batched INSERTs, or COPY for large batches
+        if new_repos:
+            new_rows = list(new_repos.values())
+            if len(new_rows) > COPY_THRESHOLD and supports_copy(db):
+                await bulk_copy(db, GitHubRepo.__table__, new_rows)
+            else:
+                await bulk_insert(db, GitHubRepo.__table__, new_rows)
+        repos_added = len(new_repos)
+        
+        # Write changed repos with a bulk UPDATE by primary key
+        if updated_repos:
+            await db.execute(update(GitHubRepo), list(updated_repos.values()))
+        repos_updated = len(updated_repos)
+        
+        # Keep the normalized skill index in sync for new repos and changed skills
+        created = {r['id']: r['created_at'] for r in repos_data}
+        reindexed = [
+            *new_repos.values(),
+            *(
+                {**row, 'created_at': created[row['id']]}
+                for row in updated_repos.values() if 'extracted_skills' in row
+            )
+        ]
+        await replace_repo_skills(db, reindexed)
+        
+        # Rebuild the daily rollup for the days those repos fall on
+        await refresh_skill_trends(db, {as_datetime(r['created_at']).date() for r in reindexed}, source="github")
         
-        db.commit()
+        await db.commit()
         
         # Calculate success rate
-        successful_extractions = sum(
-            1 for r in repos_data 
-            if r.get('detailed_skills') and any(v for v in r['detailed_skills'].values() if v)
-        )
+        successful_extractions = sum(1 for r in repos_data if has_detailed_skills(r.get('detailed_skills')))
         success_rate = (successful_extractions / len(repos_data) * 100) if repos_data else 0
         
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
         
         log.info(f"GitHub collection complete: {repos_added} added, {repos_updated} updated in {processing_time:.1f}s")
         log.info(f"LLM extraction success rate: {success_rate:.1f}% ({successful_extractions}/{len(repos_data)})")
@@ -241,24 +487,23 @@ async def collect_github_repos(
             "successful_extractions": successful_extractions,
             "processing_time_seconds": round(processing_time, 1),
             "message": f"Added {repos_added} new repos, updated {repos_updated} existing repos",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
-        log.error(f"Error collecting GitHub repos: {str(e)}")
-        import traceback
-        log.error(traceback.format_exc())
+        log.exception(f"Error collecting GitHub repos: {str(e)}")
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
 
 @router.post("/reddit")
 async def collect_reddit_posts(
+    request: Request,
     limit: int = Query(50, description="Posts per subreddit", ge=10, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Collect hot posts from ML subreddits with LLM-powered analysis
@@ -272,12 +517,14 @@ async def collect_reddit_posts(
     Returns:
         Analysis of trending skills from Reddit discussions
     """
+    start_time = datetime.now(timezone.utc)
+    timestamp = start_time
+    
     try:
-        start_time = datetime.now()
         log.info(f"Reddit collection request: limit={limit}")
         
-        # Initialize and run scraper
-        scraper = RedditScraper()
+        # Run the shared scraper
+        scraper = request.app.state.reddit_scraper
         result = await scraper.run(limit=limit)
         
         # Check for errors
@@ -286,32 +533,28 @@ async def collect_reddit_posts(
             return {
                 "status": "error",
                 "error": result['error'],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
         
         posts_data = result['data']
         
-        # Extract trending skills from posts
-        all_skills = []
+        # Count skills and successful extractions in a single pass
+        skill_counts = Counter()
+        successful_extractions = 0
         for post in posts_data:
-            all_skills.extend(post['extracted_skills'])
+            skill_counts.update(post['extracted_skills'])
+            if has_detailed_skills(post.get('detailed_skills')):
+                successful_extractions += 1
         
-        from collections import Counter
-        skill_counts = Counter(all_skills)
         trending_skills = [
             {"skill": skill, "mentions": count} 
             for skill, count in skill_counts.most_common(10)
         ]
         
         # Calculate success rate
-        successful_extractions = sum(
-            1 for p in posts_data 
-            if p.get('detailed_skills') and any(v for v in p['detailed_skills'].values() if v)
-        )
         success_rate = (successful_extractions / len(posts_data) * 100) if posts_data else 0
         
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = (datetime.now(timezone.utc) - start_time).total_seconds()
         
         log.info(f"Reddit collection complete: {len(posts_data)} posts analyzed in {processing_time:.1f}s")
         log.info(f"LLM extraction success rate: {success_rate:.1f}% ({successful_extractions}/{len(posts_data)})")
@@ -324,54 +567,51 @@ async def collect_reddit_posts(
             "successful_extractions": successful_extractions,
             "processing_time_seconds": round(processing_time, 1),
             "message": f"Analyzed {len(posts_data)} posts from Reddit",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
-        log.error(f"Error collecting Reddit posts: {str(e)}")
-        import traceback
-        log.error(traceback.format_exc())
+        log.exception(f"Error collecting Reddit posts: {str(e)}")
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
 
 @router.get("/status")
-async def collection_status(db: Session = Depends(get_db)):
+async def collection_status(db: AsyncSession = Depends(get_async_db)):
     """
     Get current collection statistics
     
     Returns:
         Database statistics and collection status
     """
+    # One clock read for both the window and the response; stored dates are naive UTC
+    now = datetime.now(timezone.utc)
+    
     try:
-        total_papers = db.query(Paper).count()
-        total_repos = db.query(GitHubRepo).count()
-        
         # Get recent additions (last 24 hours)
-        from datetime import timedelta
-        yesterday = datetime.now() - timedelta(days=1)
-        
-        recent_papers = db.query(Paper).filter(
-            Paper.published_date >= yesterday
-        ).count()
-        
-        recent_repos = db.query(GitHubRepo).filter(
-            GitHubRepo.created_at >= yesterday
-        ).count()
-        
-        # Calculate papers with detailed skills
-        papers_with_details = db.query(Paper).filter(
-            Paper.detailed_skills != None,
-            Paper.detailed_skills != {}
-        ).count()
-        
-        repos_with_details = db.query(GitHubRepo).filter(
-            GitHubRepo.detailed_skills != None,
-            GitHubRepo.detailed_skills != {}
-        ).count()
+        yesterday = as_datetime(now - timedelta(days=1))
+        
+        # Both tables' counts as single-row subqueries, fetched in one round trip
+        paper_counts = select(
+            func.count().label("total"),
+            func.count().filter(Paper.published_date >= yesterday).label("recent"),
+            func.count().filter(Paper.has_detailed_skills).label("detailed")
+        ).select_from(Paper).subquery()
+        repo_counts = select(
+            func.count().label("total"),
+            func.count().filter(GitHubRepo.created_at >= yesterday).label("recent"),
+            func.count().filter(GitHubRepo.has_detailed_skills).label("detailed")
+        ).select_from(GitHubRepo).subquery()
+        
+        (
+            total_papers, recent_papers, papers_with_details,
+            total_repos, recent_repos, repos_with_details
+        ) = (await db.execute(
+            select(*paper_counts.c, *repo_counts.c).select_from(paper_counts.join(repo_counts, true()))
+        )).one()
         
         return {
             "status": "healthy",
@@ -385,17 +625,26 @@ async def collection_status(db: Session = Depends(get_db)):
                 "papers": f"{(papers_with_details/total_papers*100):.1f}%" if total_papers > 0 else "0%",
                 "repos": f"{(repos_with_details/total_repos*100):.1f}%" if total_repos > 0 else "0%"
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now
         }
         
     except Exception as e:
         log.error(f"Error getting collection status: {str(e)}")
         return {
             "status": "error",
-            "error": str(e)
+            "error": str(e),
+            "timestamp": now
         }
 
 
+@lru_cache(maxsize=1)
+def _get_extractor() -> SkillExtractor:
+    """
+    Shared SkillExtractor for status reporting, built on first use
+    """
+    return SkillExtractor()
+
+
 @router.get("/llm-status")
 async def get_llm_status():
     """
@@ -404,16 +653,16 @@ async def get_llm_status():
     Returns:
         LLM configuration and rate limit information
     """
-    from app.services.skill_extractor import SkillExtractor
+    timestamp = datetime.now(timezone.utc)
     
     try:
-        extractor = SkillExtractor()
+        extractor = _get_extractor()
         
         if not extractor.model:
             return {
                 "status": "unavailable",
                 "message": "LLM extraction is not configured. Add GEMINI_API_KEY to .env",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
         
         return {
@@ -433,7 +682,7 @@ async def get_llm_status():
                 "Schedule larger collections (50+) during off-hours",
                 "Monitor rate limits at ai.dev/usage"
             ],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
     
     except Exception as e:
@@ -441,21 +690,23 @@ async def get_llm_status():
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
 
 @router.post("/run-all")
 async def run_all_scrapers(
-    background_tasks: BackgroundTasks,
-    max_papers: int = Query(20, description="Max papers to collect", ge=5, le=50),
-    db: Session = Depends(get_db)
+    request: Request,
+    max_papers: int = Query(20, description="Max papers to collect", ge=5, le=50)
 ):
     """
     Run all scrapers (ArXiv, GitHub, Reddit)
     
+    Scrapers run concurrently, each with its own database session, so
+    total time is bounded by the slowest source rather than their sum.
+    
     Warning: This will take several minutes due to rate limiting.
-    For max_papers=20, expect ~5-7 minutes total.
+    For max_papers=20, expect ~3-4 minutes total.
     
     Args:
         max_papers: Maximum papers to collect from ArXiv
@@ -463,17 +714,25 @@ async def run_all_scrapers(
     Returns:
         Combined results from all scrapers
     """
+    start_time = datetime.now(timezone.utc)
+    timestamp = start_time
+    
     try:
-        start_time = datetime.now()
         log.info(f"Running all scrapers with max_papers={max_papers}")
         
-        # Run all scrapers sequentially
-        arxiv_result = await collect_arxiv_papers(background_tasks, max_papers, 7, db)
-        github_result = await collect_github_repos("machine learning", 100, db)
-        reddit_result = await collect_reddit_posts(30, db)
+        # Run all scrapers concurrently
+        results = await asyncio.gather(
+            _run_with_session(_collect_arxiv, request.app.state.arxiv_scraper, max_papers, 7),
+            _run_with_session(collect_github_repos, request, "machine learning", 100),
+            _run_with_session(collect_reddit_posts, request, 30),
+            return_exceptions=True
+        )
+        arxiv_result, github_result, reddit_result = [
+            {"status": "error", "error": str(r), "timestamp": timestamp} if isinstance(r, Exception) else r
+            for r in results
+        ]
         
-        end_time = datetime.now()
-        total_time = (end_time - start_time).total_seconds()
+        total_time = (datetime.now(timezone.utc) - start_time).total_seconds()
         
         return {
             "status": "success",
@@ -485,15 +744,13 @@ async def run_all_scrapers(
                 "github": github_result,
                 "reddit": reddit_result
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
     except Exception as e:
-        log.error(f"Error running all scrapers: {str(e)}")
-        import traceback
-        log.error(traceback.format_exc())
+        log.exception(f"Error running all scrapers: {str(e)}")
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
\ No newline at end of file
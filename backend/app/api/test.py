@@ -1,16 +1,26 @@
 """Test endpoints"""
 
 from fastapi import APIRouter
-from datetime import datetime
+from datetime import datetime, timezone
 
 router = APIRouter()
 
+# Static response for the tracked skills list
+TRACKED_SKILLS = [
+    "pytorch", "tensorflow", "keras", "scikit-learn",
+    "langchain", "huggingface", "docker", "kubernetes"
+]
+SKILLS_RESPONSE = {
+    "skills": TRACKED_SKILLS,
+    "count": len(TRACKED_SKILLS)
+}
+
 
 @router.get("/time")
 async def get_time():
     """Get current time"""
     return {
-        "current_time": datetime.now().isoformat(),
+        "current_time": datetime.now(timezone.utc),
         "message": "API is working!"
     }
 
@@ -18,11 +28,4 @@ async def get_time():
 @router.get("/skills")
 async def get_skills_list():
     """Get list of tracked skills"""
-    skills = [
-        "pytorch", "tensorflow", "keras", "scikit-learn",
-        "langchain", "huggingface", "docker", "kubernetes"
-    ]
-    return {
-        "skills": skills,
-        "count": len(skills)
-    }
\ No newline at end of file
+    return SKILLS_RESPONSE
\ No newline at end of file
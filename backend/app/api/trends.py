@@ -3,22 +3,127 @@ Trends analysis endpoints
 """
 
 from fastapi import APIRouter, Query, Depends
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import List, Dict
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.models import Paper, GitHubRepo
-from sqlalchemy import func, desc
-from collections import Counter
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import cached
+from app.core.config import settings
+from app.core.database import get_async_db
+from app.models.models import Paper, GitHubRepo, PaperSkill, RepoSkill, SkillTrendDaily
+from app.services.skill_index import BASIC_CATEGORY
+from sqlalchemy import and_, func, desc, select, true, union_all
 
 router = APIRouter()
 
 
+def _cache_ttl_today() -> int:
+    """
+    Cache TTL that never outlives the current day, for per-day summaries
+    """
+    tomorrow = datetime.combine(datetime.now().date() + timedelta(days=1), time.min)
+    return min(settings.CACHE_TTL_SECONDS, int((tomorrow - datetime.now()).total_seconds()) + 1)
+
+
+async def _skill_counts(db: AsyncSession, category: str, paper_filter, repo_filter, limit: int = None) -> List[tuple]:
+    """
+    Count skill mentions in the normalized skill index
+    
+    Used where the filter is not a publication-day range the rollup covers.
+    
+    Args:
+        db: Database session
+        category: Skill category ('basic' or a detailed_skills key)
+        paper_filter: WHERE clause on paper skills
+        repo_filter: WHERE clause on repo skills
+        limit: Maximum number of skills to return
+    
+    Returns:
+        (skill, mentions) rows, most mentioned first
+    """
+    paper_q = select(PaperSkill.skill.label("skill"), func.count().label("mentions")).where(
+        PaperSkill.category == category, paper_filter
+    ).group_by(PaperSkill.skill)
+    repo_q = select(RepoSkill.skill.label("skill"), func.count().label("mentions")).where(
+        RepoSkill.category == category, repo_filter
+    ).group_by(RepoSkill.skill)
+    counts = union_all(paper_q, repo_q).subquery()
+    
+    total = func.sum(counts.c.mentions).label("mentions")
+    query = select(counts.c.skill, total).group_by(counts.c.skill).order_by(desc(total), counts.c.skill)
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return (await db.execute(query)).all()
+
+
+async def _trend_counts(db: AsyncSession, category: str, since: date, sources: List[str], limit: int = None) -> List[tuple]:
+    """
+    Sum skill mentions from the daily rollup
+    
+    Args:
+        db: Database session
+        category: Skill category ('basic' or a detailed_skills key)
+        since: First day to include
+        sources: Rollup sources to include ('papers', 'github')
+        limit: Maximum number of skills to return
+    
+    Returns:
+        (skill, mentions) rows, most mentioned first
+    """
+    total = func.sum(SkillTrendDaily.mentions).label("mentions")
+    query = select(SkillTrendDaily.skill, total).where(
+        SkillTrendDaily.category == category,
+        SkillTrendDaily.day >= since,
+        SkillTrendDaily.source.in_(sources)
+    ).group_by(SkillTrendDaily.skill).order_by(desc(total), SkillTrendDaily.skill)
+    if limit is not None:
+        query = query.limit(limit)
+    
+    return (await db.execute(query)).all()
+
+
+async def _top_by_category(db: AsyncSession, categories: List[str], since: date, limit: int) -> Dict[str, List[tuple]]:
+    """
+    Top paper skills per detailed category from a single windowed rollup query
+    
+    Args:
+        db: Database session
+        categories: detailed_skills keys to aggregate
+        since: First day to include
+        limit: Number of skills per category
+    
+    Returns:
+        Mapping of category to (skill, mentions) rows, most mentioned first
+    """
+    counts = select(
+        SkillTrendDaily.category, SkillTrendDaily.skill,
+        func.sum(SkillTrendDaily.mentions).label("mentions")
+    ).where(
+        SkillTrendDaily.category.in_(categories),
+        SkillTrendDaily.day >= since,
+        SkillTrendDaily.source == "papers"
+    ).group_by(SkillTrendDaily.category, SkillTrendDaily.skill).subquery()
+    
+    rank = func.row_number().over(
+        partition_by=counts.c.category,
+        order_by=(desc(counts.c.mentions), counts.c.skill)
+    ).label("rank")
+    ranked = select(counts.c.category, counts.c.skill, counts.c.mentions, rank).subquery()
+    
+    top = {category: [] for category in categories}
+    for category, skill, count, _ in await db.execute(
+        select(ranked).where(ranked.c.rank <= limit).order_by(ranked.c.category, ranked.c.rank)
+    ):
+        top[category].append((skill, count))
+    return top
+
+
 @router.get("/skills/trending")
+@cached()
 async def get_trending_skills(
     days: int = Query(default=7, description="Number of days to analyze"),
     limit: int = Query(default=20, description="Number of skills to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get trending skills based on recent data
@@ -32,44 +137,35 @@ async def get_trending_skills(
     """
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    # Get skills from papers
-    papers = db.query(Paper).filter(
-        Paper.published_date >= cutoff_date
-    ).all()
-    
-    # Get skills from repos
-    repos = db.query(GitHubRepo).filter(
-        GitHubRepo.created_at >= cutoff_date
-    ).all()
+    papers_analyzed = await db.scalar(
+        select(func.count()).select_from(Paper).where(Paper.published_date >= cutoff_date)
+    )
     
-    # Count skill mentions
-    all_skills = []
-    for paper in papers:
-        all_skills.extend(paper.extracted_skills or [])
-    for repo in repos:
-        all_skills.extend(repo.extracted_skills or [])
-    
-    skill_counts = Counter(all_skills)
+    # Sum skill mentions across papers and repos from the daily rollup
+    skill_counts = await _trend_counts(
+        db, BASIC_CATEGORY, cutoff_date.date(), ["papers", "github"], limit=limit
+    )
     
     # Format response
     trending_skills = [
         {"skill": skill, "mentions": count, "rank": i+1}
-        for i, (skill, count) in enumerate(skill_counts.most_common(limit))
+        for i, (skill, count) in enumerate(skill_counts)
     ]
     
     return {
         "trending_skills": trending_skills,
         "period_days": days,
-        "total_papers_analyzed": len(papers),
-        "timestamp": datetime.now().isoformat()
+        "total_papers_analyzed": papers_analyzed,
+        "timestamp": datetime.now()
     }
 
 
 @router.get("/skills/detailed")
+@cached()
 async def get_detailed_skills(
     days: int = Query(default=7, description="Number of days to analyze"),
     limit: int = Query(default=10, description="Number of items per category"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get detailed skills breakdown from LLM extraction
@@ -85,82 +181,54 @@ async def get_detailed_skills(
         Aggregated detailed skills: frameworks, models, techniques, domains, datasets
     """
     cutoff_date = datetime.now() - timedelta(days=days)
+    in_period = PaperSkill.published_date >= cutoff_date
+    
+    papers_analyzed = await db.scalar(
+        select(func.count()).select_from(Paper).where(Paper.published_date >= cutoff_date)
+    )
     
-    papers = db.query(Paper).filter(
-        Paper.published_date >= cutoff_date
-    ).all()
-    
-    # Aggregate all detailed skills from papers
-    all_frameworks = []
-    all_models = []
-    all_techniques = []
-    all_domains = []
-    all_datasets = []
-    all_metrics = []
-    all_innovations = []
-    
-    papers_with_details = 0
-    
-    for paper in papers:
-        detailed = paper.detailed_skills
-        if detailed and isinstance(detailed, dict):
-            if any(v for v in detailed.values() if v):
-                papers_with_details += 1
-                
-            all_frameworks.extend(detailed.get('frameworks', []))
-            all_models.extend(detailed.get('models', []))
-            all_techniques.extend(detailed.get('techniques', []))
-            all_domains.extend(detailed.get('domains', []))
-            all_datasets.extend(detailed.get('datasets', []))
-            all_metrics.extend(detailed.get('metrics', []))
-            all_innovations.extend(detailed.get('key_innovations', []))
-    
-    # Count and format
-    frameworks_count = Counter(all_frameworks)
-    models_count = Counter(all_models)
-    techniques_count = Counter(all_techniques)
-    domains_count = Counter(all_domains)
-    datasets_count = Counter(all_datasets)
-    metrics_count = Counter(all_metrics)
+    # Papers with at least one detailed skill in any category
+    papers_with_details = await db.scalar(
+        select(func.count(func.distinct(PaperSkill.paper_id))).where(
+            PaperSkill.category != BASIC_CATEGORY, in_period
+        )
+    )
+    
+    # Aggregate detailed skills per category from the daily rollup
+    top = await _top_by_category(
+        db, ['frameworks', 'models', 'techniques', 'domains', 'datasets', 'metrics'], cutoff_date.date(), limit
+    )
+    
+    all_innovations = (await db.scalars(
+        select(PaperSkill.skill).where(PaperSkill.category == 'key_innovations', in_period).limit(5)
+    )).all()
+    
+    def format_items(rows):
+        return [
+            {"name": name, "mentions": count, "rank": i+1}
+            for i, (name, count) in enumerate(rows)
+        ]
     
     return {
         "period_days": days,
-        "papers_analyzed": len(papers),
+        "papers_analyzed": papers_analyzed,
         "papers_with_detailed_extraction": papers_with_details,
-        "extraction_success_rate": f"{(papers_with_details/len(papers)*100):.1f}%" if papers else "0%",
-        "top_frameworks": [
-            {"name": name, "mentions": count, "rank": i+1}
-            for i, (name, count) in enumerate(frameworks_count.most_common(limit))
-        ],
-        "top_models": [
-            {"name": name, "mentions": count, "rank": i+1}
-            for i, (name, count) in enumerate(models_count.most_common(limit))
-        ],
-        "top_techniques": [
-            {"name": name, "mentions": count, "rank": i+1}
-            for i, (name, count) in enumerate(techniques_count.most_common(limit))
-        ],
-        "top_domains": [
-            {"name": name, "mentions": count, "rank": i+1}
-            for i, (name, count) in enumerate(domains_count.most_common(limit))
-        ],
-        "top_datasets": [
-            {"name": name, "mentions": count, "rank": i+1}
-            for i, (name, count) in enumerate(datasets_count.most_common(limit))
-        ],
-        "top_metrics": [
-            {"name": name, "mentions": count, "rank": i+1}
-            for i, (name, count) in enumerate(metrics_count.most_common(limit))
-        ],
-        "innovations_sample": all_innovations[:5] if all_innovations else [],
-        "timestamp": datetime.now().isoformat()
+        "extraction_success_rate": f"{(papers_with_details/papers_analyzed*100):.1f}%" if papers_analyzed else "0%",
+        "top_frameworks": format_items(top['frameworks']),
+        "top_models": format_items(top['models']),
+        "top_techniques": format_items(top['techniques']),
+        "top_domains": format_items(top['domains']),
+        "top_datasets": format_items(top['datasets']),
+        "top_metrics": format_items(top['metrics']),
+        "innovations_sample": list(all_innovations),
+        "timestamp": datetime.now()
     }
 
 
 @router.get("/papers/recent")
 async def get_recent_papers(
     limit: int = Query(default=10, description="Number of papers to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get recently collected papers
@@ -171,19 +239,30 @@ async def get_recent_papers(
     Returns:
         List of recent papers with skills
     """
-    papers = db.query(Paper).order_by(
-        desc(Paper.created_at)
-    ).limit(limit).all()
+    # Truncate abstracts in the database instead of transferring the full text
+    papers = (await db.execute(
+        select(
+            Paper.id,
+            Paper.title,
+            func.substr(Paper.abstract, 1, 200).label("abstract"),
+            (func.length(Paper.abstract) > 200).label("truncated"),
+            Paper.url,
+            Paper.published_date,
+            Paper.extracted_skills,
+            Paper.has_detailed_skills,
+            Paper.categories
+        ).order_by(desc(Paper.created_at)).limit(limit)
+    )).all()
     
     papers_data = [
         {
             "arxiv_id": p.id,
             "title": p.title,
-            "abstract": p.abstract[:200] + "..." if len(p.abstract) > 200 else p.abstract,
+            "abstract": p.abstract + "..." if p.truncated else p.abstract,
             "url": p.url,
-            "published_date": p.published_date.isoformat() if p.published_date else None,
+            "published_date": p.published_date,
             "basic_skills": p.extracted_skills,
-            "has_detailed_skills": bool(p.detailed_skills and any(v for v in p.detailed_skills.values() if v)),
+            "has_detailed_skills": p.has_detailed_skills,
             "categories": p.categories
         }
         for p in papers
@@ -196,9 +275,10 @@ async def get_recent_papers(
 
 
 @router.get("/github/trending")
+@cached()
 async def get_trending_repos(
     limit: int = Query(default=10, description="Number of repos to return"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get trending GitHub repositories
@@ -209,9 +289,20 @@ async def get_trending_repos(
     Returns:
         List of trending repos sorted by stars
     """
-    repos = db.query(GitHubRepo).order_by(
-        desc(GitHubRepo.stars)
-    ).limit(limit).all()
+    # Read the precomputed flag rather than loading detailed_skills JSON
+    repos = (await db.execute(
+        select(
+            GitHubRepo.full_name,
+            GitHubRepo.description,
+            GitHubRepo.url,
+            GitHubRepo.stars,
+            GitHubRepo.forks,
+            GitHubRepo.language,
+            GitHubRepo.topics,
+            GitHubRepo.extracted_skills,
+            GitHubRepo.has_detailed_skills
+        ).order_by(desc(GitHubRepo.stars)).limit(limit)
+    )).all()
     
     repos_data = [
         {
@@ -223,7 +314,7 @@ async def get_trending_repos(
             "language": r.language,
             "topics": r.topics,
             "basic_skills": r.extracted_skills,
-            "has_detailed_skills": bool(r.detailed_skills and any(v for v in r.detailed_skills.values() if v))
+            "has_detailed_skills": r.has_detailed_skills
         }
         for r in repos
     ]
@@ -235,49 +326,49 @@ async def get_trending_repos(
 
 
 @router.get("/summary/daily")
-async def get_daily_summary(db: Session = Depends(get_db)):
+@cached(ttl=lambda: _cache_ttl_today())
+async def get_daily_summary(db: AsyncSession = Depends(get_async_db)):
     """
     Get daily summary of trends and activity
     
     Returns:
         Summary of today's collection activity and trending skills
     """
-    # Get today's data
+    # Get today's data as a half-open range so the date indexes are usable
     today = datetime.now().date()
-    
-    # Count papers added today
-    papers_today = db.query(func.count(Paper.id)).filter(
-        func.date(Paper.created_at) == today
-    ).scalar()
-    
-    # Count repos added today
-    repos_today = db.query(func.count(GitHubRepo.id)).filter(
-        func.date(GitHubRepo.added_at) == today
-    ).scalar()
-    
-    # Get total counts
-    total_papers = db.query(func.count(Paper.id)).scalar()
-    total_repos = db.query(func.count(GitHubRepo.id)).scalar()
+    today_start = datetime.combine(today, time.min)
+    tomorrow = today_start + timedelta(days=1)
+    
+    # Count today's additions and totals for both tables in a single round trip
+    paper_counts = select(
+        func.count(Paper.id).label("total"),
+        func.count(Paper.id).filter(and_(Paper.created_at >= today_start, Paper.created_at < tomorrow)).label("today")
+    ).subquery()
+    repo_counts = select(
+        func.count(GitHubRepo.id).label("total"),
+        func.count(GitHubRepo.id).filter(and_(GitHubRepo.added_at >= today_start, GitHubRepo.added_at < tomorrow)).label("today")
+    ).subquery()
+    
+    total_papers, papers_today, total_repos, repos_today = (await db.execute(
+        select(paper_counts.c.total, paper_counts.c.today, repo_counts.c.total, repo_counts.c.today)
+        .select_from(paper_counts.join(repo_counts, true()))
+    )).one()
     
     # Get top skills from last 24 hours
     cutoff = datetime.now() - timedelta(hours=24)
-    recent_papers = db.query(Paper).filter(Paper.created_at >= cutoff).all()
-    recent_repos = db.query(GitHubRepo).filter(GitHubRepo.added_at >= cutoff).all()
-    
-    all_skills = []
-    for p in recent_papers:
-        all_skills.extend(p.extracted_skills or [])
-    for r in recent_repos:
-        all_skills.extend(r.extracted_skills or [])
-    
-    skill_counts = Counter(all_skills)
+    skill_counts = await _skill_counts(
+        db, BASIC_CATEGORY,
+        PaperSkill.paper_id.in_(select(Paper.id).where(Paper.created_at >= cutoff)),
+        RepoSkill.repo_id.in_(select(GitHubRepo.id).where(GitHubRepo.added_at >= cutoff)),
+        limit=5
+    )
     top_skills = [
         {"skill": skill, "mentions": count}
-        for skill, count in skill_counts.most_common(5)
+        for skill, count in skill_counts
     ]
     
     return {
-        "date": today.isoformat(),
+        "date": today,
         "papers_added_today": papers_today,
         "repos_added_today": repos_today,
         "total_papers": total_papers,
@@ -285,14 +376,14 @@ async def get_daily_summary(db: Session = Depends(get_db)):
         "top_skills_24h": top_skills,
         "summary": f"Collected {papers_today} papers and {repos_today} repos today. " +
                   f"Database now has {total_papers} papers and {total_repos} repositories.",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now()
     }
 
 
 @router.get("/comparison")
 async def get_comparison(
     days: int = Query(default=7, description="Number of days to analyze"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Compare basic keyword extraction vs detailed LLM extraction
@@ -307,137 +398,95 @@ async def get_comparison(
     """
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    papers = db.query(Paper).filter(
-        Paper.published_date >= cutoff_date
-    ).all()
+    papers_analyzed = await db.scalar(
+        select(func.count()).select_from(Paper).where(Paper.published_date >= cutoff_date)
+    )
     
     # Basic skills (keyword matching)
-    basic_skills = []
-    for p in papers:
-        basic_skills.extend(p.extracted_skills or [])
-    
-    basic_unique = len(set(basic_skills))
-    basic_top = Counter(basic_skills).most_common(5)
+    basic_counts = await _trend_counts(db, BASIC_CATEGORY, cutoff_date.date(), ["papers"])
+    basic_mentions = sum(count for _, count in basic_counts)
+    basic_unique = len(basic_counts)
+    basic_top = basic_counts[:5]
     
     # Detailed skills (LLM extraction)
-    detailed_frameworks = []
-    detailed_models = []
-    detailed_techniques = []
-    
-    for p in papers:
-        if p.detailed_skills and isinstance(p.detailed_skills, dict):
-            detailed_frameworks.extend(p.detailed_skills.get('frameworks', []))
-            detailed_models.extend(p.detailed_skills.get('models', []))
-            detailed_techniques.extend(p.detailed_skills.get('techniques', []))
-    
-    detailed_all = detailed_frameworks + detailed_models + detailed_techniques
-    detailed_unique = len(set(detailed_all))
+    detailed_counts = {
+        category: await _trend_counts(db, category, cutoff_date.date(), ["papers"])
+        for category in ['frameworks', 'models', 'techniques']
+    }
+    detailed_mentions = sum(count for rows in detailed_counts.values() for _, count in rows)
+    detailed_unique = len({skill for rows in detailed_counts.values() for skill, _ in rows})
     
     return {
         "period_days": days,
-        "papers_analyzed": len(papers),
+        "papers_analyzed": papers_analyzed,
         "basic_extraction": {
-            "total_mentions": len(basic_skills),
+            "total_mentions": basic_mentions,
             "unique_skills": basic_unique,
             "top_5": [{"skill": s, "count": c} for s, c in basic_top],
             "example": "llm, transformer, pytorch"
         },
         "detailed_extraction": {
-            "total_mentions": len(detailed_all),
+            "total_mentions": detailed_mentions,
             "unique_items": detailed_unique,
-            "frameworks_found": len(set(detailed_frameworks)),
-            "models_found": len(set(detailed_models)),
-            "techniques_found": len(set(detailed_techniques)),
+            "frameworks_found": len(detailed_counts['frameworks']),
+            "models_found": len(detailed_counts['models']),
+            "techniques_found": len(detailed_counts['techniques']),
             "example": "Llama 3 70B, LoRA fine-tuning, PyTorch 2.0"
         },
         "improvement": {
             "more_specific": f"{detailed_unique - basic_unique} more specific items identified",
             "detail_level": "Detailed extraction provides version numbers, specific models, and precise techniques"
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now()
     }
 
 
 @router.get("/skills/market-ready")
+@cached()
 async def get_market_ready_skills(
     days: int = Query(default=30, description="Number of days to analyze"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get skills that are actually relevant to job market with normalized names
     """
-    from app.services.skill_extractor import SkillExtractor
-    
     cutoff_date = datetime.now() - timedelta(days=days)
     
-    papers = db.query(Paper).filter(
-        Paper.published_date >= cutoff_date
-    ).all()
-    
-    # Aggregate by category
-    all_frameworks = []
-    all_techniques = []
-    all_areas = []
-    all_programming = []
-    all_emerging = []
-    
-    for paper in papers:
-        detailed = paper.detailed_skills
-        if detailed and isinstance(detailed, dict):
-            all_frameworks.extend(detailed.get('core_frameworks', []))
-            all_techniques.extend(detailed.get('ml_techniques', []))
-            all_areas.extend(detailed.get('application_areas', []))
-            all_programming.extend(detailed.get('programming_skills', []))
-            all_emerging.extend(detailed.get('emerging_trends', []))
-    
-    # Normalize all skills
-    def normalize_list(skills):
-        normalized = []
-        for skill in skills:
-            norm = SkillExtractor.normalize_skill_name(skill)
-            if norm:
-                normalized.append(norm)
-        return normalized
-    
-    all_frameworks = normalize_list(all_frameworks)
-    all_techniques = normalize_list(all_techniques)
-    all_areas = normalize_list(all_areas)
-    all_programming = normalize_list(all_programming)
-    all_emerging = normalize_list(all_emerging)
-    
-    # Count
-    frameworks_count = Counter(all_frameworks)
-    techniques_count = Counter(all_techniques)
-    areas_count = Counter(all_areas)
-    programming_count = Counter(all_programming)
-    emerging_count = Counter(all_emerging)
-    
-    # Calculate percentage
-    total_papers = len(papers)
-    
-    def format_skills(counter, total):
+    categories = ['core_frameworks', 'ml_techniques', 'application_areas', 'programming_skills', 'emerging_trends']
+    
+    # Skill names are normalized at ingest, so the rollup can be ranked directly
+    top = await _top_by_category(db, categories, cutoff_date.date(), 15)
+    
+    total_papers = await db.scalar(
+        select(func.count()).select_from(Paper).where(Paper.published_date >= cutoff_date)
+    )
+    
+    # Prevalence is a numeric percentage of papers analyzed; formatting is left to the client
+    percent_per_mention = 100.0 / total_papers if total_papers else 0.0
+    
+    def format_skills(rows):
         return [
             {
                 "skill": skill,
                 "mentions": count,
-                "prevalence": f"{(count/total*100):.1f}%",
+                "prevalence": round(count * percent_per_mention, 1),
                 "rank": i+1
             }
-            for i, (skill, count) in enumerate(counter.most_common(15))
+            for i, (skill, count) in enumerate(rows)
         ]
     
     return {
         "period_days": days,
         "papers_analyzed": total_papers,
-        "in_demand_frameworks": format_skills(frameworks_count, total_papers),
-        "trending_techniques": format_skills(techniques_count, total_papers),
-        "hot_application_areas": format_skills(areas_count, total_papers),
-        "required_programming_skills": format_skills(programming_count, total_papers),
-        "emerging_trends": format_skills(emerging_count, total_papers),
+        "in_demand_frameworks": format_skills(top['core_frameworks']),
+        "trending_techniques": format_skills(top['ml_techniques']),
+        "hot_application_areas": format_skills(top['application_areas']),
+        "required_programming_skills": format_skills(top['programming_skills']),
+        "emerging_trends": format_skills(top['emerging_trends']),
         "recommendation": {
-            "learn_now": [s for s, _ in frameworks_count.most_common(3)],
-            "watch": [s for s, _ in emerging_count.most_common(3)],
-            "stable_demand": [s for s, _ in techniques_count.most_common(3)]
+            "learn_now": [s for s, _ in top['core_frameworks'][:3]],
+            "watch": [s for s, _ in top['emerging_trends'][:3]],
+            "stable_demand": [s for s, _ in top['ml_techniques'][:3]]
         },
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now()
     }
\ No newline at end of file
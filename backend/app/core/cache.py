@@ -0,0 +1,139 @@
+"""
+Redis response cache for read-heavy endpoints
+Falls back to computing the response when Redis is unavailable
+"""
+
+import time
+import orjson
+from functools import wraps
+from typing import Any, Callable, Optional, Union
+from fastapi import Response
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.core.logging import log
+
+# Seconds to skip Redis after a connection failure, so requests don't each wait on it
+RETRY_AFTER_FAILURE = 30
+
+_client: Optional[aioredis.Redis] = None
+_unavailable_until = 0.0
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """
+    Shared Redis client, or None while Redis is marked unavailable
+    """
+    global _client
+    
+    if time.monotonic() < _unavailable_until:
+        return None
+    if _client is None:
+        _client = aioredis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    return _client
+
+
+def _mark_unavailable(error: Exception) -> None:
+    """Stop using Redis for a while after a failure"""
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + RETRY_AFTER_FAILURE
+    log.warning(f"Redis cache unavailable, serving uncached for {RETRY_AFTER_FAILURE}s: {str(error)}")
+
+
+def cached(ttl: Union[int, Callable[[], int]] = None, exclude: tuple = ("db",)):
+    """
+    Cache an endpoint's JSON response in Redis keyed on its query parameters
+    
+    Cache hits are returned as raw JSON bytes without touching the endpoint.
+    
+    Args:
+        ttl: Expiry in seconds, or a callable returning it (default CACHE_TTL_SECONDS)
+        exclude: Keyword arguments left out of the cache key (e.g. dependencies)
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key_params = {k: v for k, v in kwargs.items() if k not in exclude}
+            key = f"cache:{func.__module__}.{func.__name__}:{orjson.dumps(key_params, option=orjson.OPT_SORT_KEYS).decode()}"
+            
+            redis = get_redis()
+            if redis is not None:
+                try:
+                    hit = await redis.get(key)
+                    if hit is not None:
+                        return Response(content=hit, media_type="application/json")
+                except (RedisError, OSError) as e:
+                    _mark_unavailable(e)
+                    redis = None
+            
+            result = await func(*args, **kwargs)
+            
+            if redis is not None:
+                expire = ttl() if callable(ttl) else (ttl or settings.CACHE_TTL_SECONDS)
+                try:
+                    await redis.set(key, orjson.dumps(result), ex=max(int(expire), 1))
+                except (RedisError, OSError) as e:
+                    _mark_unavailable(e)
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """
+    Read a JSON value from Redis
+    
+    Args:
+        key: Cache key
+    
+    Returns:
+        Decoded value, or None on a miss or while Redis is unavailable
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+    
+    try:
+        hit = await redis.get(key)
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+        return None
+    
+    return orjson.loads(hit) if hit is not None else None
+
+
+async def cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    Store a JSON value in Redis, doing nothing while Redis is unavailable
+    
+    Args:
+        key: Cache key
+        value: JSON-serializable value
+        ttl: Expiry in seconds
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    
+    try:
+        await redis.set(key, orjson.dumps(value), ex=max(int(ttl), 1))
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client on shutdown
+    """
+    global _client
+    
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -26,6 +26,15 @@ class Settings(BaseSettings):
         "sqlite:///./ml_pulse.db"
     )
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
+    CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+    
+    # Connection pool (PostgreSQL)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    
+    # Background jobs
+    SKILL_TRENDS_REFRESH_HOUR: int = int(os.getenv("SKILL_TRENDS_REFRESH_HOUR", "3"))
     
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "change-this-in-production")
@@ -39,11 +48,21 @@ class Settings(BaseSettings):
     GITHUB_TOKEN: str = os.getenv("GITHUB_TOKEN", "")
     GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    LLM_CONCURRENCY: int = int(os.getenv("LLM_CONCURRENCY", "4"))
+    # Papers packed into one LLM request by the ArXiv scraper and SkillExtractor.batch_process (1 = one request per paper)
+    LLM_PAPER_BATCH_SIZE: int = int(os.getenv("LLM_PAPER_BATCH_SIZE", "10"))
+    # Skip LLM extraction for repos/posts where keyword matching already finds this many skills (0 = never skip)
+    LLM_SKIP_MIN_BASIC_SKILLS: int = int(os.getenv("LLM_SKIP_MIN_BASIC_SKILLS", "5"))
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 86400)))
+    # Reuse the extraction of a same-titled item whose body words overlap this much (Jaccard 0-1; 0 = exact matches only)
+    LLM_NEAR_DUPLICATE_MIN_SIMILARITY: float = float(os.getenv("LLM_NEAR_DUPLICATE_MIN_SIMILARITY", "0.9"))
     REDDIT_CLIENT_ID: str = os.getenv("REDDIT_CLIENT_ID", "")
     REDDIT_CLIENT_SECRET: str = os.getenv("REDDIT_CLIENT_SECRET", "")
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    # Show a tqdm progress bar for batch LLM extraction instead of periodic log lines (for interactive runs)
+    PROGRESS_BAR: bool = os.getenv("PROGRESS_BAR", "false").lower() == "true"
     
     class Config:
         case_sensitive = True
@@ -2,44 +2,196 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+import orjson
+from typing import Any, Dict, List
+from sqlalchemy import JSON, Table, create_engine
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.core.logging import log
 
 # Create database engine with SQLite fallback
 DATABASE_URL = settings.DATABASE_URL
 
+# Async drivers used for the non-blocking engine
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _async_url(url: str) -> str:
+    """
+    Map a sync database URL onto its async driver equivalent
+
+    Args:
+        url: Database URL as configured in settings
+
+    Returns:
+        URL using the async driver for the same backend
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    return parsed.set(drivername=ASYNC_DRIVERS.get(backend, parsed.drivername)).render_as_string(hide_password=False)
+
+
+def _json_dumps(value: Any) -> str:
+    """
+    Serialize JSON column values with orjson (SQLAlchemy expects str)
+    """
+    return orjson.dumps(value).decode()
+
+
+# JSON (de)serializers shared by every engine
+JSON_OPTIONS = {"json_serializer": _json_dumps, "json_deserializer": orjson.loads}
+
+
 if DATABASE_URL.startswith("sqlite"):
     # SQLite specific settings
     engine = create_engine(
         DATABASE_URL, 
         connect_args={"check_same_thread": False},
-        echo=False
+        echo=False,
+        **JSON_OPTIONS
     )
+    async_engine = create_async_engine(_async_url(DATABASE_URL), echo=False, **JSON_OPTIONS)
     log.info("Using SQLite database for development")
 else:
-    # PostgreSQL settings
-    engine = create_engine(DATABASE_URL, echo=False)
+    # PostgreSQL settings; pre-ping and recycle drop connections the server closed while idle
+    engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True, **JSON_OPTIONS)
+    async_engine = create_async_engine(
+        _async_url(DATABASE_URL),
+        echo=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        **JSON_OPTIONS
+    )
     log.info("Using PostgreSQL database")
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory (the sync engine is only used to create tables)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Create base class for models
 Base = declarative_base()
 
+# Batches larger than this are loaded with COPY on PostgreSQL
+COPY_THRESHOLD = 100
+
+# Rows sent per INSERT executemany in bulk_insert
+BULK_INSERT_BATCH_SIZE = 1000
 
-def get_db():
+
+async def get_async_db():
     """
-    Dependency to get database session
+    Dependency to get an async database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def dialect_insert(db: AsyncSession, table: Table):
+    """
+    INSERT for the session's backend, which supports ON CONFLICT clauses
+    """
+    return (postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert)(table)
+
+
+def supports_copy(db: AsyncSession) -> bool:
+    """
+    Check whether the session is bound to a backend that supports COPY
+    """
+    return db.bind.dialect.name == "postgresql"
+
+
+async def bulk_insert(
+    db: AsyncSession,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    batch_size: int = BULK_INSERT_BATCH_SIZE
+) -> None:
+    """
+    Insert rows in batches, skipping any whose primary key already exists
+    
+    Ignoring conflicts lets two collections that race on the same new item
+    both commit; the skill index rows and bulk_copy skip duplicates the same way.
+    
+    Args:
+        db: Async session (caller commits)
+        table: Target table
+        rows: Row dictionaries keyed by column name
+        batch_size: Rows per executemany round trip
+    """
+    if not rows:
+        return
+    
+    statement = dialect_insert(db, table).on_conflict_do_nothing(
+        index_elements=[column.name for column in table.primary_key]
+    )
+    
+    for start in range(0, len(rows), batch_size):
+        await db.execute(statement, rows[start:start + batch_size])
+
+
+async def bulk_copy(db: AsyncSession, table: Table, rows: List[Dict[str, Any]]) -> None:
+    """
+    Load rows into a table with PostgreSQL COPY via the raw asyncpg connection
+    
+    COPY has no conflict handling, so rows are copied into a temporary
+    staging table and moved over with INSERT ... ON CONFLICT DO NOTHING,
+    skipping rows whose primary key already exists like bulk_insert does.
+    Runs inside the session's current transaction. JSON columns are
+    serialized up front since COPY bypasses SQLAlchemy type processing.
+    
+    Args:
+        db: Async session bound to PostgreSQL
+        table: Target table
+        rows: Row dictionaries keyed by column name
+    """
+    if not rows:
+        return
+    
+    columns = list(rows[0].keys())
+    json_columns = {c.name for c in table.columns if isinstance(c.type, JSON)}
+    records = [
+        tuple(
+            _json_dumps(row[col]) if col in json_columns else row[col]
+            for col in columns
+        )
+        for row in rows
+    ]
+    
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    
+    quote = connection.dialect.identifier_preparer.quote
+    target = quote(table.name)
+    staging = quote(f"_copy_{table.name}")
+    column_list = ", ".join(quote(col) for col in columns)
+    primary_key = ", ".join(quote(column.name) for column in table.primary_key)
+    
+    await driver_connection.execute(
+        f"CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    await driver_connection.copy_records_to_table(
+        f"_copy_{table.name}", records=records, columns=columns
+    )
+    await driver_connection.execute(
+        f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {staging} "
+        f"ON CONFLICT ({primary_key}) DO NOTHING"
+    )
+    await driver_connection.execute(f"DROP TABLE {staging}")
+    log.debug(f"Copied {len(records)} rows into {table.name}")
 
 
 def init_database():
@@ -49,14 +201,14 @@ def init_database():
     try:
         # Import all models to register them with Base
         from app.models import models
-        
+
         Base.metadata.create_all(bind=engine)
         log.info("Database tables created successfully")
-        
+
         # Log created tables
         for table in Base.metadata.sorted_tables:
             log.info(f"  - Table created: {table.name}")
-            
+
     except Exception as e:
         log.error(f"Error creating database tables: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -3,12 +3,19 @@ FastAPI main application
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from app.core.config import settings
 from app.core.logging import log
+from app.core.cache import close_redis
 from app.core.database import init_database
-from app.api import test
+from app.scrapers.arxiv_scraper import ArxivScraper
+from app.scrapers.github_scraper import GitHubScraper
+from app.scrapers.reddit_scraper import RedditScraper
+from app.services.skill_trends import refresh_all_skill_trends
 from app.api import test, trends, collect
 
 
@@ -22,9 +29,22 @@ async def lifespan(app: FastAPI):
     # Initialize database
     init_database()
     
+    # Shared scraper instances, reused across requests
+    app.state.arxiv_scraper = ArxivScraper()
+    app.state.github_scraper = GitHubScraper()
+    app.state.reddit_scraper = RedditScraper()
+    
+    # Rebuild the skill trend rollup nightly (ingest refreshes the days it touches)
+    scheduler = AsyncIOScheduler()
+    scheduler.add_job(refresh_all_skill_trends, "cron", hour=settings.SKILL_TRENDS_REFRESH_HOUR)
+    scheduler.start()
+    
     yield
     
     # Shutdown
+    scheduler.shutdown(wait=False)
+    await app.state.github_scraper.close()
+    await close_redis()
     log.info("Application shutting down")
 
 
@@ -34,6 +54,7 @@ app = FastAPI(
     description="Real-time ML skills and trends tracker",
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.ENVIRONMENT != "production" else None,
     redoc_url="/redoc" if settings.ENVIRONMENT != "production" else None,
 )
@@ -46,7 +67,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.include_router(test.router, prefix="/api/v1/test", tags=["test"])
+
+# Compress larger JSON responses (skill breakdowns run to tens of KB)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 app.include_router(test.router, prefix="/api/v1/test", tags=["test"])
 app.include_router(trends.router, prefix="/api/v1/trends", tags=["trends"])
 app.include_router(collect.router, prefix="/api/v1/collect", tags=["data-collection"])
@@ -2,10 +2,14 @@
 SQLAlchemy database models
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, JSON, Text, Boolean
+from sqlalchemy import Column, Integer, String, Date, DateTime, Float, JSON, Text, Boolean, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.core.database import Base
 
+# JSON list stored as binary JSONB on PostgreSQL, so it can be GIN-indexed for @> lookups
+JSONList = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Paper(Base):
     """ArXiv research paper model"""
@@ -15,13 +19,22 @@ class Paper(Base):
     title = Column(Text, nullable=False)
     abstract = Column(Text, nullable=False)
     authors = Column(Text)
-    published_date = Column(DateTime, nullable=False)
+    published_date = Column(DateTime, nullable=False, index=True)
     source = Column(String(50), default="arxiv")
     url = Column(Text)
     categories = Column(JSON, default=list)
-    extracted_skills = Column(JSON, default=list)
+    extracted_skills = Column(JSONList, default=list)
     detailed_skills = Column(JSON, default=dict)  # NEW FIELD
-    created_at = Column(DateTime, server_default=func.now())
+    has_detailed_skills = Column(Boolean, default=False, nullable=False, index=True)  # set at ingest
+    created_at = Column(DateTime, server_default=func.now(), index=True)
+    
+    __table_args__ = (
+        # Serves extracted_skills.contains([...]) on PostgreSQL
+        Index(
+            "ix_papers_extracted_skills_gin", "extracted_skills",
+            postgresql_using="gin", postgresql_ops={"extracted_skills": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
     def __repr__(self):
         return f"<Paper {self.id}: {self.title[:50]}>"
@@ -35,20 +48,88 @@ class GitHubRepo(Base):
     name = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=False)
     description = Column(Text)
-    stars = Column(Integer, default=0)
+    stars = Column(Integer, default=0, index=True)
     forks = Column(Integer, default=0)
     language = Column(String(50))
-    topics = Column(JSON, default=list)
+    topics = Column(JSONList, default=list)
     url = Column(Text, nullable=False)
-    created_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, index=True)
     updated_at = Column(DateTime, nullable=False)
     extracted_skills = Column(JSON, default=list)
     detailed_skills = Column(JSON, default=dict)  # NEW FIELD
-    added_at = Column(DateTime, server_default=func.now())
+    has_detailed_skills = Column(Boolean, default=False, nullable=False, index=True)  # set at ingest
+    added_at = Column(DateTime, server_default=func.now(), index=True)
+    
+    __table_args__ = (
+        # Serves topics.contains([...]) on PostgreSQL
+        Index(
+            "ix_github_repos_topics_gin", "topics",
+            postgresql_using="gin", postgresql_ops={"topics": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
     def __repr__(self):
         return f"<GitHubRepo {self.full_name}: {self.stars} stars>"
 
+
+class PaperSkill(Base):
+    """
+    Skill mentioned by a paper, one row per (paper, category, skill)
+    
+    Normalized copy of Paper.extracted_skills ('basic' category) and
+    Paper.detailed_skills (one category per key) so trends can be
+    aggregated with GROUP BY instead of in Python.
+    """
+    __tablename__ = "paper_skills"
+    
+    paper_id = Column(String(50), ForeignKey("papers.id", ondelete="CASCADE"), primary_key=True)
+    category = Column(String(50), primary_key=True)
+    skill = Column(Text, primary_key=True)
+    published_date = Column(DateTime, nullable=False)  # denormalized from papers
+    
+    __table_args__ = (
+        Index("ix_paper_skills_category_date_skill", "category", "published_date", "skill"),
+    )
+
+
+class RepoSkill(Base):
+    """
+    Skill mentioned by a GitHub repository, one row per (repo, category, skill)
+    
+    Normalized copy of GitHubRepo.extracted_skills and detailed_skills.
+    """
+    __tablename__ = "repo_skills"
+    
+    repo_id = Column(String(50), ForeignKey("github_repos.id", ondelete="CASCADE"), primary_key=True)
+    category = Column(String(50), primary_key=True)
+    skill = Column(Text, primary_key=True)
+    created_at = Column(DateTime, nullable=False)  # denormalized from github_repos
+    
+    __table_args__ = (
+        Index("ix_repo_skills_category_date_skill", "category", "created_at", "skill"),
+    )
+
+
+class SkillTrendDaily(Base):
+    """
+    Daily rollup of skill mentions per source and category
+    
+    Pre-aggregated from paper_skills / repo_skills so trend endpoints sum
+    a handful of rows per skill instead of counting mentions on every request.
+    """
+    __tablename__ = "skill_trend_daily"
+    
+    day = Column(Date, primary_key=True)
+    source = Column(String(20), primary_key=True)  # 'papers' or 'github'
+    category = Column(String(50), primary_key=True)
+    skill = Column(Text, primary_key=True)
+    mentions = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        Index("ix_skill_trend_daily_category_day_skill", "category", "day", "skill"),
+    )
+
+
 class JobPosting(Base):
     """
     Job posting model
@@ -64,7 +145,7 @@ class JobPosting(Base):
     salary_min = Column(Integer)
     salary_max = Column(Integer)
     remote = Column(Boolean, default=False)
-    source = Column(String, index=True)
+    source = Column(String)  # unindexed: single-valued in practice and never filtered on
     url = Column(String)
     posted_date = Column(DateTime)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -77,7 +158,7 @@ class SkillTrend(Base):
     __tablename__ = "skill_trends"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    skill = Column(String, index=True, nullable=False)
+    skill = Column(String, nullable=False)
     date = Column(DateTime, index=True, nullable=False)
     mentions_papers = Column(Integer, default=0)
     mentions_github = Column(Integer, default=0)
@@ -86,6 +167,11 @@ class SkillTrend(Base):
     trend_score = Column(Float, default=0.0)
     growth_rate = Column(Float, default=0.0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        # Serves per-skill date ranges pre-sorted; also covers skill-only lookups
+        Index("ix_skill_trends_skill_date", "skill", "date"),
+    )
 
 
 class DailyInsight(Base):
@@ -11,6 +11,19 @@ from loguru import logger
 
 from .base_scraper import BaseScraper
 
+# Adzuna search pages requested at the same time
+MAX_CONCURRENT_PAGES = 3
+
+# Shared stand-in for missing nested objects, so lookups don't allocate a dict per job
+_EMPTY: Dict = {}
+
+# Salary display format keyed on which of (salary_min, salary_max) are present
+_SALARY_FORMATS = {
+    (True, True): "${:,.0f} - ${:,.0f}",
+    (True, False): "${:,.0f}+",
+    (False, True): "Up to ${:,.0f}",
+}
+
 
 class AdzunaJobScraper(BaseScraper):
     """Scraper for ML job postings using Adzuna API"""
@@ -20,6 +33,30 @@ class AdzunaJobScraper(BaseScraper):
         self.app_id = app_id
         self.app_key = app_key
         self.base_url = "https://api.adzuna.com/v1/api/jobs"
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> "AdzunaJobScraper":
+        self._get_session()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Shared HTTP session, so connections and TLS sessions are reused across calls
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     async def fetch_data(self, **kwargs) -> List[Dict]:
         """Fetch job postings from Adzuna API"""
@@ -32,23 +69,25 @@ class AdzunaJobScraper(BaseScraper):
     async def process_data(self, raw_data: List[Dict]) -> List[Dict]:
         """Process raw job data into standardized format"""
         processed_jobs = []
+        # One collection timestamp for the whole batch
+        collected_at = datetime.utcnow().isoformat()
         
         for job in raw_data:
             try:
+                title = job.get('title', '')
+                description = job.get('description', '')
                 processed_job = {
                     'id': job.get('id', ''),
-                    'title': job.get('title', ''),
-                    'company': job.get('company', {}).get('display_name', 'Unknown'),
-                    'location': job.get('location', {}).get('display_name', 'Remote'),
-                    'description': job.get('description', ''),
+                    'title': title,
+                    'company': (job.get('company') or _EMPTY).get('display_name', 'Unknown'),
+                    'location': (job.get('location') or _EMPTY).get('display_name', 'Remote'),
+                    'description': description,
                     'salary': self._format_salary(job),
                     'url': job.get('redirect_url', ''),
                     'date_posted': job.get('created', 'Recently'),
                     'source': 'Adzuna',
-                    'collected_at': datetime.utcnow().isoformat(),
-                    'extracted_skills': self.extract_skills(
-                        f"{job.get('title', '')} {job.get('description', '')}"
-                    )
+                    'collected_at': collected_at,
+                    'extracted_skills': self.extract_skills(f"{title} {description}")
                 }
                 processed_jobs.append(processed_job)
             except Exception as e:
@@ -59,16 +98,11 @@ class AdzunaJobScraper(BaseScraper):
     
     def _format_salary(self, job: Dict) -> Optional[str]:
         """Format salary information"""
-        salary_min = job.get('salary_min')
-        salary_max = job.get('salary_max')
-        
-        if salary_min and salary_max:
-            return f"${salary_min:,.0f} - ${salary_max:,.0f}"
-        elif salary_min:
-            return f"${salary_min:,.0f}+"
-        elif salary_max:
-            return f"Up to ${salary_max:,.0f}"
-        return None
+        salary_min, salary_max = job.get('salary_min'), job.get('salary_max')
+        fmt = _SALARY_FORMATS.get((bool(salary_min), bool(salary_max)))
+        if fmt is None:
+            return None
+        return fmt.format(*(value for value in (salary_min, salary_max) if value))
     
     async def collect_jobs(
         self,
@@ -92,65 +126,37 @@ class AdzunaJobScraper(BaseScraper):
         jobs = []
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Calculate number of pages needed (Adzuna returns 50 results per page max)
-                results_per_page = min(50, max_results)
-                num_pages = (max_results // results_per_page) + (1 if max_results % results_per_page else 0)
-                num_pages = min(num_pages, 5)  # Limit to 5 pages (250 jobs max)
-                
-                for page in range(1, num_pages + 1):
-                    if len(jobs) >= max_results:
-                        break
-                    
-                    url = f"{self.base_url}/{country}/search/{page}"
-                    
-                    params = {
-                        'app_id': self.app_id,
-                        'app_key': self.app_key,
-                        'what': query,
-                        'results_per_page': results_per_page,
-                        'content-type': 'application/json',
-                        'sort_by': 'date',  # Sort by most recent
-                        'category': 'it-jobs'  # Focus on IT/tech jobs
-                    }
-                    
-                    logger.info(f"Requesting: {url}")
-                    logger.info(f"With params: what={query}, results_per_page={results_per_page}, app_id={self.app_id[:4]}...")
-                    
-                    try:
-                        async with session.get(url, params=params) as response:
-                            response_text = await response.text()
-                            
-                            if response.status != 200:
-                                logger.error(f"Adzuna API error - Status: {response.status}")
-                                logger.error(f"URL: {url}")
-                                logger.error(f"Response: {response_text[:500]}")
-                                continue
-                            
-                            data = await response.json()
-                            logger.info(f"API Response keys: {data.keys()}")
-                            
-                            # Extract job results
-                            results = data.get('results', [])
-                            
-                            if not results:
-                                logger.warning(f"No results found at page {page}")
-                                logger.info(f"Response data: {data}")
-                                break
-                            
-                            jobs.extend(results)
-                            logger.info(f"Collected {len(results)} jobs from page {page}")
-                            
-                            if len(jobs) >= max_results:
-                                jobs = jobs[:max_results]
-                                break
-                            
-                        # Be respectful with rate limiting
-                        await asyncio.sleep(1)
-                        
-                    except Exception as e:
-                        logger.error(f"Error fetching Adzuna page {page}: {e}")
-                        continue
+            # Calculate number of pages needed (Adzuna returns 50 results per page max)
+            results_per_page = min(50, max_results)
+            num_pages = (max_results // results_per_page) + (1 if max_results % results_per_page else 0)
+            num_pages = min(num_pages, 5)  # Limit to 5 pages (250 jobs max)
+            
+            params = {
+                'app_id': self.app_id,
+                'app_key': self.app_key,
+                'what': query,
+                'results_per_page': results_per_page,
+                'content-type': 'application/json',
+                'sort_by': 'date',  # Sort by most recent
+                'category': 'it-jobs'  # Focus on IT/tech jobs
+            }
+            
+            # Fetch all pages concurrently, with a few requests in flight to be respectful
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+            session = self._get_session()
+            pages = await asyncio.gather(*[
+                self._fetch_page(session, semaphore, country, page, params)
+                for page in range(1, num_pages + 1)
+            ])
+            
+            # Keep page order, skip failed pages and stop at the first empty one
+            for results in pages:
+                if results is None:
+                    continue
+                if not results:
+                    break
+                jobs.extend(results)
+            jobs = jobs[:max_results]
                         
         except Exception as e:
             logger.error(f"Error in Adzuna API collection: {e}")
@@ -158,6 +164,61 @@ class AdzunaJobScraper(BaseScraper):
         logger.info(f"Collected {len(jobs)} total jobs from Adzuna")
         return jobs
     
+    async def _fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        country: str,
+        page: int,
+        params: Dict
+    ) -> Optional[List[Dict]]:
+        """
+        Fetch one page of Adzuna search results
+        
+        Args:
+            session: Shared HTTP session
+            semaphore: Limits concurrent page requests
+            country: Country code
+            page: 1-based page number
+            params: Search query parameters
+            
+        Returns:
+            Job results on the page (empty when exhausted), or None on error
+        """
+        url = f"{self.base_url}/{country}/search/{page}"
+        
+        async with semaphore:
+            logger.info(f"Requesting: {url}")
+            logger.info(f"With params: what={params['what']}, results_per_page={params['results_per_page']}, app_id={self.app_id[:4]}...")
+            
+            try:
+                async with session.get(url, params=params) as response:
+                    response_text = await response.text()
+                    
+                    if response.status != 200:
+                        logger.error(f"Adzuna API error - Status: {response.status}")
+                        logger.error(f"URL: {url}")
+                        logger.error(f"Response: {response_text[:500]}")
+                        return None
+                    
+                    data = await response.json()
+                    logger.info(f"API Response keys: {data.keys()}")
+                    
+                    # Extract job results
+                    results = data.get('results', [])
+                    
+                    if not results:
+                        logger.warning(f"No results found at page {page}")
+                        logger.info(f"Response data: {data}")
+                        return []
+                    
+                    logger.info(f"Collected {len(results)} jobs from page {page}")
+                    return results
+                    
+            except Exception as e:
+                logger.error(f"Error fetching Adzuna page {page}: {e}")
+                return None
+    
     async def get_job_details(self, job_id: str, country: str = "us") -> Optional[Dict]:
         """
         Get detailed information about a specific job
@@ -177,13 +238,12 @@ class AdzunaJobScraper(BaseScraper):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.warning(f"Failed to get job details for {job_id}: {response.status}")
-                        return None
+            async with self._get_session().get(url, params=params) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    logger.warning(f"Failed to get job details for {job_id}: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error getting job details: {e}")
             return None
@@ -195,14 +255,13 @@ async def main():
     app_id = "9024125b"
     app_key = "13497e520dff5cffd5155166f7c761209"
     
-    scraper = AdzunaJobScraper(app_id, app_key)
-    
-    # Collect jobs
-    result = await scraper.run(
-        query="machine learning engineer",
-        country="us",
-        max_results=20
-    )
+    async with AdzunaJobScraper(app_id, app_key) as scraper:
+        # Collect jobs
+        result = await scraper.run(
+            query="machine learning engineer",
+            country="us",
+            max_results=20
+        )
     
     print(f"\nCollected {result['item_count']} jobs from Adzuna")
     
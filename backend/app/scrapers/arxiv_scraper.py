@@ -2,13 +2,31 @@
 ArXiv research papers scraper with LLM extraction
 """
 
-import arxiv
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
-import hashlib
+import asyncio
+import io
+import httpx
+import xml.etree.ElementTree as ET
+from collections import Counter
+from itertools import chain
+from typing import List, Dict, Any, AsyncIterator, Tuple
+from datetime import datetime, timedelta, timezone
 from app.scrapers.base_scraper import BaseScraper
+from app.services.skill_extractor import SkillExtractor
+from app.core.config import settings
 from app.core.logging import log
 
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+# XML namespaces used in the ArXiv Atom feed
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+OPENSEARCH = "{http://a9.com/-/spec/opensearch/1.1/}"
+
+# Results per API request, and seconds between requests as asked by the ArXiv API terms
+PAGE_SIZE = 100
+PAGE_DELAY = 3.0
+NUM_RETRIES = 3
+
 
 class ArxivScraper(BaseScraper):
     """
@@ -17,8 +35,8 @@ class ArxivScraper(BaseScraper):
     
     def __init__(self):
         super().__init__("ArXiv")
-        self.client = arxiv.Client()
         self.categories = ['cs.LG', 'cs.AI', 'stat.ML', 'cs.CV', 'cs.CL', 'cs.NE']
+        self.category_query = ' OR '.join(f'cat:{cat}' for cat in self.categories)
     
     async def fetch_data(self, max_results: int = 50, days_back: int = 7) -> List[Dict[str, Any]]:
         """
@@ -31,136 +49,336 @@ class ArxivScraper(BaseScraper):
         Returns:
             List of paper data
         """
-        papers = []
+        return [paper async for paper in self.iter_papers(max_results=max_results, days_back=days_back)]
+    
+    async def iter_papers(self, max_results: int = 50, days_back: int = 7) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield recent papers from ArXiv as the client pages through results
+        
+        Args:
+            max_results: Maximum number of papers to fetch
+            days_back: Number of days to look back
+            
+        Yields:
+            Raw paper data, one paper at a time
+        """
+        count = 0
         
         try:
             log.info(f"Starting ArXiv fetch: max_results={max_results}, days_back={days_back}")
             
-            # Build query for multiple categories
-            query = ' OR '.join([f'cat:{cat}' for cat in self.categories])
+            # Let ArXiv apply the date range so only papers we keep are transferred
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+            log.info(f"Filtering papers published after: {cutoff_date.isoformat()}")
+            
+            date_clause = f"submittedDate:[{cutoff_date.strftime('%Y%m%d%H%M')} TO 999912312359]"
+            query = f"({self.category_query}) AND {date_clause}"
             log.debug(f"ArXiv query string: {query}")
             
-            # Create search - fetch more than needed to account for date filtering
-            search = arxiv.Search(
-                query=query,
-                max_results=max_results * 2,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending
-            )
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                async for paper in self._iter_feed(client, query, max_results):
+                    count += 1
+                    log.debug(f"Added paper {count}/{max_results}: {paper['title'][:50]}")
+                    yield paper
             
-            # Calculate cutoff date
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            log.info(f"Filtering papers published after: {cutoff_date.isoformat()}")
-            
-            # Fetch and filter papers
-            count = 0
-            for result in self.client.results(search):
-                # Handle timezone-aware datetime comparison
-                result_date = result.published
-                compare_cutoff = cutoff_date
-                
-                if result_date.tzinfo is not None:
-                    compare_cutoff = cutoff_date.replace(tzinfo=result_date.tzinfo)
-                
-                # Check if paper is within date range
-                if result_date < compare_cutoff:
-                    log.debug(f"Paper outside date range: {result.title[:50]} ({result_date})")
-                    continue
-                
-                # Stop if we have enough papers
-                if count >= max_results:
-                    break
-                
-                papers.append({
-                    'id': result.entry_id,
-                    'title': result.title,
-                    'abstract': result.summary,
-                    'authors': [author.name for author in result.authors],
-                    'published_date': result.published,
-                    'categories': result.categories,
-                    'pdf_url': result.pdf_url,
-                    'comment': result.comment
-                })
-                count += 1
-                log.debug(f"Added paper {count}/{max_results}: {result.title[:50]}")
-            
-            log.info(f"ArXiv fetch complete: {len(papers)} papers retrieved")
+            log.info(f"ArXiv fetch complete: {count} papers retrieved")
             
         except Exception as e:
-            log.error(f"Error fetching ArXiv papers: {str(e)}")
-            import traceback
-            log.error(traceback.format_exc())
+            log.exception(f"Error fetching ArXiv papers: {str(e)}")
+    
+    async def _iter_feed(self, client: httpx.AsyncClient, query: str, max_results: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Page through the ArXiv Atom API, yielding papers page by page
+        
+        Args:
+            client: HTTP client for the API requests
+            query: ArXiv search_query string
+            max_results: Maximum number of papers to yield
+        """
+        start = 0
+        
+        while start < max_results:
+            if start:
+                await asyncio.sleep(PAGE_DELAY)
+            
+            content = await self._fetch_page(client, {
+                'search_query': query,
+                'start': start,
+                'max_results': min(PAGE_SIZE, max_results - start),
+                'sortBy': 'submittedDate',
+                'sortOrder': 'descending'
+            })
+            papers, entries, total = await asyncio.to_thread(self._parse_feed, content)
+            
+            for paper in papers:
+                yield paper
+            
+            # Advance past skipped malformed entries too, so the next page doesn't repeat them
+            start += entries
+            if not entries or start >= total:
+                break
+    
+    async def _fetch_page(self, client: httpx.AsyncClient, params: Dict[str, Any]) -> bytes:
+        """Fetch one page of the Atom feed, retrying transient failures"""
+        for attempt in range(NUM_RETRIES + 1):
+            try:
+                response = await client.get(ARXIV_API_URL, params=params)
+                response.raise_for_status()
+                return response.content
+            except httpx.HTTPError as e:
+                if attempt == NUM_RETRIES:
+                    raise
+                log.warning(f"ArXiv request failed (attempt {attempt + 1}), retrying: {str(e)}")
+                await asyncio.sleep(PAGE_DELAY)
+    
+    @staticmethod
+    def _parse_feed(content: bytes) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Parse an Atom feed page into raw paper dicts
+        
+        Uses the C-accelerated ElementTree parser incrementally, clearing each
+        entry once read so memory stays bounded by a single entry. Malformed
+        entries are logged and skipped, keeping the rest of the page.
         
-        return papers
+        Returns:
+            Papers on the page, the number of entries read (skipped ones
+            included) and the total result count reported by ArXiv
+        """
+        papers = []
+        entries = 0
+        total = 0
+        
+        for _, elem in ET.iterparse(io.BytesIO(content)):
+            if elem.tag == f'{OPENSEARCH}totalResults':
+                total = int(elem.text or 0)
+            elif elem.tag == f'{ATOM}entry':
+                entries += 1
+                try:
+                    papers.append(ArxivScraper._parse_entry(elem))
+                except ValueError as e:
+                    log.warning(f"Skipping malformed ArXiv entry {elem.findtext(f'{ATOM}id', '?').strip()}: {str(e)}")
+                elem.clear()
+        
+        return papers, entries, total
+    
+    @staticmethod
+    def _parse_entry(elem: ET.Element) -> Dict[str, Any]:
+        """
+        Read one Atom entry into a raw paper dict
+        
+        Raises:
+            ValueError: If the id, title or publication date is missing or invalid
+        """
+        paper_id = elem.findtext(f'{ATOM}id', '').strip()
+        title = ' '.join(elem.findtext(f'{ATOM}title', '').split())
+        published = elem.findtext(f'{ATOM}published', '').strip()
+        if not paper_id or not title or not published:
+            raise ValueError("missing id, title or published date")
+        
+        links = elem.findall(f'{ATOM}link')
+        return {
+            'id': paper_id,
+            'title': title,
+            'abstract': elem.findtext(f'{ATOM}summary', '').strip(),
+            'authors': [author.findtext(f'{ATOM}name', '') for author in elem.iterfind(f'{ATOM}author')],
+            'published_date': datetime.fromisoformat(published),
+            'categories': [category.get('term') for category in elem.iterfind(f'{ATOM}category')],
+            'pdf_url': next((link.get('href') for link in links if link.get('title') == 'pdf'), None),
+            'comment': elem.findtext(f'{ARXIV}comment')
+        }
     
     async def process_data(self, raw_data: List[Dict]) -> List[Dict]:
         """
         Process raw paper data with LLM-based skill extraction
         Includes rate limiting and progress tracking
         """
-        from app.services.skill_extractor import SkillExtractor
-        import asyncio
-        
         if not raw_data:
             log.warning("No papers to process")
             return []
         
         log.info(f"Processing {len(raw_data)} papers with LLM extraction")
         
+        extractor = self._create_extractor(len(raw_data))
+        processed = [paper async for paper in self._process_all(extractor, self._aiter(raw_data))]
+        
+        log.info(f"Successfully processed {len(processed)} papers with detailed extraction")
+        return processed
+    
+    async def stream(self, max_results: int = 50, days_back: int = 7) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Fetch papers and yield each one as soon as its skills are extracted
+        
+        Extraction starts as soon as each paper is fetched, overlapping the
+        remaining ArXiv pages. Holds the scraper lock for the lifetime of the
+        stream, like run().
+        
+        Args:
+            max_results: Maximum number of papers to fetch
+            days_back: Number of days to look back
+            
+        Yields:
+            Processed paper data, one paper at a time
+        """
+        async with self.lock:
+            log.info(f"Streaming up to {max_results} papers with LLM extraction")
+            
+            extractor = self._create_extractor(max_results)
+            papers = self.iter_papers(max_results=max_results, days_back=days_back)
+            
+            async for processed in self._process_all(extractor, papers):
+                yield processed
+    
+    async def _process_all(self, extractor: SkillExtractor, papers: AsyncIterator[Dict]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process papers concurrently as they arrive, yielding each as soon as it is done
+        
+        Papers are grouped LLM_PAPER_BATCH_SIZE at a time into one LLM
+        request each. At most LLM_CONCURRENCY requests run at once; the
+        extractor itself keeps request starts within the LLM rate limit.
+        
+        Args:
+            extractor: LLM skill extractor
+            papers: Raw papers, as produced by iter_papers
+            
+        Yields:
+            Processed papers in completion order (papers of a failed chunk are skipped)
+        """
+        semaphore = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+        chunk_size = max(settings.LLM_PAPER_BATCH_SIZE, 1)
+        finished: asyncio.Queue = asyncio.Queue()
+        pending = set()
+        
+        async def process(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._process_chunk(extractor, chunk)
+        
+        def submit(chunk: List[Dict[str, Any]]) -> None:
+            task = asyncio.create_task(process(chunk))
+            pending.add(task)
+            task.add_done_callback(finished.put_nowait)
+        
+        async def feed() -> None:
+            chunk = []
+            async for paper in papers:
+                chunk.append(paper)
+                if len(chunk) == chunk_size:
+                    submit(chunk)
+                    chunk = []
+            if chunk:
+                submit(chunk)
+        
+        feeder = asyncio.create_task(feed())
+        feeder.add_done_callback(finished.put_nowait)
+        done = 0
+        
+        try:
+            while not (feeder.done() and not pending):
+                task = await finished.get()
+                if task is feeder:
+                    task.result()
+                    continue
+                
+                pending.discard(task)
+                try:
+                    processed = task.result()
+                except Exception as e:
+                    log.error(f"Error processing papers: {str(e)}")
+                    continue
+                
+                for paper in processed:
+                    done += 1
+                    yield paper
+                    
+                    # Progress logging every 10 items
+                    if done % 10 == 0:
+                        log.info(f"Processed {done} papers")
+        finally:
+            # Stop fetching and outstanding extractions if the consumer goes away early
+            feeder.cancel()
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    async def _aiter(items: List[Dict]) -> AsyncIterator[Dict]:
+        """Adapt an already fetched list to the async iterator _process_all consumes"""
+        for item in items:
+            yield item
+    
+    def _create_extractor(self, paper_count: int) -> SkillExtractor:
+        """
+        Create the LLM extractor and log the expected processing time
+        
+        Args:
+            paper_count: Number of papers about to be processed
+            
+        Returns:
+            SkillExtractor instance
+        """
         extractor = SkillExtractor()
-        processed = []
         
-        # Estimate processing time
+        # Estimate processing time; papers share requests in chunks
         if extractor.model:
-            estimated_time = len(raw_data) * extractor.request_delay
+            estimated_time = -(-paper_count // max(settings.LLM_PAPER_BATCH_SIZE, 1)) * extractor.request_delay
             log.info(f"Estimated processing time: {estimated_time:.0f}s (~{estimated_time/60:.1f} minutes)")
         else:
             log.warning("LLM not available - using basic keyword extraction only")
         
-        for i, paper in enumerate(raw_data, 1):
-            try:
-                paper_id = hashlib.md5(paper['id'].encode()).hexdigest()
-                
-                # Basic keyword extraction (fast, always available)
-                text = f"{paper['title']} {paper['abstract']}"
-                basic_skills = self.extract_skills(text)
-                
-                # LLM-based detailed extraction (slower, more accurate)
-                detailed_skills = await extractor.extract_from_paper(
-                    paper['title'],
-                    paper['abstract']
-                )
-                
-                # Format publication date
-                pub_date = paper['published_date']
-                if hasattr(pub_date, 'isoformat'):
-                    pub_date_str = pub_date.isoformat()
-                else:
-                    pub_date_str = str(pub_date)
-                
-                processed.append({
-                    'id': paper_id,
-                    'title': paper['title'],
-                    'abstract': paper['abstract'][:500],
-                    'authors': ', '.join(paper['authors'][:5]),
-                    'published_date': pub_date_str,
-                    'categories': paper['categories'],
-                    'url': paper['pdf_url'],
-                    'source': 'arxiv',
-                    'extracted_skills': basic_skills,
-                    'detailed_skills': detailed_skills
-                })
-                
-                # Progress logging every 10 items
-                if i % 10 == 0 or i == len(raw_data):
-                    log.info(f"Processed {i}/{len(raw_data)} papers ({i*100//len(raw_data)}%)")
-                
-            except Exception as e:
-                log.error(f"Error processing paper {i}: {str(e)}")
-                continue
+        return extractor
+    
+    async def _process_chunk(self, extractor: SkillExtractor, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Extract skills for a chunk of raw papers with one LLM request
         
-        log.info(f"Successfully processed {len(processed)} papers with detailed extraction")
-        return processed
+        Args:
+            extractor: LLM skill extractor
+            papers: Raw papers from iter_papers
+            
+        Returns:
+            Processed papers, in input order
+        """
+        # LLM-based detailed extraction (slower, more accurate)
+        detailed = await extractor.extract_from_papers_batch(
+            [(paper['title'], paper['abstract']) for paper in papers]
+        )
+        return [self._process_paper(paper, skills) for paper, skills in zip(papers, detailed)]
+    
+    def _process_paper(self, paper: Dict[str, Any], detailed_skills: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert one raw paper into the stored format with extracted skills
+        
+        Args:
+            paper: Raw paper data from fetch_data
+            detailed_skills: LLM extraction result for the paper
+            
+        Returns:
+            Processed paper data
+        """
+        # entry_id is unique already; keep its short form (e.g. 2403.12345v1)
+        paper_id = paper['id'].rsplit('/', 1)[-1]
+        
+        # Basic keyword extraction (fast, always available)
+        text = f"{paper['title']} {paper['abstract']}"
+        basic_skills = self.extract_skills(text)
+        
+        # Format publication date
+        pub_date = paper['published_date']
+        if hasattr(pub_date, 'isoformat'):
+            pub_date_str = pub_date.isoformat()
+        else:
+            pub_date_str = str(pub_date)
+        
+        return {
+            'id': paper_id,
+            'title': paper['title'],
+            'abstract': paper['abstract'][:500],
+            'authors': ', '.join(paper['authors'][:5]),
+            'published_date': pub_date_str,
+            'categories': paper['categories'],
+            'url': paper['pdf_url'],
+            'source': 'arxiv',
+            'extracted_skills': basic_skills,
+            'detailed_skills': detailed_skills
+        }
     
     async def get_trending_topics(self, papers: List[Dict]) -> Dict[str, Any]:
         """
@@ -172,25 +390,12 @@ class ArxivScraper(BaseScraper):
         Returns:
             Trending topics analysis
         """
-        skill_counts = {}
-        category_counts = {}
-        
-        for paper in papers:
-            # Count basic skills
-            for skill in paper.get('extracted_skills', []):
-                skill_counts[skill] = skill_counts.get(skill, 0) + 1
-            
-            # Count categories
-            for category in paper.get('categories', []):
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        # Sort by frequency
-        trending_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)
-        trending_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
+        skill_counts = Counter(chain.from_iterable(p.get('extracted_skills', ()) for p in papers))
+        category_counts = Counter(chain.from_iterable(p.get('categories', ()) for p in papers))
         
         return {
-            'trending_skills': trending_skills[:10],
-            'trending_categories': trending_categories[:5],
+            'trending_skills': skill_counts.most_common(10),
+            'trending_categories': category_counts.most_common(5),
             'total_papers': len(papers),
             'analysis_date': datetime.now().isoformat()
         }
\ No newline at end of file
@@ -2,11 +2,25 @@
 Base scraper class with common functionality
 """
 
+import asyncio
+import re
+import numpy as np
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 from app.core.logging import log
 
+# Trend score weight per source; column order of the counts passed to calculate_trend_scores
+TREND_WEIGHTS = {
+    'papers': 0.3,
+    'github': 0.25,
+    'jobs': 0.35,
+    'reddit': 0.1
+}
+TREND_SOURCES = tuple(TREND_WEIGHTS)
+_TREND_WEIGHT_VECTOR = np.array([TREND_WEIGHTS[source] for source in TREND_SOURCES])
+
 
 class BaseScraper(ABC):
     """
@@ -31,6 +45,9 @@ class BaseScraper(ABC):
         'nlp', 'natural language processing', 'gan', 'diffusion', 'vae'
     ]
     
+    # Whole-word (optionally plural) match per skill; avoids hits like 'gan' inside 'organization'
+    SKILL_PATTERNS = {skill: re.compile(rf"\b{re.escape(skill)}s?\b") for skill in SKILLS_TO_TRACK}
+    
     def __init__(self, source_name: str):
         """
         Initialize base scraper
@@ -39,6 +56,8 @@ class BaseScraper(ABC):
             source_name: Name of the data source
         """
         self.source_name = source_name
+        # Serializes runs on a shared instance so rate-limit state isn't interleaved
+        self.lock = asyncio.Lock()
         log.info(f"Initializing {source_name} scraper")
     
     @abstractmethod
@@ -77,14 +96,38 @@ class BaseScraper(ABC):
         if not text:
             return []
         
-        text_lower = text.lower()
+        return self._extract_from_lower(text.lower())
+    
+    def _extract_from_lower(self, text_lower: str) -> List[str]:
+        """
+        Extract skills from text the caller has already lowercased
+        
+        Args:
+            text_lower: Lowercased text to analyze
+            
+        Returns:
+            List of found skills
+        """
+        return list(self._match_skills(text_lower))
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _match_skills(text_lower: str) -> Tuple[str, ...]:
+        """
+        Tracked skills found in already-lowercased text
+        
+        Cached because reruns, cross-posts and shared repo descriptions
+        repeat the same text; results are tuples so callers can't mutate them.
+        """
         found_skills = []
         
-        for skill in self.SKILLS_TO_TRACK:
-            if skill.lower() in text_lower:
+        for skill, pattern in BaseScraper.SKILL_PATTERNS.items():
+            # Cheap substring scan first; the boundary check starts at the first hit
+            position = text_lower.find(skill)
+            if position >= 0 and pattern.search(text_lower, position):
                 found_skills.append(skill)
         
-        return list(set(found_skills))
+        return tuple(found_skills)
     
     def calculate_trend_score(self, mentions: Dict[str, int]) -> float:
         """
@@ -101,20 +144,36 @@ class BaseScraper(ABC):
             return 0.0
         
         # Weighted score based on source importance
-        weights = {
-            'papers': 0.3,
-            'github': 0.25,
-            'jobs': 0.35,
-            'reddit': 0.1
-        }
-        
-        score = sum(mentions.get(k, 0) * v for k, v in weights.items())
+        score = sum(mentions.get(k, 0) * v for k, v in TREND_WEIGHTS.items())
         return round(score, 2)
     
+    @staticmethod
+    def calculate_trend_scores(counts: np.ndarray) -> np.ndarray:
+        """
+        Calculate trend scores for many skills at once
+        
+        Args:
+            counts: Mention counts shaped (n_skills, 4), columns in TREND_SOURCES order
+            
+        Returns:
+            Score per skill, rounded like calculate_trend_score
+        """
+        return np.round(np.asarray(counts, dtype=np.float64) @ _TREND_WEIGHT_VECTOR, 2)
+    
     async def run(self, **kwargs) -> Dict[str, Any]:
         """
         Run the scraper
         
+        Returns:
+            Scraping results
+        """
+        async with self.lock:
+            return await self._run(**kwargs)
+    
+    async def _run(self, **kwargs) -> Dict[str, Any]:
+        """
+        Fetch and process data (caller holds the scraper lock)
+        
         Returns:
             Scraping results
         """
@@ -2,13 +2,26 @@
 GitHub trending repositories scraper with LLM extraction
 """
 
+import asyncio
 import httpx
-from typing import List, Dict, Any
+import orjson
+import random
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from app.scrapers.base_scraper import BaseScraper
+from app.services.skill_extractor import SkillExtractor
 from app.core.config import settings
 from app.core.logging import log
 
+# Search queries whose ETag and results are kept for conditional requests
+ETAG_CACHE_SIZE = 32
+
+# Rate-limited (403/429) searches: retries, base backoff without headers, and longest wait
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 5.0
+MAX_RATE_LIMIT_WAIT = 60.0
+
 
 class GitHubScraper(BaseScraper):
     """
@@ -27,6 +40,68 @@ class GitHubScraper(BaseScraper):
             log.info("GitHub scraper initialized with authentication token")
         else:
             log.warning("GitHub scraper initialized without token - rate limits will be lower")
+        self._client: Optional[httpx.AsyncClient] = None
+        # Search query -> (ETag, items) of the last 200 response
+        self._etag_cache: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Shared HTTP client, so connections and TLS sessions are reused across calls
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _remember_etag(self, search_query: str, etag: Optional[str], repos: List[Dict[str, Any]]) -> None:
+        """Keep the ETag and items for a query, evicting the oldest entries"""
+        if not etag:
+            return
+        
+        self._etag_cache.pop(search_query, None)
+        self._etag_cache[search_query] = (etag, repos)
+        while len(self._etag_cache) > ETAG_CACHE_SIZE:
+            self._etag_cache.pop(next(iter(self._etag_cache)))
+    
+    @staticmethod
+    def _rate_limit_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited response
+        
+        Honors Retry-After and X-RateLimit-Reset, falling back to jittered
+        exponential backoff for a 429 without either header.
+        
+        Returns:
+            Delay in seconds, or None if the response should not be retried
+            (not rate limited, or the limit resets too far in the future)
+        """
+        if response.status_code not in (403, 429):
+            return None
+        
+        headers = response.headers
+        if headers.get('Retry-After', '').isdigit():
+            delay = float(headers['Retry-After'])
+        elif headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset', '').isdigit():
+            delay = max(0.0, int(headers['X-RateLimit-Reset']) - time.time())
+        elif response.status_code == 429:
+            delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+        else:
+            # A plain 403 is a permissions problem, not a rate limit
+            return None
+        
+        if delay > MAX_RATE_LIMIT_WAIT:
+            return None
+        return delay + random.uniform(0, 1)
     
     async def fetch_data(self, query: str = "machine learning", stars_min: int = 100) -> List[Dict[str, Any]]:
         """
@@ -51,32 +126,41 @@ class GitHubScraper(BaseScraper):
             search_query = f"{query} stars:>={stars_min} created:>{week_ago}"
             log.debug(f"GitHub search query: {search_query}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/search/repositories",
-                    headers=self.headers,
+            # Conditional request: an unchanged result comes back as an empty 304
+            cached = self._etag_cache.get(search_query)
+            for attempt in range(RATE_LIMIT_RETRIES + 1):
+                response = await self._get_client().get(
+                    "/search/repositories",
                     params={
                         'q': search_query,
                         'sort': 'stars',
                         'order': 'desc',
                         'per_page': 50
                     },
-                    timeout=30.0
+                    headers={'If-None-Match': cached[0]} if cached else None
                 )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    repos = data.get('items', [])
-                    log.info(f"Fetched {len(repos)} repositories from GitHub")
-                elif response.status_code == 403:
-                    log.error("GitHub API rate limit exceeded - add GITHUB_TOKEN to .env")
-                else:
-                    log.error(f"GitHub API error: {response.status_code}")
+                delay = self._rate_limit_delay(response, attempt)
+                if delay is None or attempt == RATE_LIMIT_RETRIES:
+                    break
+                log.warning(f"GitHub rate limited ({response.status_code}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            
+            if response.status_code == 304 and cached:
+                repos = cached[1]
+                log.info(f"GitHub search unchanged, reusing {len(repos)} cached repositories")
+            elif response.status_code == 200:
+                data = orjson.loads(response.content)
+                repos = data.get('items', [])
+                log.info(f"Fetched {len(repos)} repositories from GitHub")
+                self._remember_etag(search_query, response.headers.get('ETag'), repos)
+            elif response.status_code in (403, 429):
+                log.error("GitHub API rate limit exceeded - add GITHUB_TOKEN to .env")
+            else:
+                log.error(f"GitHub API error: {response.status_code}")
         
         except Exception as e:
-            log.error(f"Error fetching GitHub data: {str(e)}")
-            import traceback
-            log.error(traceback.format_exc())
+            log.exception(f"Error fetching GitHub data: {str(e)}")
         
         return repos
     
@@ -84,8 +168,6 @@ class GitHubScraper(BaseScraper):
         """
         Process raw repository data with LLM extraction
         """
-        from app.services.skill_extractor import SkillExtractor
-        
         if not raw_data:
             log.warning("No repos to process")
             return []
@@ -93,49 +175,63 @@ class GitHubScraper(BaseScraper):
         log.info(f"Processing {len(raw_data)} repos with LLM extraction")
         
         extractor = SkillExtractor()
-        processed = []
         
         # Estimate processing time
         if extractor.model:
             estimated_time = len(raw_data) * extractor.request_delay
             log.info(f"Estimated processing time: {estimated_time:.0f}s (~{estimated_time/60:.1f} minutes)")
         
-        for i, repo in enumerate(raw_data, 1):
+        # Overlap LLM calls; the extractor still spaces request starts for the rate limit
+        semaphore = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+        completed = 0
+        
+        async def process_repo(i: int, repo: Dict) -> Optional[Dict]:
+            nonlocal completed
             try:
+                # GitHub sends null for missing descriptions and topics
+                description = repo.get('description') or ''
+                topics = repo.get('topics') or []
+                
                 # Basic keyword extraction
-                text = f"{repo.get('name', '')} {repo.get('description', '')} {' '.join(repo.get('topics', []))}"
-                basic_skills = self.extract_skills(text)
+                text_lower = f"{repo['name']} {description} {' '.join(topics)}".lower()
+                basic_skills = self._extract_from_lower(text_lower)
                 
-                # LLM-based detailed extraction
-                detailed_skills = await extractor.extract_from_repo(
-                    repo['name'],
-                    repo.get('description', ''),
-                    repo.get('topics', [])
-                )
+                # LLM-based detailed extraction, unless keywords already cover the repo
+                if not description or 0 < settings.LLM_SKIP_MIN_BASIC_SKILLS <= len(basic_skills):
+                    detailed_skills = extractor._empty_repo_result()
+                else:
+                    async with semaphore:
+                        detailed_skills = await extractor.extract_from_repo(repo['name'], description, topics)
                 
-                processed.append({
+                processed_repo = {
                     'id': str(repo['id']),
                     'name': repo['name'],
                     'full_name': repo['full_name'],
-                    'description': repo.get('description', ''),
+                    'description': description,
                     'stars': repo['stargazers_count'],
                     'forks': repo['forks_count'],
                     'language': repo.get('language', 'Unknown'),
-                    'topics': repo.get('topics', []),
+                    'topics': topics,
                     'url': repo['html_url'],
                     'created_at': repo['created_at'],
                     'updated_at': repo['updated_at'],
                     'extracted_skills': basic_skills,
                     'detailed_skills': detailed_skills
-                })
-                
-                # Progress logging
-                if i % 10 == 0 or i == len(raw_data):
-                    log.info(f"Processed {i}/{len(raw_data)} repos ({i*100//len(raw_data)}%)")
+                }
                 
             except Exception as e:
                 log.error(f"Error processing repo {i}: {str(e)}")
-                continue
+                return None
+            
+            # Progress logging
+            completed += 1
+            if completed % 10 == 0 or completed == len(raw_data):
+                log.info(f"Processed {completed}/{len(raw_data)} repos ({completed*100//len(raw_data)}%)")
+            
+            return processed_repo
+        
+        results = await asyncio.gather(*(process_repo(i, repo) for i, repo in enumerate(raw_data, 1)))
+        processed = [repo for repo in results if repo is not None]
         
         log.info(f"Successfully processed {len(processed)} repos with detailed extraction")
         return processed
\ No newline at end of file
@@ -2,10 +2,14 @@
 Reddit ML community scraper
 """
 
+import asyncio
 import praw
+import threading
+from itertools import chain
 from typing import List, Dict, Any
 from datetime import datetime
 from app.scrapers.base_scraper import BaseScraper
+from app.services.skill_extractor import SkillExtractor
 from app.core.config import settings
 from app.core.logging import log
 
@@ -19,13 +23,26 @@ class RedditScraper(BaseScraper):
         super().__init__("Reddit")
         self.subreddits = ['MachineLearning', 'deeplearning', 'artificial', 'LocalLLaMA']
         self.reddit = None
+        # PRAW instances are not thread safe, so each fetch thread gets its own
+        self._local = threading.local()
         
         if settings.REDDIT_CLIENT_ID and settings.REDDIT_CLIENT_SECRET:
-            self.reddit = praw.Reddit(
-                client_id=settings.REDDIT_CLIENT_ID,
-                client_secret=settings.REDDIT_CLIENT_SECRET,
-                user_agent='ML-Career-Pulse/1.0'
-            )
+            self.reddit = self._create_client()
+    
+    def _create_client(self) -> praw.Reddit:
+        """Create a PRAW client from the configured credentials"""
+        return praw.Reddit(
+            client_id=settings.REDDIT_CLIENT_ID,
+            client_secret=settings.REDDIT_CLIENT_SECRET,
+            user_agent='ML-Career-Pulse/1.0'
+        )
+    
+    def _thread_client(self) -> praw.Reddit:
+        """PRAW client for the current thread, created on first use"""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = self._local.reddit = self._create_client()
+        return reddit
     
     async def fetch_data(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -44,21 +61,12 @@ class RedditScraper(BaseScraper):
             return posts
         
         try:
-            for subreddit_name in self.subreddits:
-                subreddit = self.reddit.subreddit(subreddit_name)
-                
-                # Get hot posts
-                for post in subreddit.hot(limit=limit):
-                    posts.append({
-                        'id': post.id,
-                        'title': post.title,
-                        'selftext': post.selftext,
-                        'subreddit': subreddit_name,
-                        'score': post.score,
-                        'num_comments': post.num_comments,
-                        'created_utc': post.created_utc,
-                        'url': f"https://reddit.com{post.permalink}"
-                    })
+            # PRAW blocks on HTTP, so fetch each subreddit in its own thread
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._fetch_subreddit, subreddit_name, limit)
+                for subreddit_name in self.subreddits
+            ))
+            posts = list(chain.from_iterable(results))
             
             log.info(f"Fetched {len(posts)} posts from Reddit")
             
@@ -67,29 +75,60 @@ class RedditScraper(BaseScraper):
         
         return posts
     
+    def _fetch_subreddit(self, subreddit_name: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Fetch hot posts from one subreddit (blocking)
+        
+        Args:
+            subreddit_name: Subreddit to read
+            limit: Number of posts to fetch
+            
+        Returns:
+            List of post data
+        """
+        subreddit = self._thread_client().subreddit(subreddit_name)
+        
+        return [
+            {
+                'id': post.id,
+                'title': post.title,
+                'selftext': post.selftext,
+                'subreddit': subreddit_name,
+                'score': post.score,
+                'num_comments': post.num_comments,
+                'created_utc': post.created_utc,
+                'url': f"https://reddit.com{post.permalink}"
+            }
+            for post in subreddit.hot(limit=limit)
+        ]
+    
     async def process_data(self, raw_data: List[Dict]) -> List[Dict]:
         """
         Process raw Reddit post data with LLM extraction
         """
-        from app.services.skill_extractor import SkillExtractor
-        
         log.info(f"Processing {len(raw_data)} Reddit posts with LLM extraction")
         extractor = SkillExtractor()
-        processed = []
         
-        for post in raw_data:
+        # Overlap LLM calls; the extractor still spaces request starts for the rate limit
+        semaphore = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+        
+        async def process_post(post: Dict) -> Dict:
             # Basic keyword extraction
             text = f"{post['title']} {post.get('selftext', '')}"
             basic_skills = self.extract_skills(text)
             
-            # LLM-based detailed extraction
-            detailed_skills = await extractor.extract_from_discussion(
-                post['title'],
-                post.get('selftext', ''),
-                'reddit'
-            )
+            # LLM-based detailed extraction, unless keywords already cover the post
+            if 0 < settings.LLM_SKIP_MIN_BASIC_SKILLS <= len(basic_skills):
+                detailed_skills = extractor._empty_discussion_result()
+            else:
+                async with semaphore:
+                    detailed_skills = await extractor.extract_from_discussion(
+                        post['title'],
+                        post.get('selftext', ''),
+                        'reddit'
+                    )
             
-            processed.append({
+            return {
                 'id': post['id'],
                 'title': post['title'],
                 'content': post.get('selftext', '')[:500],
@@ -101,7 +140,9 @@ class RedditScraper(BaseScraper):
                 'extracted_skills': basic_skills,
                 'detailed_skills': detailed_skills,
                 'engagement_score': post['score'] + (post['num_comments'] * 2)
-            })
+            }
+        
+        processed = list(await asyncio.gather(*(process_post(post) for post in raw_data)))
         
         log.info(f"Processed {len(processed)} posts with detailed extraction")
         return processed
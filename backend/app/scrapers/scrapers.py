@@ -2,20 +2,20 @@
 API endpoints for data scraping
 """
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Request
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
-from app.core.database import get_db
+from app.api.collect import store_papers
+from app.core.database import AsyncSessionLocal
 from app.core.logging import log
 from app.scrapers.arxiv_scraper import ArxivScraper
-from app.scrapers.github_scraper import GitHubScraper
-from app.scrapers.reddit_scraper import RedditScraper
-from app.models.models import Paper, GitHubRepo, SkillTrend
 
 router = APIRouter()
 
+# Outcome of the most recent background ArXiv run, reported by /status
+last_run: Optional[Dict[str, Any]] = None
+
 
 @router.get("/status")
 async def get_scraper_status():
@@ -26,51 +26,78 @@ async def get_scraper_status():
             "github": {"status": "ready", "description": "GitHub trending repos scraper"},
             "reddit": {"status": "ready", "description": "Reddit ML communities scraper"}
         },
-        "last_run": None,
+        "last_run": last_run,
         "next_scheduled": None
     }
 
 
 @router.post("/arxiv/run")
 async def run_arxiv_scraper(
+    request: Request,
     background_tasks: BackgroundTasks,
-    max_results: Optional[int] = 20,
-    db: Session = Depends(get_db)
+    max_results: Optional[int] = 20
 ):
-    """Run ArXiv scraper"""
+    """Queue an ArXiv scraper run; papers are fetched and saved in the background"""
+    background_tasks.add_task(_run_and_persist, request.app.state.arxiv_scraper, max_results)
+    log.info(f"Scheduled ArXiv scraper run via API: max_results={max_results}")
+    
+    return {
+        "status": "scheduled",
+        "max_results": max_results,
+        "timestamp": datetime.now(timezone.utc)
+    }
+
+
+async def _run_and_persist(scraper: ArxivScraper, max_results: int) -> None:
+    """
+    Run the ArXiv scraper and save papers with a dedicated session
+    
+    The request-scoped session is closed by the time this runs, so the
+    task opens its own. Papers go through the same writer as the collect
+    endpoints, so they reach the skill index and trend rollup too.
+    
+    Args:
+        scraper: Shared ArXiv scraper from app.state
+        max_results: Maximum number of papers to fetch
+    """
+    global last_run
+    started_at = datetime.now(timezone.utc)
+    
     try:
-        log.info("Starting ArXiv scraper via API")
+        log.info("Starting ArXiv scraper run")
         
-        scraper = ArxivScraper()
         result = await scraper.run(max_results=max_results)
         
-        papers_saved = 0
-        for paper_data in result.get('data', []):
-            existing = db.query(Paper).filter_by(id=paper_data['id']).first()
-            if not existing:
-                paper = Paper(
-                    id=paper_data['id'],
-                    title=paper_data['title'],
-                    abstract=paper_data['abstract'],
-                    authors=paper_data['authors'],
-                    published_date=datetime.fromisoformat(paper_data['published_date']),
-                    source=paper_data['source'],
-                    url=paper_data['url'],
-                    categories=paper_data['categories'],
-                    extracted_skills=paper_data['extracted_skills']
-                )
-                db.add(paper)
-                papers_saved += 1
+        # run() reports scraping failures in the result instead of raising
+        if result.get('error'):
+            last_run = {
+                "status": "error",
+                "error": result['error'],
+                "started_at": started_at,
+                "finished_at": datetime.now(timezone.utc)
+            }
+            return
         
-        db.commit()
+        papers_saved = papers_updated = 0
+        if result.get('data'):
+            async with AsyncSessionLocal() as db:
+                papers_saved, papers_updated = await store_papers(db, result['data'])
         
-        return {
+        last_run = {
             "status": "success",
             "papers_fetched": result.get('item_count', 0),
             "papers_saved": papers_saved,
-            "timestamp": result.get('timestamp')
+            "papers_updated": papers_updated,
+            "started_at": started_at,
+            "finished_at": datetime.now(timezone.utc)
         }
         
     except Exception as e:
-        log.error(f"Error in ArXiv scraper endpoint: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        log.error(f"Error in ArXiv scraper run: {str(e)}")
+        last_run = {
+            "status": "error",
+            "error": str(e),
+            "started_at": started_at,
+            "finished_at": datetime.now(timezone.utc)
+        }
+
@@ -0,0 +1,239 @@
+"""
+Content-hash cache for LLM extraction results
+Stored in Redis, with a small in-process LRU used alongside it and when Redis is unavailable.
+An in-process SimHash index lets near-duplicate items (reposts, mirrors) reuse a result too;
+its candidates are confirmed by word overlap before a result is reused.
+"""
+
+import re
+import time
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+from app.core.cache import cache_get, cache_set
+from app.core.config import settings
+
+# Results kept in the in-process LRU
+MEMORY_CACHE_SIZE = 2048
+
+# Items with fewer words are not fingerprinted; SimHash is unreliable on short text
+SIMHASH_MIN_WORDS = 20
+
+# Fingerprint bands indexed for lookup; items sharing any band are candidates
+SIMHASH_BANDS = 8
+SIMHASH_BAND_BITS = 64 // SIMHASH_BANDS
+
+# Candidates further apart are not compared word by word; unrelated texts differ in about 32 bits
+SIMHASH_CANDIDATE_MAX_BITS = 16
+
+_memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+# Cache key -> (near-duplicate scope, fingerprint, sorted word hashes), oldest first,
+# plus a band index over it
+_fingerprints: "OrderedDict[str, Tuple[str, int, np.ndarray]]" = OrderedDict()
+_bands: Dict[Tuple[str, int, int], Set[str]] = {}
+
+
+def cache_key(model_name: str, source_type: str, prompt: str) -> str:
+    """
+    Cache key for one extraction
+    
+    Hashing the full prompt covers both the item's content and the prompt
+    template, so editing a template never serves results from the old one.
+    
+    Args:
+        model_name: Model that produces the result
+        source_type: Item type (paper, repo, discussion, job)
+        prompt: Prompt sent to the model
+    
+    Returns:
+        Key of the form llm:{source_type}:{model_name}:{digest}
+    """
+    digest = hashlib.sha256(prompt.encode()).hexdigest()
+    return f"llm:{source_type}:{model_name}:{digest}"
+
+
+async def get(key: str, similar_to: str = None, group: str = "") -> Optional[Any]:
+    """
+    Look up a cached extraction, in memory first and then in Redis
+    
+    Args:
+        key: Key from cache_key()
+        similar_to: Item body; on an exact miss, reuse the result of an item with a near-identical body
+        group: Text a near-duplicate must match exactly (e.g. the item's title)
+    
+    Returns:
+        Cached result, or None on a miss
+    """
+    value = await _get_exact(key)
+    if value is not None or not similar_to:
+        return value
+    
+    similar_key = _find_similar(_scope(key, group), similar_to)
+    if similar_key is None:
+        return None
+    return await _get_exact(similar_key)
+
+
+async def _get_exact(key: str) -> Optional[Any]:
+    """Look up one key, in memory first and then in Redis"""
+    entry = _memory.get(key)
+    if entry is not None:
+        expires_at, value = entry
+        if expires_at > time.monotonic():
+            _memory.move_to_end(key)
+            return value
+        del _memory[key]
+    
+    value = await cache_get(key)
+    if value is not None:
+        _remember(key, value, settings.LLM_CACHE_TTL_SECONDS)
+    return value
+
+
+async def put(key: str, value: Any, ttl: int = None, similar_to: str = None, group: str = "") -> None:
+    """
+    Store a successful extraction
+    
+    Args:
+        key: Key from cache_key()
+        value: JSON-serializable result
+        ttl: Expiry in seconds (default LLM_CACHE_TTL_SECONDS)
+        similar_to: Item body to fingerprint so near-duplicates can find this result
+        group: Text a near-duplicate must match exactly (e.g. the item's title)
+    """
+    ttl = ttl or settings.LLM_CACHE_TTL_SECONDS
+    _remember(key, value, ttl)
+    if similar_to:
+        _remember_fingerprint(_scope(key, group), key, similar_to)
+    await cache_set(key, value, ttl)
+
+
+def _remember(key: str, value: Any, ttl: int) -> None:
+    """Put a result in the in-process LRU, evicting the oldest when full"""
+    _memory[key] = (time.monotonic() + ttl, value)
+    _memory.move_to_end(key)
+    if len(_memory) > MEMORY_CACHE_SIZE:
+        _memory.popitem(last=False)
+
+
+def word_hashes(text: str) -> Optional[np.ndarray]:
+    """
+    Sorted 64-bit hashes of a text's distinct words, ignoring case and punctuation
+    
+    Args:
+        text: Item text
+    
+    Returns:
+        Hashes, or None if the text is too short to fingerprint reliably
+    """
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < SIMHASH_MIN_WORDS:
+        return None
+    
+    return np.unique(np.array(
+        [int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "little") for word in set(words)],
+        dtype="<u8"
+    ))
+
+
+def simhash(hashes: np.ndarray) -> int:
+    """
+    64-bit SimHash over word hashes from word_hashes()
+    
+    Texts that differ only in a few words get fingerprints a few bits
+    apart; unrelated texts differ in about 32.
+    """
+    # Each bit of the fingerprint is the majority vote of that bit across words
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    votes = bits.sum(axis=0) * 2 > len(hashes)
+    return int(np.packbits(votes, bitorder="little").view("<u8")[0])
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Jaccard similarity of two word hash sets from word_hashes()"""
+    shared = len(np.intersect1d(first, second, assume_unique=True))
+    return shared / (len(first) + len(second) - shared)
+
+
+def _scope(key: str, group: str = "") -> str:
+    """
+    Near-duplicates only match within a source type, model and group
+    
+    The group (normalized for case and spacing) is hashed so long titles
+    don't bloat the index keys.
+    """
+    group_digest = hashlib.blake2b(" ".join(group.lower().split()).encode(), digest_size=8).hexdigest()
+    return f"{key.rsplit(':', 1)[0]}:{group_digest}"
+
+
+def _band_keys(scope: str, fingerprint: int) -> List[Tuple[str, int, int]]:
+    """Band index entries for a fingerprint"""
+    mask = (1 << SIMHASH_BAND_BITS) - 1
+    return [
+        (scope, band, (fingerprint >> (band * SIMHASH_BAND_BITS)) & mask)
+        for band in range(SIMHASH_BANDS)
+    ]
+
+
+def _find_similar(scope: str, text: str) -> Optional[str]:
+    """
+    Cache key of the most similar remembered item, if its words overlap by LLM_NEAR_DUPLICATE_MIN_SIMILARITY
+    
+    SimHash bands only narrow the search; the word overlap decides. A close
+    fingerprint alone is not enough, since texts sharing most of their words
+    (e.g. boilerplate) can land within a few bits of each other.
+    """
+    min_similarity = settings.LLM_NEAR_DUPLICATE_MIN_SIMILARITY
+    if min_similarity <= 0:
+        return None
+    
+    hashes = word_hashes(text)
+    if hashes is None:
+        return None
+    fingerprint = simhash(hashes)
+    
+    candidates = {key for band_key in _band_keys(scope, fingerprint) for key in _bands.get(band_key, ())}
+    best_key, best_similarity = None, min_similarity
+    for key in candidates:
+        _, other_fingerprint, other_hashes = _fingerprints[key]
+        if (other_fingerprint ^ fingerprint).bit_count() > SIMHASH_CANDIDATE_MAX_BITS:
+            continue
+        score = similarity(hashes, other_hashes)
+        if score >= best_similarity:
+            best_key, best_similarity = key, score
+    return best_key
+
+
+def _remember_fingerprint(scope: str, key: str, text: str) -> None:
+    """Index an item's fingerprint under its cache key, evicting the oldest when full"""
+    if settings.LLM_NEAR_DUPLICATE_MIN_SIMILARITY <= 0:
+        return
+    
+    hashes = word_hashes(text)
+    if hashes is None:
+        return
+    fingerprint = simhash(hashes)
+    
+    _forget_fingerprint(key)
+    _fingerprints[key] = (scope, fingerprint, hashes)
+    for band_key in _band_keys(scope, fingerprint):
+        _bands.setdefault(band_key, set()).add(key)
+    
+    if len(_fingerprints) > MEMORY_CACHE_SIZE:
+        _forget_fingerprint(next(iter(_fingerprints)))
+
+
+def _forget_fingerprint(key: str) -> None:
+    """Drop a key from the fingerprint index"""
+    entry = _fingerprints.pop(key, None)
+    if entry is None:
+        return
+    
+    for band_key in _band_keys(*entry[:2]):
+        keys = _bands.get(band_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del _bands[band_key]
@@ -4,11 +4,268 @@ Handles rate limiting, retries, and multiple source types
 """
 
 import google.generativeai as genai
-from typing import List, Dict, Any, Optional
+from google.api_core import exceptions as google_exceptions
+from tqdm import tqdm
+from pydantic import ValidationError
+from typing import List, AsyncIterator, Callable, Deque, Dict, Any, Optional, Tuple, Type
 from app.core.config import settings
 from app.core.logging import log
-import json
+from app.services import llm_cache
+from app.services.skill_schemas import DiscussionSkills, ExtractionResult, JobSkills, PaperSkills, RepoSkills
+import re
+import orjson
+import time
+import random
 import asyncio
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+
+# Error text marking LLM failures worth retrying (rate limits, overload, timeouts)
+RETRYABLE_ERROR_RE = re.compile(r"429|quota|rate[ _-]?limit|503|deadline|unavailable", re.IGNORECASE)
+
+# Quota error text marking an exhausted daily quota; retrying won't help until it resets
+DAILY_QUOTA_ERROR_RE = re.compile(r"quota.*(daily|per[ _-]?day)|PerDay", re.IGNORECASE | re.DOTALL)
+
+# Seconds to stop calling a model after it reports an exhausted daily quota
+QUOTA_RETRY_AFTER = 3600
+
+# Upper bound in seconds for the exponential retry backoff
+MAX_RETRY_DELAY = 60
+
+# Whether genai.configure has run; calling it again drops the SDK's pooled clients
+_genai_configured = False
+
+# GenerativeModel per model name, shared by every SkillExtractor
+_models: Dict[str, Any] = {}
+
+# Seconds the requests_per_minute budget applies to
+RATE_LIMIT_WINDOW = 60.0
+
+# Start times (past and reserved) of recent LLM requests per model name, oldest first
+_request_starts: Dict[str, Deque[float]] = {}
+
+# Monotonic time until which each model name is skipped for an exhausted daily quota
+_quota_exhausted_until: Dict[str, float] = {}
+
+# Extractions currently running, keyed by method, model and arguments (see _single_flight)
+_in_flight: Dict[str, asyncio.Task] = {}
+
+# Characters of discussion content / job description sent to the LLM
+DISCUSSION_CONTENT_LIMIT = 1000
+JOB_DESCRIPTION_LIMIT = 1500
+
+# Items whose title and body together are shorter are not worth an LLM request
+MIN_INPUT_CHARS = 20
+
+# Markdown code fence (with optional language tag) wrapped around an LLM response
+CODE_FENCE_RE = re.compile(r"^```[^\n]*\n?|\n?```\s*$")
+
+# Trailing comma before a closing bracket (common LLM error)
+TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
+# Skill name variations (lowercase) mapped to canonical names
+SKILL_STANDARDIZATION = {
+    # NLP variations
+    "natural language processing": "NLP",
+    "natural language processing (nlp)": "NLP",
+    "nlp": "NLP",
+    
+    # LLM variations
+    "large language models": "Large Language Models",
+    "large language models (llms)": "Large Language Models",
+    "llms": "Large Language Models",
+    
+    # Computer Vision
+    "computer vision": "Computer Vision",
+    "cv": "Computer Vision",
+    
+    # Reinforcement Learning
+    "reinforcement learning": "Reinforcement Learning",
+    "rl": "Reinforcement Learning",
+    
+    # Machine Learning
+    "machine learning": "Machine Learning",
+    "ml": "Machine Learning",
+    
+    # Deep Learning
+    "deep learning": "Deep Learning",
+    "dl": "Deep Learning",
+    
+    # Architecture names
+    "transformer architecture": "Transformer Architecture",
+    "transformers": "Transformer Architecture",
+}
+
+# Generic suffixes removed from skill names that have no direct match
+SKILL_SUFFIX_RE = re.compile(
+    r" (?:" + "|".join(re.escape(suffix) for suffix in ("models", "(nlp)", "(llms)", "(cv)", "(rl)", "(ml)")) + r")$",
+    re.IGNORECASE
+)
+
+# Prompt for research papers; filled with title and abstract
+PAPER_PROMPT = """Analyze this ML/AI research paper and extract ONLY marketable, learnable skills.
+
+    Title: {title}
+    Abstract: {abstract}
+
+    Focus on skills that:
+    - Can be learned by ML engineers/researchers
+    - Are relevant to job market
+    - Are transferable across projects
+    - Represent real tools, frameworks, or techniques
+
+    Extract and return ONLY a JSON object:
+
+    {{
+    "core_frameworks": ["PyTorch", "TensorFlow", "JAX"],
+    "ml_techniques": ["Transformer architecture", "Reinforcement Learning", "Fine-tuning"],
+    "application_areas": ["Computer Vision", "NLP", "Time Series"],
+    "programming_skills": ["Python", "CUDA", "Distributed Training"],
+    "emerging_trends": ["Mixture of Experts", "Diffusion Models"]
+    }}
+
+    Rules:
+    - Use STANDARD names (e.g., "PyTorch" not "PyTorch 2.0")
+    - Focus on GENERAL techniques (e.g., "Knowledge Distillation" not "GRACE score")
+    - Include WIDELY-USED tools only
+    - Skip paper-specific datasets/models unless they're industry-standard
+    - Emerging trends = techniques gaining traction but not yet mainstream
+
+    Return ONLY valid JSON. No explanations.
+    """
+
+# Prompt for several research papers at once; filled with count and the joined PAPER_BATCH_ENTRY blocks
+PAPER_BATCH_PROMPT = """Analyze these {count} ML/AI research papers and extract ONLY marketable, learnable skills from each.
+
+{papers}
+
+Focus on skills that:
+- Can be learned by ML engineers/researchers
+- Are relevant to job market
+- Are transferable across projects
+- Represent real tools, frameworks, or techniques
+
+Return ONLY a JSON array with exactly {count} objects, one per paper in the order given, each like:
+
+{{
+"core_frameworks": ["PyTorch", "TensorFlow", "JAX"],
+"ml_techniques": ["Transformer architecture", "Reinforcement Learning", "Fine-tuning"],
+"application_areas": ["Computer Vision", "NLP", "Time Series"],
+"programming_skills": ["Python", "CUDA", "Distributed Training"],
+"emerging_trends": ["Mixture of Experts", "Diffusion Models"]
+}}
+
+Rules:
+- Use STANDARD names (e.g., "PyTorch" not "PyTorch 2.0")
+- Focus on GENERAL techniques (e.g., "Knowledge Distillation" not "GRACE score")
+- Include WIDELY-USED tools only
+- Skip paper-specific datasets/models unless they're industry-standard
+- Emerging trends = techniques gaining traction but not yet mainstream
+
+Return ONLY valid JSON. No explanations.
+"""
+
+# One paper inside PAPER_BATCH_PROMPT
+PAPER_BATCH_ENTRY = """Paper {number}:
+Title: {title}
+Abstract: {abstract}"""
+
+# Prompt for GitHub repositories; filled with name, description and topics_str
+REPO_PROMPT = """Analyze this GitHub repository and extract detailed information.
+
+Repository Name: {name}
+Description: {description}
+Topics: {topics_str}
+
+Extract and return a JSON object with these fields:
+1. "tech_stack": Technologies and languages (e.g., ["Python 3.11", "FastAPI", "PostgreSQL"])
+2. "ml_frameworks": ML frameworks (e.g., ["PyTorch", "TensorFlow", "scikit-learn"])
+3. "tools": Development tools (e.g., ["Docker", "Kubernetes", "MLflow"])
+4. "use_cases": What the project does (e.g., ["text generation", "image classification"])
+5. "target_audience": Who would use this (e.g., ["ML researchers", "data scientists"])
+6. "key_features": Notable features (max 3 items)
+
+Return ONLY valid JSON with arrays for each field. If nothing found, use empty array [].
+"""
+
+# Prompt for discussions; filled with source, title and truncated content
+DISCUSSION_PROMPT = """Analyze this {source} discussion about ML/AI and extract information.
+
+Title: {title}
+
+Content: {content}
+
+Extract and return a JSON object with these fields:
+1. "mentioned_tools": Tools/frameworks people are discussing (e.g., ["LangChain", "Ollama"])
+2. "problems_discussed": Problems or challenges mentioned (e.g., ["GPU memory issues", "fine-tuning cost"])
+3. "solutions_suggested": Solutions or approaches suggested (e.g., ["use quantization", "try LoRA"])
+4. "trending_topics": Hot topics in this discussion (e.g., ["local LLMs", "open source models"])
+5. "sentiment": Overall sentiment ("positive", "negative", "neutral", "mixed")
+
+Return ONLY valid JSON with arrays for each field. If nothing found, use empty array [].
+"""
+
+# Prompt for job postings; filled with title, company and truncated description
+JOB_PROMPT = """Analyze this ML/AI job posting and extract detailed requirements.
+
+Job Title: {title}
+Company: {company}
+Description: {description}
+
+Extract and return a JSON object with these fields:
+1. "required_skills": Must-have skills (e.g., ["Python", "PyTorch", "5+ years ML experience"])
+2. "preferred_skills": Nice-to-have skills (e.g., ["AWS", "MLflow", "PhD"])
+3. "tools": Specific tools mentioned (e.g., ["Docker", "Kubernetes", "Git"])
+4. "role_type": Type of role (e.g., "ML Engineer", "Research Scientist", "Data Scientist")
+5. "seniority": Level (e.g., "Senior", "Mid-level", "Junior", "Lead")
+6. "focus_areas": Main focus (e.g., ["NLP", "Computer Vision", "MLOps"])
+
+Return ONLY valid JSON with arrays for each field. If nothing found, use empty array [].
+"""
+
+
+def _single_flight(method):
+    """
+    Let concurrent identical extractions share one call
+    
+    The GitHub and Reddit scrapers can surface the same item from several
+    queries at once. Each call misses the result cache, because none has
+    finished yet, so each would send its own LLM request. Duplicates
+    instead await the task already running. It is shielded, so a
+    cancelled caller does not cancel it for the others.
+    """
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        key = f"{method.__name__}:{self.model_name}:{orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS).decode()}"
+        
+        task = _in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            _in_flight[key] = task
+            task.add_done_callback(lambda _: _in_flight.pop(key, None))
+        return await asyncio.shield(task)
+    
+    return wrapper
+
+
+class BatchShapeError(ValueError):
+    """A batched response parsed, but doesn't hold one result per paper"""
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """How to extract one source type: prompt, response schema and fallback result"""
+    template: str
+    schema: Type[ExtractionResult]
+    # Prompt fields a near-duplicate must match exactly; the first is the item's title
+    key_fields: Tuple[str, ...]
+    # Prompt field that must hold text for the item to be sent; near-duplicates are matched on it
+    body_field: str
+    # Unbound SkillExtractor method returning the empty result
+    empty: Callable[[Any], Dict[str, Any]]
+    # Canonicalize skill names in every list (papers feed the skill index directly)
+    normalize_names: bool = False
 
 
 class SkillExtractor:
@@ -30,6 +287,13 @@ class SkillExtractor:
         Args:
             model_name: Model to use (default: gemini-2.5-flash for better rate limits)
         """
+        global _genai_configured
+        
+        self.model_name = model_name
+        
+        # Counters over this extractor's lifetime, e.g. items skipped as too short
+        self.stats: Dict[str, int] = {"skipped_empty": 0}
+        
         if not settings.GEMINI_API_KEY:
             log.warning("GEMINI_API_KEY not found - skill extraction will be limited to basic keywords")
             self.model = None
@@ -38,8 +302,14 @@ class SkillExtractor:
             return
             
         try:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel(model_name)
+            # Share one configured client and model per process, so every extractor
+            # reuses the same connection and draws on the same rate limit
+            if not _genai_configured:
+                genai.configure(api_key=settings.GEMINI_API_KEY)
+                _genai_configured = True
+            if model_name not in _models:
+                _models[model_name] = genai.GenerativeModel(model_name)
+            self.model = _models[model_name]
             
             # Rate limiting configuration
             # gemini-2.5-flash: 15 req/min free tier
@@ -56,145 +326,355 @@ class SkillExtractor:
             self.requests_per_minute = 0
             self.request_delay = 0
     
-    def _clean_json_response(self, text: str) -> str:
+    async def _wait_for_rate_limit(self) -> None:
+        """
+        Allow at most requests_per_minute request starts in any 60 second window
+        
+        A batch can use the whole per-minute budget at once instead of
+        waiting request_delay before every call. Each caller reserves its
+        start time before sleeping, so concurrent callers never oversubscribe
+        the window. Starts are tracked per model name, so all extractors
+        (scrapers, API endpoints) using the same model and key share one quota.
+        """
+        starts = _request_starts.setdefault(self.model_name, deque())
+        now = time.monotonic()
+        while starts and starts[0] <= now - RATE_LIMIT_WINDOW:
+            starts.popleft()
+        
+        # Window full: start once the request requests_per_minute places back is a window old
+        if len(starts) < self.requests_per_minute:
+            start_at = now
+        else:
+            start_at = starts[-self.requests_per_minute] + RATE_LIMIT_WINDOW
+        starts.append(start_at)
+        
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+    
+    def _quota_exhausted(self) -> bool:
+        """Whether this model's daily quota was recently reported exhausted"""
+        return time.monotonic() < _quota_exhausted_until.get(self.model_name, 0.0)
+    
+    def _mark_quota_exhausted(self, error: Exception) -> None:
+        """Stop calling this model for a while; every request would fail until the quota resets"""
+        if self._quota_exhausted():
+            return
+        _quota_exhausted_until[self.model_name] = time.monotonic() + QUOTA_RETRY_AFTER
+        log.error(f"Daily LLM quota exhausted for {self.model_name}, skipping extraction for {QUOTA_RETRY_AFTER}s: {str(error)}")
+    
+    @staticmethod
+    def _is_daily_quota(error: Exception) -> bool:
+        """
+        Whether an LLM failure reports an exhausted daily quota
+        
+        Only the API's quota errors count; parse errors quote the response
+        text, which may say anything.
+        """
+        return isinstance(error, google_exceptions.ResourceExhausted) and DAILY_QUOTA_ERROR_RE.search(str(error)) is not None
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Whether an LLM failure is worth retrying
+        
+        Transient API errors (rate limit, overload, timeout) are, and so is
+        malformed or mis-shaped JSON since the next response may be well-formed.
+        """
+        if isinstance(error, (orjson.JSONDecodeError, ValidationError)):
+            return True
+        return RETRYABLE_ERROR_RE.search(str(error)) is not None
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter for the given zero-based attempt"""
+        return min(MAX_RETRY_DELAY, 2 ** attempt) + random.uniform(0, 1)
+    
+    async def _call_with_retry(
+        self,
+        prompt: str,
+        parse: Callable[[str], Any],
+        label: str,
+        retry_count: int = 3,
+        passthrough: Tuple[type, ...] = ()
+    ) -> Optional[Any]:
+        """
+        Send a prompt and parse the response, retrying transient failures with backoff
+        
+        Args:
+            prompt: Prompt to send
+            parse: Turns the response text into a result; raising counts as a failed attempt
+            label: Item description for log messages
+            retry_count: Attempts before giving up
+            passthrough: Exception types from parse raised to the caller instead
+            
+        Returns:
+            Parsed result, or None if the request failed, every attempt did,
+            or the daily quota is exhausted
+        """
+        for attempt in range(retry_count):
+            try:
+                # Every attempt, retries included, counts against the rate limit
+                await self._wait_for_rate_limit()
+                
+                # Another request may have used up the daily quota while this one waited
+                if self._quota_exhausted():
+                    return None
+                
+                response = await self.model.generate_content_async(prompt)
+                return parse(response.text)
+                
+            except passthrough:
+                raise
+            except Exception as e:
+                error_str = str(e)
+                
+                if self._is_daily_quota(e):
+                    self._mark_quota_exhausted(e)
+                    return None
+                if not self._is_retryable(e):
+                    log.error(f"LLM extraction failed for {label}: {error_str}")
+                    return None
+                if attempt == retry_count - 1:
+                    log.error(f"LLM extraction gave up after {retry_count} attempts for {label}")
+                    return None
+                
+                wait_time = self._backoff_delay(attempt)
+                log.warning(f"Transient LLM error for {label}, retrying in {wait_time:.1f}s: {error_str}")
+                await asyncio.sleep(wait_time)
+        
+        return None
+    
+    def _clean_json_response(self, text: str, brackets: str = '{}') -> str:
         """
         Remove markdown code blocks and fix common JSON issues
         
         Args:
             text: Raw LLM response text
+            brackets: Delimiters of the expected JSON value ('{}' for an object, '[]' for an array)
             
         Returns:
             Cleaned JSON string
         """
-        text = text.strip()
-        
-        # Remove markdown code blocks
-        if text.startswith('```'):
-            lines = text.split('\n')
-            if lines[0].startswith('```'):
-                lines = lines[1:]
-            if lines and lines[-1].startswith('```'):
-                lines = lines[:-1]
-            text = '\n'.join(lines)
-        
-        # Remove 'json' language identifier
-        if text.startswith('json'):
-            text = text[4:].strip()
-        
-        # Extract JSON object if there's extra text
-        if '{' in text and '}' in text:
-            start = text.index('{')
-            end = text.rindex('}') + 1
+        # Extract the JSON value, which also drops code fences and any extra text
+        start = text.find(brackets[0])
+        end = text.rfind(brackets[1]) + 1
+        if start != -1 and end > start:
             text = text[start:end]
+        else:
+            # Not found; remove markdown code blocks and a bare 'json' language identifier
+            text = CODE_FENCE_RE.sub('', text.strip()).strip()
+            if text.startswith('json'):
+                text = text[4:].strip()
+        
+        return TRAILING_COMMA_RE.sub(r'\1', text)
+    
+    async def _extract(self, source_type: str, label: str, retry_count: int = 3, **fields: Any) -> Dict[str, Any]:
+        """
+        Extract skills from one item of any source type
+        
+        Args:
+            source_type: Key of _SOURCES (paper, repo, discussion, job)
+            label: Item description for log messages
+            retry_count: Number of retries on rate limit errors
+            **fields: Values for the source's prompt template
+            
+        Returns:
+            Dictionary with structured skill information
+        """
+        spec = self._SOURCES[source_type]
+        if not self.model:
+            log.debug("LLM not available, returning empty result")
+            return spec.empty(self)
+        if self._too_short(source_type, fields):
+            log.debug(f"Input too short, skipping LLM extraction for {label}")
+            return spec.empty(self)
+        
+        # Reruns and reposts see the same items again; reuse their earlier extraction
+        prompt, cache_key, body, group = self._cache_identity(source_type, **fields)
+        cached_result = await llm_cache.get(cache_key, similar_to=body, group=group)
+        if cached_result is not None:
+            log.debug(f"LLM extraction cache hit for {label}")
+            return cached_result
+        
+        extracted = await self._call_with_retry(
+            prompt,
+            lambda text: self._parse_result(source_type, orjson.loads(self._clean_json_response(text))),
+            label,
+            retry_count
+        )
+        if extracted is None:
+            return spec.empty(self)
+        
+        log.debug(f"LLM extraction successful for {label}")
+        await llm_cache.put(cache_key, extracted, similar_to=body, group=group)
+        return extracted
+    
+    def _too_short(self, source_type: str, fields: Dict[str, Any]) -> bool:
+        """
+        Whether an item has too little text to be worth a request, counting it in stats if so
+        
+        Scraped items often have an empty body; the LLM gets nothing to
+        extract from them, so the request would only spend quota.
+        """
+        spec = self._SOURCES[source_type]
+        title = str(fields[spec.key_fields[0]] or '').strip()
+        body = str(fields[spec.body_field] or '').strip()
+        if body and len(title) + len(body) >= MIN_INPUT_CHARS:
+            return False
+        
+        self.stats["skipped_empty"] += 1
+        return True
+    
+    def _cache_identity(self, source_type: str, **fields: Any) -> Tuple[str, str, str, str]:
+        """
+        Prompt, cache key and near-duplicate identity for one item
         
-        # Fix trailing commas (common LLM error)
-        import re
-        text = re.sub(r',(\s*[}\]])', r'\1', text)
+        Only the body is fingerprinted; text shared across unrelated items
+        (a company's boilerplate, a title) would otherwise make them look
+        alike. The key fields must match exactly instead.
         
-        return text
+        Returns:
+            (prompt, cache key, body, near-duplicate group) tuple
+        """
+        spec = self._SOURCES[source_type]
+        prompt = spec.template.format(**fields)
+        cache_key = llm_cache.cache_key(self.model_name, source_type, prompt)
+        body = str(fields[spec.body_field] or '')
+        group = "\n".join(str(fields[name] or '') for name in spec.key_fields)
+        return prompt, cache_key, body, group
     
+    def _parse_result(self, source_type: str, extracted: Any) -> Dict[str, Any]:
+        """
+        Validate a result against its source's schema
+        
+        Raises:
+            ValidationError: If the response is not an object
+        """
+        spec = self._SOURCES[source_type]
+        extracted = spec.schema.model_validate(extracted).model_dump()
+        if not spec.normalize_names:
+            return extracted
+        
+        # Normalize skill names once here so stored skills are canonical
+        return {key: self.normalize_skill_list(values) for key, values in extracted.items()}
+    
+    @_single_flight
     async def extract_from_paper(self, title: str, abstract: str, retry_count: int = 3) -> Dict[str, Any]:
         """
         Extract MARKETABLE skills from research paper
         Focus on skills that are learnable and relevant to job market
         """
+        return await self._extract("paper", f"paper: {title[:50]}...", retry_count, title=title, abstract=abstract)
+    
+    async def extract_from_papers_batch(self, papers: List[Tuple[str, str]], retry_count: int = 3) -> List[Dict[str, Any]]:
+        """
+        Extract skills for several papers with a single LLM request
+        
+        Cached and too-short papers are not sent, and each result is cached as if it came
+        from extract_from_paper. If a response does not hold one result per
+        paper, the batch is split in half and retried, down to single papers.
+        
+        Args:
+            papers: (title, abstract) pairs
+            retry_count: Number of retries on transient errors
+            
+        Returns:
+            One result per paper, in order
+        """
         if not self.model:
-            return self._empty_paper_result()
+            return [self._empty_paper_result() for _ in papers]
+        
+        results: List[Optional[Dict[str, Any]]] = []
+        for title, abstract in papers:
+            if self._too_short("paper", {"title": title, "abstract": abstract}):
+                results.append(self._empty_paper_result())
+                continue
+            _, cache_key, body, group = self._cache_identity("paper", title=title, abstract=abstract)
+            results.append(await llm_cache.get(cache_key, similar_to=body, group=group))
+        
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            extracted = await self._extract_uncached_papers([papers[i] for i in missing], retry_count)
+            for i, result in zip(missing, extracted):
+                results[i] = result
+        
+        return results
+    
+    async def _extract_uncached_papers(self, papers: List[Tuple[str, str]], retry_count: int) -> List[Dict[str, Any]]:
+        """
+        Send papers in one request, halving the batch whenever the response can't be split
         
-        await asyncio.sleep(self.request_delay)
+        Only a response with the wrong number of results is split. Any other
+        failure (quota, API error, blocked response) would repeat for the
+        halves, so those papers get empty results instead.
+        """
+        if self._quota_exhausted():
+            return [self._empty_paper_result() for _ in papers]
+        if len(papers) == 1:
+            return [await self.extract_from_paper(*papers[0], retry_count=retry_count)]
         
-        prompt = f"""Analyze this ML/AI research paper and extract ONLY marketable, learnable skills.
-
-    Title: {title}
-    Abstract: {abstract}
-
-    Focus on skills that:
-    - Can be learned by ML engineers/researchers
-    - Are relevant to job market
-    - Are transferable across projects
-    - Represent real tools, frameworks, or techniques
-
-    Extract and return ONLY a JSON object:
-
-    {{
-    "core_frameworks": ["PyTorch", "TensorFlow", "JAX"],
-    "ml_techniques": ["Transformer architecture", "Reinforcement Learning", "Fine-tuning"],
-    "application_areas": ["Computer Vision", "NLP", "Time Series"],
-    "programming_skills": ["Python", "CUDA", "Distributed Training"],
-    "emerging_trends": ["Mixture of Experts", "Diffusion Models"]
-    }}
-
-    Rules:
-    - Use STANDARD names (e.g., "PyTorch" not "PyTorch 2.0")
-    - Focus on GENERAL techniques (e.g., "Knowledge Distillation" not "GRACE score")
-    - Include WIDELY-USED tools only
-    - Skip paper-specific datasets/models unless they're industry-standard
-    - Emerging trends = techniques gaining traction but not yet mainstream
-
-    Return ONLY valid JSON. No explanations.
-    """
+        try:
+            extracted = await self._request_paper_batch(papers, retry_count)
+        except BatchShapeError as e:
+            log.warning(f"{str(e)}, splitting the batch")
+            half = len(papers) // 2
+            first, second = await asyncio.gather(
+                self._extract_uncached_papers(papers[:half], retry_count),
+                self._extract_uncached_papers(papers[half:], retry_count)
+            )
+            return first + second
+        
+        if extracted is None:
+            return [self._empty_paper_result() for _ in papers]
+        return extracted
+    
+    async def _request_paper_batch(self, papers: List[Tuple[str, str]], retry_count: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        One LLM request for several papers
         
-        for attempt in range(retry_count):
-            try:
-                response = self.model.generate_content(prompt)
-                result_text = self._clean_json_response(response.text)
-                
-                try:
-                    extracted = json.loads(result_text)
-                    
-                    if not isinstance(extracted, dict):
-                        raise ValueError("Response is not a dictionary")
-                    
-                    # Ensure all expected keys exist
-                    expected_keys = ['core_frameworks', 'ml_techniques', 'application_areas', 
-                                'programming_skills', 'emerging_trends']
-                    for key in expected_keys:
-                        if key not in extracted:
-                            extracted[key] = []
-                    
-                    # Normalize skill names (standardize capitalization)
-                    for key in extracted:
-                        if isinstance(extracted[key], list):
-                            extracted[key] = [str(item).strip() for item in extracted[key] if item]
-                    
-                    log.debug(f"LLM extraction successful for paper: {title[:50]}...")
-                    return extracted
-                    
-                except (json.JSONDecodeError, ValueError) as je:
-                    log.warning(f"JSON parsing attempt {attempt + 1} failed")
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(2)
-                        continue
-                    return self._empty_paper_result()
-                    
-            except Exception as e:
-                error_str = str(e)
-                if "429" in error_str or "quota" in error_str.lower():
-                    if attempt < retry_count - 1:
-                        wait_time = 60
-                        log.warning(f"Rate limit hit, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    return self._empty_paper_result()
-                else:
-                    log.error(f"LLM extraction failed: {error_str}")
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(2)
-                        continue
-                    return self._empty_paper_result()
+        Returns:
+            Normalized results in paper order, or None if the request failed
         
-        return self._empty_paper_result()
-
-    def _empty_paper_result(self) -> Dict[str, Any]:
-        """Return empty result structure for papers"""
-        return {
-            "core_frameworks": [],
-            "ml_techniques": [],
-            "application_areas": [],
-            "programming_skills": [],
-            "emerging_trends": []
-        }
+        Raises:
+            BatchShapeError: If the response doesn't hold one object per paper
+        """
+        entries = "\n\n---\n\n".join(
+            PAPER_BATCH_ENTRY.format(number=number, title=title, abstract=abstract)
+            for number, (title, abstract) in enumerate(papers, 1)
+        )
+        prompt = PAPER_BATCH_PROMPT.format(count=len(papers), papers=entries)
+        
+        extracted = await self._call_with_retry(
+            prompt,
+            lambda text: self._parse_paper_batch(text, len(papers)),
+            f"batch of {len(papers)} papers",
+            retry_count,
+            passthrough=(BatchShapeError,)
+        )
+        if extracted is None:
+            return None
+        
+        for (title, abstract), result in zip(papers, extracted):
+            _, cache_key, body, group = self._cache_identity("paper", title=title, abstract=abstract)
+            await llm_cache.put(cache_key, result, similar_to=body, group=group)
+        
+        log.debug(f"LLM extraction successful for {len(papers)} papers in one request")
+        return extracted
     
+    def _parse_paper_batch(self, text: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Split a batched response into normalized per-paper results
+        
+        Raises:
+            BatchShapeError: If the response doesn't hold one object per paper
+        """
+        extracted = orjson.loads(self._clean_json_response(text, brackets='[]'))
+        if not isinstance(extracted, list) or len(extracted) != count \
+                or not all(isinstance(result, dict) for result in extracted):
+            raise BatchShapeError(f"Batched response does not hold {count} paper results")
+        return [self._parse_result("paper", result) for result in extracted]
+    
+    @_single_flight
     async def extract_from_repo(self, name: str, description: str, topics: List[str] = None, retry_count: int = 3) -> Dict[str, Any]:
         """
         Extract detailed skills from GitHub repository
@@ -208,62 +688,13 @@ class SkillExtractor:
         Returns:
             Dictionary with structured skill information
         """
-        if not self.model:
-            log.debug("LLM not available, returning empty result")
-            return self._empty_repo_result()
-        
-        # Rate limiting delay
-        await asyncio.sleep(self.request_delay)
-        
         topics_str = ', '.join(topics) if topics else 'None'
-        
-        prompt = f"""Analyze this GitHub repository and extract detailed information.
-
-Repository Name: {name}
-Description: {description}
-Topics: {topics_str}
-
-Extract and return a JSON object with these fields:
-1. "tech_stack": Technologies and languages (e.g., ["Python 3.11", "FastAPI", "PostgreSQL"])
-2. "ml_frameworks": ML frameworks (e.g., ["PyTorch", "TensorFlow", "scikit-learn"])
-3. "tools": Development tools (e.g., ["Docker", "Kubernetes", "MLflow"])
-4. "use_cases": What the project does (e.g., ["text generation", "image classification"])
-5. "target_audience": Who would use this (e.g., ["ML researchers", "data scientists"])
-6. "key_features": Notable features (max 3 items)
-
-Return ONLY valid JSON with arrays for each field. If nothing found, use empty array [].
-"""
-        
-        for attempt in range(retry_count):
-            try:
-                response = self.model.generate_content(prompt)
-                result_text = self._clean_json_response(response.text)
-                extracted = json.loads(result_text)
-                
-                log.debug(f"LLM extraction successful for repo: {name}")
-                return extracted
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                if "429" in error_str or "quota" in error_str.lower() or "rate limit" in error_str.lower():
-                    if attempt < retry_count - 1:
-                        wait_time = 60
-                        log.warning(f"Rate limit hit for repo '{name}', waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        log.error(f"Rate limit exceeded for repo: {name}")
-                        return self._empty_repo_result()
-                else:
-                    log.error(f"LLM extraction failed for repo '{name}': {error_str}")
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(2)
-                        continue
-                    return self._empty_repo_result()
-        
-        return self._empty_repo_result()
+        return await self._extract(
+            "repo", f"repo '{name}'", retry_count,
+            name=name, description=description, topics_str=topics_str
+        )
     
+    @_single_flight
     async def extract_from_discussion(self, title: str, content: str, source: str = "reddit", retry_count: int = 3) -> Dict[str, Any]:
         """
         Extract skills from online discussions (Reddit, forums, etc.)
@@ -277,59 +708,12 @@ Return ONLY valid JSON with arrays for each field. If nothing found, use empty a
         Returns:
             Dictionary with structured skill information
         """
-        if not self.model:
-            log.debug("LLM not available, returning empty result")
-            return self._empty_discussion_result()
-        
-        # Rate limiting delay
-        await asyncio.sleep(self.request_delay)
-        
-        prompt = f"""Analyze this {source} discussion about ML/AI and extract information.
-
-Title: {title}
-
-Content: {content[:1000]}
-
-Extract and return a JSON object with these fields:
-1. "mentioned_tools": Tools/frameworks people are discussing (e.g., ["LangChain", "Ollama"])
-2. "problems_discussed": Problems or challenges mentioned (e.g., ["GPU memory issues", "fine-tuning cost"])
-3. "solutions_suggested": Solutions or approaches suggested (e.g., ["use quantization", "try LoRA"])
-4. "trending_topics": Hot topics in this discussion (e.g., ["local LLMs", "open source models"])
-5. "sentiment": Overall sentiment ("positive", "negative", "neutral", "mixed")
-
-Return ONLY valid JSON with arrays for each field. If nothing found, use empty array [].
-"""
-        
-        for attempt in range(retry_count):
-            try:
-                response = self.model.generate_content(prompt)
-                result_text = self._clean_json_response(response.text)
-                extracted = json.loads(result_text)
-                
-                log.debug(f"LLM extraction successful for discussion: {title[:50]}...")
-                return extracted
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                if "429" in error_str or "quota" in error_str.lower() or "rate limit" in error_str.lower():
-                    if attempt < retry_count - 1:
-                        wait_time = 60
-                        log.warning(f"Rate limit hit for discussion, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        log.error(f"Rate limit exceeded for discussion: {title[:50]}...")
-                        return self._empty_discussion_result()
-                else:
-                    log.error(f"LLM extraction failed for discussion: {error_str}")
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(2)
-                        continue
-                    return self._empty_discussion_result()
-        
-        return self._empty_discussion_result()
+        return await self._extract(
+            "discussion", f"discussion: {title[:50]}...", retry_count,
+            source=source, title=title, content=content[:DISCUSSION_CONTENT_LIMIT]
+        )
     
+    @_single_flight
     async def extract_from_job_post(self, title: str, description: str, company: str = "", retry_count: int = 3) -> Dict[str, Any]:
         """
         Extract skills from job postings (LinkedIn, Indeed, etc.)
@@ -343,71 +727,20 @@ Return ONLY valid JSON with arrays for each field. If nothing found, use empty a
         Returns:
             Dictionary with structured skill information
         """
-        if not self.model:
-            log.debug("LLM not available, returning empty result")
-            return self._empty_job_result()
-        
-        # Rate limiting delay
-        await asyncio.sleep(self.request_delay)
-        
-        prompt = f"""Analyze this ML/AI job posting and extract detailed requirements.
-
-Job Title: {title}
-Company: {company}
-Description: {description[:1500]}
-
-Extract and return a JSON object with these fields:
-1. "required_skills": Must-have skills (e.g., ["Python", "PyTorch", "5+ years ML experience"])
-2. "preferred_skills": Nice-to-have skills (e.g., ["AWS", "MLflow", "PhD"])
-3. "tools": Specific tools mentioned (e.g., ["Docker", "Kubernetes", "Git"])
-4. "role_type": Type of role (e.g., "ML Engineer", "Research Scientist", "Data Scientist")
-5. "seniority": Level (e.g., "Senior", "Mid-level", "Junior", "Lead")
-6. "focus_areas": Main focus (e.g., ["NLP", "Computer Vision", "MLOps"])
-
-Return ONLY valid JSON with arrays for each field. If nothing found, use empty array [].
-"""
-        
-        for attempt in range(retry_count):
-            try:
-                response = self.model.generate_content(prompt)
-                result_text = self._clean_json_response(response.text)
-                extracted = json.loads(result_text)
-                
-                log.debug(f"LLM extraction successful for job: {title}")
-                return extracted
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                if "429" in error_str or "quota" in error_str.lower() or "rate limit" in error_str.lower():
-                    if attempt < retry_count - 1:
-                        wait_time = 60
-                        log.warning(f"Rate limit hit for job post, waiting {wait_time}s")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    else:
-                        log.error(f"Rate limit exceeded for job: {title}")
-                        return self._empty_job_result()
-                else:
-                    log.error(f"LLM extraction failed for job: {error_str}")
-                    if attempt < retry_count - 1:
-                        await asyncio.sleep(2)
-                        continue
-                    return self._empty_job_result()
-        
-        return self._empty_job_result()
+        return await self._extract(
+            "job", f"job: {title}", retry_count,
+            title=title, company=company, description=description[:JOB_DESCRIPTION_LIMIT]
+        )
     
     # Fallback empty results - used when LLM is unavailable or fails
     def _empty_paper_result(self) -> Dict[str, Any]:
         """Return empty result structure for papers"""
         return {
-            "frameworks": [],
-            "models": [],
-            "techniques": [],
-            "domains": [],
-            "datasets": [],
-            "metrics": [],
-            "key_innovations": []
+            "core_frameworks": [],
+            "ml_techniques": [],
+            "application_areas": [],
+            "programming_skills": [],
+            "emerging_trends": []
         }
     
     def _empty_repo_result(self) -> Dict[str, Any]:
@@ -442,11 +775,22 @@ Return ONLY valid JSON with arrays for each field. If nothing found, use empty a
             "focus_areas": []
         }
     
+    # Prompt, schema and fallback for each source type, driving _extract
+    _SOURCES: Dict[str, "SourceSpec"] = {
+        "paper": SourceSpec(PAPER_PROMPT, PaperSkills, ("title",), "abstract", _empty_paper_result, normalize_names=True),
+        "repo": SourceSpec(REPO_PROMPT, RepoSkills, ("name",), "description", _empty_repo_result),
+        "discussion": SourceSpec(DISCUSSION_PROMPT, DiscussionSkills, ("title",), "content", _empty_discussion_result),
+        "job": SourceSpec(JOB_PROMPT, JobSkills, ("title", "company"), "description", _empty_job_result)
+    }
+    
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_skill_name(skill: str) -> str:
         """
         Normalize skill names to avoid duplicates
         
+        Memoized since the same few hundred skill strings recur constantly.
+        
         Args:
             skill: Raw skill name
             
@@ -457,79 +801,61 @@ Return ONLY valid JSON with arrays for each field. If nothing found, use empty a
             return ""
         
         skill = skill.strip()
-        
-        # Standardization map - maps variations to canonical names
-        standardization_map = {
-            # NLP variations
-            "natural language processing": "NLP",
-            "natural language processing (nlp)": "NLP",
-            "nlp": "NLP",
-            
-            # LLM variations
-            "large language models": "Large Language Models",
-            "large language models (llms)": "Large Language Models",
-            "llms": "Large Language Models",
-            
-            # Computer Vision
-            "computer vision": "Computer Vision",
-            "cv": "Computer Vision",
-            
-            # Reinforcement Learning
-            "reinforcement learning": "Reinforcement Learning",
-            "rl": "Reinforcement Learning",
-            
-            # Machine Learning
-            "machine learning": "Machine Learning",
-            "ml": "Machine Learning",
-            
-            # Deep Learning
-            "deep learning": "Deep Learning",
-            "dl": "Deep Learning",
-            
-            # Architecture names
-            "transformer architecture": "Transformer Architecture",
-            "transformers": "Transformer Architecture",
-            
-            # Remove generic suffixes
-            " models": "",
-            " (nlp)": "",
-            " (llms)": "",
-            " (cv)": "",
-            " (rl)": "",
-            " (ml)": "",
-        }
-        
         skill_lower = skill.lower()
         
         # Check for direct matches first
-        if skill_lower in standardization_map:
-            result = standardization_map[skill_lower]
-            return result if result else skill
+        if skill_lower in SKILL_STANDARDIZATION:
+            return SKILL_STANDARDIZATION[skill_lower]
         
-        # Remove suffixes
-        for suffix, replacement in standardization_map.items():
-            if suffix.startswith(" ") and skill_lower.endswith(suffix):
-                return skill[:len(skill)-len(suffix)].strip()
+        # Remove generic suffixes
+        match = SKILL_SUFFIX_RE.search(skill)
+        if match:
+            return skill[:match.start()].strip()
         
         # Title case for consistency
         return skill.title()
     
-    async def batch_process(self, items: List[Dict], item_type: str) -> List[Dict]:
+    @staticmethod
+    def normalize_skill_list(skills: List[Any]) -> List[str]:
+        """
+        Normalize a list of skill names, dropping blanks and merged duplicates
+        
+        Args:
+            skills: Raw skill names
+            
+        Returns:
+            Normalized names in their original order
+        """
+        normalized = (SkillExtractor.normalize_skill_name(str(skill)) for skill in skills if skill)
+        return list(dict.fromkeys(skill for skill in normalized if skill))
+    
+    async def batch_process(self, items: List[Dict], item_type: str, max_concurrency: Optional[int] = None) -> AsyncIterator[Dict]:
         """
         Batch process multiple items with rate limiting and progress tracking
         
+        Items are extracted concurrently; the rate limiter still spaces
+        request starts, so requests overlap instead of waiting on each other.
+        Each item is yielded as soon as its extraction finishes, so callers
+        can persist results while the rest are still in flight. Once the
+        daily quota runs out, extractions still pending are cancelled and
+        their items yielded with empty skills.
+        
         Args:
             items: List of items to process
             item_type: Type of items ("paper", "repo", "discussion", "job")
+            max_concurrency: Requests in flight at once (default LLM_CONCURRENCY)
             
-        Returns:
-            Items with added detailed_skills field
+        Yields:
+            Items with added detailed_skills field, in completion order
         """
         if not items:
-            return []
+            return
         
         total = len(items)
-        estimated_time = total * self.request_delay if self.model else 0
+        papers_per_request = settings.LLM_PAPER_BATCH_SIZE if item_type == "paper" else 1
+        estimated_time = -(-total // max(papers_per_request, 1)) * self.request_delay if self.model else 0
+        
+        skipped_before = self.stats["skipped_empty"]
         
         log.info(f"Starting batch LLM extraction for {total} {item_type}s")
         if self.model:
@@ -537,49 +863,129 @@ Return ONLY valid JSON with arrays for each field. If nothing found, use empty a
         else:
             log.warning("LLM not available - skipping detailed extraction")
         
-        enriched_items = []
+        # Item type -> coroutine extracting that item's skills
+        extractors = {
+            "paper": lambda item: self.extract_from_paper(
+                item.get('title', ''),
+                item.get('abstract', '')
+            ),
+            "repo": lambda item: self.extract_from_repo(
+                item.get('name', ''),
+                item.get('description', ''),
+                item.get('topics', [])
+            ),
+            "discussion": lambda item: self.extract_from_discussion(
+                item.get('title', ''),
+                item.get('content', ''),
+                item.get('source', 'reddit')
+            ),
+            "job": lambda item: self.extract_from_job_post(
+                item.get('title', ''),
+                item.get('description', ''),
+                item.get('company', '')
+            ),
+        }
+        extract = extractors.get(item_type)
+        if extract is None:
+            log.warning(f"Unknown item type: {item_type}")
+        
+        semaphore = asyncio.Semaphore(max_concurrency or settings.LLM_CONCURRENCY)
         
-        for i, item in enumerate(items, 1):
+        async def process(i: int, item: Dict) -> List[Dict]:
             try:
-                # Progress logging every 10 items
-                if i % 10 == 0 or i == 1:
-                    log.info(f"Processing item {i}/{total} ({i*100//total}%)")
-                
-                # Extract based on type
-                if item_type == "paper":
-                    detailed = await self.extract_from_paper(
-                        item.get('title', ''),
-                        item.get('abstract', '')
-                    )
-                elif item_type == "repo":
-                    detailed = await self.extract_from_repo(
-                        item.get('name', ''),
-                        item.get('description', ''),
-                        item.get('topics', [])
-                    )
-                elif item_type == "discussion":
-                    detailed = await self.extract_from_discussion(
-                        item.get('title', ''),
-                        item.get('content', ''),
-                        item.get('source', 'reddit')
-                    )
-                elif item_type == "job":
-                    detailed = await self.extract_from_job_post(
-                        item.get('title', ''),
-                        item.get('description', ''),
-                        item.get('company', '')
-                    )
-                else:
-                    log.warning(f"Unknown item type: {item_type}")
+                if extract is None:
                     detailed = {}
-                
-                item['detailed_skills'] = detailed
-                enriched_items.append(item)
-                
+                else:
+                    async with semaphore:
+                        detailed = await extract(item)
             except Exception as e:
                 log.error(f"Error processing item {i}: {str(e)}")
-                item['detailed_skills'] = {}
-                enriched_items.append(item)
+                detailed = {}
+            
+            item['detailed_skills'] = detailed
+            return [item]
+        
+        # Each task finishes one item, or one chunk of papers sharing a request
+        if self.model and papers_per_request > 1:
+            chunks = [items[i:i + papers_per_request] for i in range(0, total, papers_per_request)]
+            pending = {asyncio.create_task(self._process_paper_chunk(chunk, semaphore)): chunk for chunk in chunks}
+        else:
+            pending = {asyncio.create_task(process(i, item)): [item] for i, item in enumerate(items, 1)}
+        
+        progress = tqdm(total=total, desc=f"LLM:{item_type}", unit="item") if settings.PROGRESS_BAR else None
+        completed = 0
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                # Every remaining request would fail; don't wait for them to find out
+                if self.model and self._quota_exhausted():
+                    for task in pending:
+                        task.cancel()
+                
+                for task in done:
+                    chunk = pending.pop(task)
+                    if task.cancelled():
+                        for item in chunk:
+                            item['detailed_skills'] = {}
+                    
+                    for item in chunk:
+                        # Progress bar when enabled, otherwise logging every 10 items
+                        completed += 1
+                        if progress is not None:
+                            progress.update()
+                        elif completed % 10 == 0 or completed == 1:
+                            log.info(f"Processed item {completed}/{total} ({completed*100//total}%)")
+                        
+                        yield item
+        finally:
+            # Stop outstanding extractions if the consumer goes away early
+            for task in pending:
+                task.cancel()
+            if progress is not None:
+                progress.close()
+        
+        log.info(f"Completed batch extraction for {completed} items")
+        skipped = self.stats["skipped_empty"] - skipped_before
+        if skipped:
+            log.info(f"Skipped LLM extraction for {skipped} items with too little text")
+    
+    async def collect_batch(self, items: List[Dict], item_type: str, max_concurrency: Optional[int] = None) -> List[Dict]:
+        """
+        Run batch_process to completion for callers that want the whole list
+        
+        Args:
+            items: List of items to process
+            item_type: Type of items ("paper", "repo", "discussion", "job")
+            max_concurrency: Requests in flight at once (default LLM_CONCURRENCY)
+            
+        Returns:
+            Items with added detailed_skills field, in input order
+        """
+        async for _ in self.batch_process(items, item_type, max_concurrency):
+            pass
+        return items
+    
+    async def _process_paper_chunk(self, chunk: List[Dict], semaphore: asyncio.Semaphore) -> List[Dict]:
+        """
+        Paper branch of batch_process: extract a chunk of papers with one LLM request
+        
+        Args:
+            chunk: Papers packed into the request
+            semaphore: Limits requests in flight
+            
+        Returns:
+            The chunk's items with added detailed_skills field
+        """
+        try:
+            async with semaphore:
+                results = await self.extract_from_papers_batch(
+                    [(item.get('title', ''), item.get('abstract', '')) for item in chunk]
+                )
+        except Exception as e:
+            log.error(f"Error processing paper batch: {str(e)}")
+            results = [{} for _ in chunk]
         
-        log.info(f"Completed batch extraction for {len(enriched_items)} items")
-        return enriched_items
\ No newline at end of file
+        for item, detailed in zip(chunk, results):
+            item['detailed_skills'] = detailed
+        return chunk
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Normalized skill index for papers and repositories
+Keeps paper_skills / repo_skills in sync with the JSON skill columns
+"""
+
+from typing import Any, Dict, Iterable, List
+from datetime import datetime, timezone
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import bulk_insert
+from app.models.models import PaperSkill, RepoSkill
+
+# Category used for keyword-matched extracted_skills
+BASIC_CATEGORY = "basic"
+
+
+def has_detailed_skills(detailed_skills: Dict[str, Any]) -> bool:
+    """
+    Check whether any detailed skill category is non-empty
+    
+    Args:
+        detailed_skills: LLM-extracted skills keyed by category (may be None)
+    
+    Returns:
+        True if at least one category has values
+    """
+    return bool(detailed_skills) and any(detailed_skills.values())
+
+
+def skill_rows(extracted_skills: List[str], detailed_skills: Dict[str, Any]) -> List[Dict[str, str]]:
+    """
+    Flatten basic and detailed skills into (category, skill) rows
+    
+    Args:
+        extracted_skills: Keyword-matched skills
+        detailed_skills: LLM-extracted skills keyed by category
+    
+    Returns:
+        Unique rows with 'category' and 'skill' keys
+    """
+    pairs = {(BASIC_CATEGORY, skill) for skill in extracted_skills or [] if skill}
+    
+    for category, values in (detailed_skills or {}).items():
+        if isinstance(values, list):
+            pairs.update((category, str(value).strip()) for value in values if value and str(value).strip())
+    
+    return [{"category": category, "skill": skill} for category, skill in pairs]
+
+
+async def replace_paper_skills(db: AsyncSession, papers: Iterable[Dict[str, Any]]) -> None:
+    """
+    Rewrite the skill index rows for the given papers
+    
+    Args:
+        db: Database session (caller commits)
+        papers: Dicts with id, published_date, extracted_skills and detailed_skills
+    """
+    papers = list(papers)
+    if not papers:
+        return
+    
+    await db.execute(delete(PaperSkill).where(PaperSkill.paper_id.in_([p['id'] for p in papers])))
+    
+    rows = [
+        {**row, "paper_id": paper['id'], "published_date": as_datetime(paper['published_date'])}
+        for paper in papers
+        for row in skill_rows(paper['extracted_skills'], paper['detailed_skills'])
+    ]
+    # A concurrent rewrite of the same paper may have inserted rows since the delete
+    await bulk_insert(db, PaperSkill.__table__, rows)
+
+
+async def replace_repo_skills(db: AsyncSession, repos: Iterable[Dict[str, Any]]) -> None:
+    """
+    Rewrite the skill index rows for the given repositories
+    
+    Args:
+        db: Database session (caller commits)
+        repos: Dicts with id, created_at, extracted_skills and detailed_skills
+    """
+    repos = list(repos)
+    if not repos:
+        return
+    
+    await db.execute(delete(RepoSkill).where(RepoSkill.repo_id.in_([r['id'] for r in repos])))
+    
+    rows = [
+        {**row, "repo_id": repo['id'], "created_at": as_datetime(repo['created_at'])}
+        for repo in repos
+        for row in skill_rows(repo['extracted_skills'], repo['detailed_skills'])
+    ]
+    # A concurrent rewrite of the same repo may have inserted rows since the delete
+    await bulk_insert(db, RepoSkill.__table__, rows)
+
+
+def as_datetime(value: Any) -> datetime:
+    """
+    Accept either a datetime or an ISO-8601 string from scraper output
+    
+    Returns:
+        Naive UTC datetime, as stored in the DateTime columns (asyncpg
+        rejects aware values bound to them)
+    """
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
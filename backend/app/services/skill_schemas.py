@@ -0,0 +1,78 @@
+"""
+Schemas for LLM skill extraction results
+Coerce model output into the stored shape for each source type
+"""
+
+from typing import Annotated, Any, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
+from pydantic_core import PydanticUseDefault
+
+
+def _as_str_list(value: Any) -> List[str]:
+    """Accept a list, a single value or null, keeping non-blank strings"""
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [text for text in (str(item).strip() for item in value if item is not None) if text]
+
+
+def _as_label(value: Any) -> str:
+    """Accept a string or a list of strings; fall back to the field default when empty"""
+    if isinstance(value, list):
+        value = ", ".join(_as_str_list(value))
+    if value is None or not str(value).strip():
+        raise PydanticUseDefault()
+    return str(value).strip()
+
+
+# List of names from the LLM, tolerant of nulls and single values
+SkillList = Annotated[List[str], BeforeValidator(_as_str_list)]
+
+# Single label from the LLM, e.g. a sentiment or seniority
+Label = Annotated[str, BeforeValidator(_as_label)]
+
+
+class ExtractionResult(BaseModel):
+    """
+    Base for extraction results; keys outside the schema are dropped
+    """
+    model_config = ConfigDict(extra="ignore")
+
+
+class PaperSkills(ExtractionResult):
+    """Skills extracted from a research paper"""
+    core_frameworks: SkillList = Field(default_factory=list)
+    ml_techniques: SkillList = Field(default_factory=list)
+    application_areas: SkillList = Field(default_factory=list)
+    programming_skills: SkillList = Field(default_factory=list)
+    emerging_trends: SkillList = Field(default_factory=list)
+
+
+class RepoSkills(ExtractionResult):
+    """Skills and metadata extracted from a GitHub repository"""
+    tech_stack: SkillList = Field(default_factory=list)
+    ml_frameworks: SkillList = Field(default_factory=list)
+    tools: SkillList = Field(default_factory=list)
+    use_cases: SkillList = Field(default_factory=list)
+    target_audience: SkillList = Field(default_factory=list)
+    key_features: SkillList = Field(default_factory=list)
+
+
+class DiscussionSkills(ExtractionResult):
+    """Tools and topics extracted from a discussion"""
+    mentioned_tools: SkillList = Field(default_factory=list)
+    problems_discussed: SkillList = Field(default_factory=list)
+    solutions_suggested: SkillList = Field(default_factory=list)
+    trending_topics: SkillList = Field(default_factory=list)
+    sentiment: Label = "neutral"
+
+
+class JobSkills(ExtractionResult):
+    """Requirements extracted from a job posting"""
+    required_skills: SkillList = Field(default_factory=list)
+    preferred_skills: SkillList = Field(default_factory=list)
+    tools: SkillList = Field(default_factory=list)
+    role_type: Label = "Unknown"
+    seniority: Label = "Unknown"
+    focus_areas: SkillList = Field(default_factory=list)
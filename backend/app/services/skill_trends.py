@@ -0,0 +1,89 @@
+"""
+Daily skill trend rollup
+Rebuilds skill_trend_daily from the normalized skill tables
+"""
+
+from typing import Iterable, Optional
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import Date, delete, func, literal, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import AsyncSessionLocal, dialect_insert
+from app.core.logging import log
+from app.models.models import PaperSkill, RepoSkill, SkillTrendDaily
+
+# Rollup source name -> (skill table, date column the day is taken from)
+ROLLUP_SOURCES = {
+    "papers": (PaperSkill, PaperSkill.published_date),
+    "github": (RepoSkill, RepoSkill.created_at),
+}
+
+
+async def refresh_skill_trends(
+    db: AsyncSession,
+    days: Optional[Iterable[date]] = None,
+    source: Optional[str] = None
+) -> None:
+    """
+    Recompute the daily rollup, either fully or for the given days only
+    
+    Recomputing whole days keeps the rollup exact when skills of existing
+    papers or repos are rewritten, which an additive upsert would not.
+    Rows are written with an upsert, so two refreshes of the same day
+    (concurrent ingests, or ingest during the nightly rebuild) don't fail
+    on the primary key; the later one's counts win.
+    
+    Args:
+        db: Database session (caller commits)
+        days: Days to rebuild; rebuilds everything when omitted
+        source: Only rebuild this source ('papers' or 'github'); all when omitted
+    """
+    days = sorted(set(days)) if days is not None else None
+    if days == []:
+        return
+    
+    sources = [source] if source else list(ROLLUP_SOURCES)
+    
+    for source in sources:
+        table, date_column = ROLLUP_SOURCES[source]
+        day = func.date(date_column, type_=Date)
+        
+        # WHERE keeps SQLite from reading ON CONFLICT as part of a join
+        counts = select(
+            day, literal(source), table.category, table.skill, func.count()
+        ).where(true()).group_by(day, table.category, table.skill)
+        stale = delete(SkillTrendDaily).where(SkillTrendDaily.source == source)
+        
+        if days is not None:
+            # Range on the raw column so the skill index can be used, then exact days
+            counts = counts.where(
+                date_column >= datetime.combine(days[0], time.min),
+                date_column < datetime.combine(days[-1] + timedelta(days=1), time.min),
+                day.in_(days)
+            )
+            stale = stale.where(SkillTrendDaily.day.in_(days))
+        
+        upsert = dialect_insert(db, SkillTrendDaily.__table__).from_select(
+            ["day", "source", "category", "skill", "mentions"], counts
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["day", "source", "category", "skill"],
+            set_={"mentions": upsert.excluded.mentions}
+        )
+        
+        await db.execute(stale)
+        await db.execute(upsert)
+    
+    log.debug(f"Refreshed skill trend rollup for {len(days) if days is not None else 'all'} days")
+
+
+async def refresh_all_skill_trends() -> None:
+    """
+    Scheduled job: rebuild the whole rollup with its own session
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            await refresh_skill_trends(db)
+            await db.commit()
+        log.info("Skill trend rollup rebuilt")
+    except Exception as e:
+        log.exception(f"Error rebuilding skill trend rollup: {str(e)}")
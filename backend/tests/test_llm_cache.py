@@ -0,0 +1,89 @@
+"""Near-duplicate lookups in the LLM extraction cache"""
+import asyncio
+
+import pytest
+
+import app.core.cache as cache
+from app.services import llm_cache
+
+
+ABSTRACT = (
+    "We introduce a retrieval augmented transformer that conditions generation on passages "
+    "fetched from a large corpus. The retriever and generator are trained jointly, and the "
+    "model outperforms larger dense baselines on open domain question answering benchmarks "
+    "while using fewer parameters and less compute during inference."
+)
+
+UNRELATED = (
+    "This repository provides a lightweight scheduler for running cron style jobs inside "
+    "asynchronous Python services. Jobs are declared with decorators, persisted in Postgres, "
+    "and retried with exponential backoff when a worker crashes or the database is unreachable."
+)
+
+BOILERPLATE = (
+    "Acme Robotics builds autonomous warehouse systems used by retailers around the world. "
+    "We offer competitive salaries, equity, flexible remote work, generous parental leave, "
+    "a learning budget and a diverse, inclusive team that values curiosity and ownership. "
+)
+
+
+@pytest.fixture(autouse=True)
+def memory_only_cache(monkeypatch):
+    """Run against the in-process cache with empty indexes"""
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    llm_cache._memory.clear()
+    llm_cache._fingerprints.clear()
+    llm_cache._bands.clear()
+
+
+def lookup(source_type: str, stored: str, query: str, group: str = "title") -> object:
+    """Store a result for one text, then look it up under another text's key"""
+    async def run():
+        await llm_cache.put(llm_cache.cache_key("m", source_type, stored), {"skills": ["rag"]},
+                            similar_to=stored, group=group)
+        return await llm_cache.get(llm_cache.cache_key("m", source_type, query), similar_to=query, group=group)
+    
+    return asyncio.run(run())
+
+
+def test_dropped_word_in_short_text_hits():
+    text = (
+        "A fast tokenizer library written in Rust with Python bindings that supports byte pair "
+        "encoding, wordpiece and unigram models for training new vocabularies"
+    )
+    assert lookup("repo", text, text.replace(" fast", "", 1)) == {"skills": ["rag"]}
+
+
+def test_light_edit_of_abstract_hits():
+    edited = ABSTRACT.replace("We introduce", "We present").replace(", and", "; ")
+    assert lookup("paper", ABSTRACT, edited) == {"skills": ["rag"]}
+
+
+def test_casing_and_punctuation_hit():
+    assert lookup("paper", ABSTRACT, ABSTRACT.upper().replace(",", ";")) == {"skills": ["rag"]}
+
+
+def test_unrelated_text_misses():
+    assert lookup("paper", ABSTRACT, UNRELATED) is None
+
+
+def test_shared_boilerplate_misses():
+    first = BOILERPLATE + "You will train perception models with PyTorch and deploy them on edge GPUs."
+    second = BOILERPLATE + "You will own our billing service, written in Go on Kubernetes and Kafka."
+    assert lookup("job", first, second) is None
+
+
+def test_different_group_misses():
+    async def run():
+        await llm_cache.put(llm_cache.cache_key("m", "paper", "a"), {"skills": []}, similar_to=ABSTRACT, group="One")
+        return await llm_cache.get(llm_cache.cache_key("m", "paper", "b"), similar_to=ABSTRACT, group="Two")
+    
+    assert asyncio.run(run()) is None
+
+
+def test_other_source_type_misses():
+    async def run():
+        await llm_cache.put(llm_cache.cache_key("m", "paper", "a"), {"skills": []}, similar_to=ABSTRACT)
+        return await llm_cache.get(llm_cache.cache_key("m", "repo", "b"), similar_to=ABSTRACT)
+    
+    assert asyncio.run(run()) is None
@@ -0,0 +1,79 @@
+"""Fallback results of the skill extractor"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.api_core.exceptions import ResourceExhausted
+
+import app.core.cache as cache
+from app.services import llm_cache
+import app.services.skill_extractor as skill_extractor
+from app.services.skill_extractor import PaperSkills, SkillExtractor
+
+
+PAPER_KEYS = {"core_frameworks", "ml_techniques", "application_areas", "programming_skills", "emerging_trends"}
+
+
+def test_empty_paper_result_matches_prompt_schema():
+    result = SkillExtractor()._empty_paper_result()
+    
+    assert set(result.keys()) == PAPER_KEYS
+    assert set(PaperSkills.model_fields) == PAPER_KEYS
+    assert all(value == [] for value in result.values())
+
+
+def test_paper_without_model_returns_empty_result():
+    extractor = SkillExtractor()
+    extractor.model = None
+    
+    result = asyncio.run(extractor.extract_from_paper("Attention is all you need", "We propose the Transformer."))
+    
+    assert result == extractor._empty_paper_result()
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Point a SkillExtractor at a model that answers with the given responses or errors, without waiting"""
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    monkeypatch.setattr(SkillExtractor, "_backoff_delay", staticmethod(lambda attempt: 0))
+    monkeypatch.setattr(skill_extractor, "_quota_exhausted_until", {})
+    llm_cache._memory.clear()
+    llm_cache._fingerprints.clear()
+    llm_cache._bands.clear()
+    
+    def build(*replies):
+        calls = []
+        
+        async def generate_content_async(prompt):
+            reply = replies[min(len(calls), len(replies) - 1)]
+            calls.append(prompt)
+            if isinstance(reply, Exception):
+                raise reply
+            return SimpleNamespace(text=reply)
+        
+        extractor = SkillExtractor()
+        extractor.model = SimpleNamespace(generate_content_async=generate_content_async)
+        extractor.requests_per_minute = 1000
+        return extractor, calls
+    
+    return build
+
+
+def test_invalid_response_mentioning_daily_is_retried_not_a_quota_error(fake_model):
+    extractor, calls = fake_model('["Daily forecasting with transformers"]')
+    
+    result = asyncio.run(extractor.extract_from_paper("Daily forecasting with transformers", "We forecast demand " * 5))
+    
+    assert result == extractor._empty_paper_result()
+    assert len(calls) == 3
+    assert not extractor._quota_exhausted()
+
+
+def test_daily_quota_error_stops_requests(fake_model):
+    extractor, calls = fake_model(ResourceExhausted("Quota exceeded for quota metric 'Generate Content API requests per day'"))
+    
+    result = asyncio.run(extractor.extract_from_paper("Attention is all you need", "We propose the Transformer."))
+    
+    assert result == extractor._empty_paper_result()
+    assert len(calls) == 1
+    assert extractor._quota_exhausted()